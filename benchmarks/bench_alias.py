@@ -0,0 +1,48 @@
+"""
+Discrete sampling throughput: numpy's samplers versus alias tables.
+
+"native" is the default path (numpy Generator methods). "alias" enables
+rvpy.set_tabulated(), drawing from a Walker/Vose alias table built once
+per object; "build" is that one-off table construction.
+
+Run from the repository root:
+
+    python benchmarks/bench_alias.py [n]
+"""
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+CASES = [
+    ('Binomial', lambda: rvpy.Binomial(1000, 0.3)),
+    ('Poisson', lambda: rvpy.Poisson(40)),
+    ('NegativeBinomial', lambda: rvpy.NegativeBinomial(5, 0.3)),
+    ('Geometric', lambda: rvpy.Geometric(0.05)),
+    ('Hypergeometric', lambda: rvpy.Hypergeometric(500, 200, 100)),
+]
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(n=10**7):
+    print(f"n = {n}")
+    print(f"{'family':<17} {'native (ns)':>12} {'alias (ns)':>11} {'speedup':>8} {'build (ms)':>11}")
+    for name, make in CASES:
+        X = make()
+        native = timed(lambda: X.sample(n, rng=0)) / n
+        rvpy.set_tabulated(True)
+        build = timed(lambda: make().sample(1, rng=0), repeat=1)
+        alias = timed(lambda: X.sample(n, rng=0)) / n
+        rvpy.set_tabulated(False)
+        print(f"{name:<17} {native*1e9:>12.1f} {alias*1e9:>11.1f} {native/alias:>7.1f}x {build*1e3:>11.2f}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
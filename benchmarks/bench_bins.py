@@ -0,0 +1,59 @@
+"""
+Expected-count histograms: prob_interval() bin by bin versus bin_probabilities().
+
+Each case bins a batch of series (one distribution per series) over common
+edges. "loop" calls prob_interval on the whole batch once per bin, i.e. two
+cdf evaluations per bin; "bins" evaluates every edge once. The "scalar" rows
+bin the first 1000 series one by one, as separate scalar distributions.
+
+Run from the repository root:
+
+    python benchmarks/bench_bins.py [series] [bins]
+"""
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+def cases(series):
+    rng = np.random.default_rng(0)
+    return [
+        ('Normal', rvpy.Normal(rng.normal(size=series), rng.uniform(0.5, 2, series)), -6, 6),
+        ('Gamma', rvpy.Gamma(rng.uniform(1, 5, series), rng.uniform(0.5, 2, series)), 0, 20),
+        ('Poisson', rvpy.Poisson(rng.integers(1, 30, series)), 0, 60),
+        ('Binomial', rvpy.Binomial(rng.integers(10, 100, series), 0.3), 0, 100),
+    ]
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(series=50000, bins=20):
+    print(f"series = {series}, bins = {bins}")
+    print(f"{'family':<10} {'loop (ms)':>10} {'bins (ms)':>10} {'speedup':>8}")
+    for name, X, lo, hi in cases(series):
+        edges = np.linspace(lo, hi, bins + 1)
+        loop = timed(lambda: [X.prob_interval(a, b) for a, b in zip(edges[:-1], edges[1:])])
+        binned = timed(lambda: X.bin_probabilities(edges))
+        print(f"{name:<10} {loop*1e3:>10.1f} {binned*1e3:>10.1f} {loop/binned:>7.1f}x")
+
+    print()
+    print(f"{'scalar':<10} {'loop (ms)':>10} {'bins (ms)':>10} {'speedup':>8}")
+    for name, X, lo, hi in cases(1000):
+        edges = np.linspace(lo, hi, bins + 1)
+        series = [X[i] for i in range(1000)]
+        loop = timed(lambda: [[Y.prob_interval(a, b) for a, b in zip(edges[:-1], edges[1:])]
+                              for Y in series])
+        binned = timed(lambda: [Y.bin_probabilities(edges) for Y in series])
+        print(f"{name:<10} {loop*1e3:>10.1f} {binned*1e3:>10.1f} {loop/binned:>7.1f}x")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,46 @@
+"""
+Construction cost of distribution objects.
+
+"lazy" only builds the object, which is what arithmetic intermediates and
+throwaway objects pay today. "eager" also touches every moment, median, and
+entropy attribute, which is what every construction used to pay. The scipy
+backend is also built on first use, so "lazy" never pays for it, and neither
+does an arithmetic chain such as X + Y + Z.
+
+Run from the repository root:
+
+    python benchmarks/bench_construction.py
+"""
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+ATTRS = ('mean', 'var', 'std', 'skew', 'kurtosis', 'median', 'entropy')
+
+CASES = [
+    ('Normal', lambda: rvpy.Normal(1.5, 2.0)),
+    ('Gamma', lambda: rvpy.Gamma(2.5, 1.5)),
+    ('Binomial', lambda: rvpy.Binomial(20, 0.3)),
+    ('Poisson', lambda: rvpy.Poisson(4)),
+    ('Beta', lambda: rvpy.Beta(2.0, 3.0)),
+    ('X + Y + Z', lambda: rvpy.Normal(1, 2) + rvpy.Normal(0, 1) + rvpy.Normal(3, 4)),
+]
+
+def eager(make):
+    X = make()
+    for attr in ATTRS:
+        getattr(X, attr)
+    return X
+
+def main(number=2000):
+    print(f"{'family':<10} {'lazy (us)':>10} {'eager (us)':>11} {'speedup':>8}")
+    for name, make in CASES:
+        lazy_t = min(timeit.repeat(make, number=number, repeat=3)) / number
+        eager_t = min(timeit.repeat(lambda: eager(make), number=number, repeat=3)) / number
+        print(f"{name:<10} {lazy_t*1e6:>10.1f} {eager_t*1e6:>11.1f} {eager_t/lazy_t:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
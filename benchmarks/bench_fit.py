@@ -0,0 +1,76 @@
+"""
+Streaming fit() throughput, and scipy's fit for comparison.
+
+Each family is fitted by maximum likelihood to n draws held in a memory-
+mapped file, chunk_size values at a time, so memory use stays bounded
+whatever n is. "rows/s" is the fit throughput and "passes" the number of
+passes over the file (1 for families with finite sufficient statistics).
+"scipy" fits the first 10**6 draws in memory with scipy.stats' fit, when it
+has an equivalent.
+
+Run from the repository root:
+
+    python benchmarks/bench_fit.py [n]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from scipy import stats
+
+sys.path.insert(0, '.')
+
+import rvpy
+from rvpy import fitting
+
+CASES = [
+    ('Normal', rvpy.Normal(1., 2.), lambda x: stats.norm.fit(x)),
+    ('LogNormal', rvpy.LogNormal(0.5, 0.3), lambda x: stats.lognorm.fit(x, floc=0)),
+    ('Gamma', rvpy.Gamma(2.5, 1.5), lambda x: stats.gamma.fit(x, floc=0)),
+    ('Exponential', rvpy.Exponential(2.), lambda x: stats.expon.fit(x, floc=0)),
+    ('Poisson', rvpy.Poisson(7), None),
+    ('Binomial', rvpy.Binomial(30, 0.2), None),
+    ('Beta', rvpy.Beta(2., 5.), lambda x: stats.beta.fit(x, floc=0, fscale=1)),
+    ('Weibull', rvpy.Weibull(1.7, 3.), lambda x: stats.weibull_min.fit(x, floc=0)),
+    ('Pareto', rvpy.Pareto(2., 3.5), lambda x: stats.pareto.fit(x, floc=0)),
+    ('Gumbel', rvpy.Gumbel(2., 1.5), lambda x: stats.gumbel_r.fit(x)),
+]
+
+def main(n=10**7):
+    path = os.path.join(tempfile.mkdtemp(), 'data.npy')
+    print(f"n = {n}")
+    print(f"{'family':<12} {'fit (s)':>8} {'rows/s':>10} {'passes':>7} {'scipy 1e6 (s)':>14}")
+    for name, X, scipy_fit in CASES:
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=float, shape=(n,))
+        X.sample_into(out, rng=0)
+        out.flush()
+        del out
+        data = np.load(path, mmap_mode='r')
+
+        # Count passes over the data
+        passes = [0]
+        chunks = fitting._chunks
+        def counting(data, chunk_size):
+            passes[0] += 1
+            return chunks(data, chunk_size)
+        fitting._chunks = counting
+        start = time.perf_counter()
+        type(X).fit(data)
+        elapsed = time.perf_counter() - start
+        fitting._chunks = chunks
+
+        if scipy_fit is not None:
+            x = np.array(data[:10**6])
+            start = time.perf_counter()
+            scipy_fit(x)
+            reference = f"{time.perf_counter() - start:>14.2f}"
+        else:
+            reference = f"{'-':>14}"
+        print(f"{name:<12} {elapsed:>8.2f} {n/elapsed:>10.3g} {passes[0]:>7} {reference}")
+        del data
+    os.remove(path)
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
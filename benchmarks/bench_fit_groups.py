@@ -0,0 +1,63 @@
+"""
+Grouped maximum likelihood with fit_groups(), against a loop of fit() calls.
+
+groups groups of size draws each are fitted at once; "passes" is the number
+of passes over all the values (1 for families with finite sufficient
+statistics, plus one per Newton step otherwise). "loop" times fit() on the
+first 1000 groups' values and scales it up to all groups.
+
+Run from the repository root:
+
+    python benchmarks/bench_fit_groups.py [groups] [size]
+"""
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+from rvpy import fitting
+
+CASES = [
+    ('Gamma', rvpy.Gamma(2.5, 1.5)),
+    ('Weibull', rvpy.Weibull(1.7, 3.)),
+    ('Beta', rvpy.Beta(2., 5.)),
+    ('NegBinomial', rvpy.NegativeBinomial(3, 0.3)),
+    ('Normal', rvpy.Normal(1., 2.)),
+    ('Poisson', rvpy.Poisson(7)),
+]
+
+def main(groups=10**6, size=10):
+    ids = np.repeat(np.arange(groups), size)
+    print(f"groups = {groups}, values per group = {size}")
+    print(f"{'family':<12} {'fit_groups (s)':>15} {'passes':>7} {'loop (s)':>9} {'speedup':>8}")
+    for name, X in CASES:
+        x = X.sample(groups * size, rng=0)
+
+        # Count passes over the values
+        passes = [1]
+        sums = fitting.Groups.sums
+        def counting(self, func, where=None):
+            passes[0] += 1
+            return sums(self, func, where)
+        fitting.Groups.sums = counting
+        start = time.perf_counter()
+        type(X).fit_groups(x, ids, arrays=True)
+        elapsed = time.perf_counter() - start
+        fitting.Groups.sums = sums
+
+        sample = min(groups, 1000)
+        start = time.perf_counter()
+        for g in range(sample):
+            try:
+                type(X).fit(x[g*size:(g + 1)*size])
+            except AssertionError:
+                # Groups without an estimate
+                pass
+        loop = (time.perf_counter() - start) * groups / sample
+        print(f"{name:<12} {elapsed:>15.2f} {passes[0]:>7} {loop:>9.1f} {loop/elapsed:>7.0f}x")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
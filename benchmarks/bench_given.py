@@ -0,0 +1,43 @@
+"""
+Conjugate updates of a batch of priors with given(), as for the arms of
+A/B tests: Beta priors updated from Bernoulli events labelled by arm, and
+from per-arm success counts, and Gamma priors from Poisson counts.
+
+Run from the repository root:
+
+    python benchmarks/bench_given.py [arms] [events]
+"""
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main(arms=10**6, events=10**7):
+    rng = np.random.default_rng(0)
+    arm = rng.integers(0, arms, events)
+    clicks = (rng.random(events) < 0.1).astype(float)
+    successes = rng.binomial(100, 0.1, arms)
+    counts = rng.poisson(3., (10, arms))
+
+    beta = rvpy.Beta(np.ones(arms), np.ones(arms))
+    gamma = rvpy.Gamma(np.full(arms, 2.), 1.)
+    print(f"arms = {arms}, events = {events}")
+    cases = [
+        ('Beta | Bernoulli events', lambda: beta.given(rvpy.Bernoulli, clicks, groups=arm)),
+        ('Beta | Binomial counts', lambda: beta.given(rvpy.Binomial, successes, n=100)),
+        ('Gamma | Poisson (10, arms)', lambda: gamma.given(rvpy.Poisson, counts)),
+    ]
+    for name, func in cases:
+        print(f"{name:<28} {timed(func):>8.3f} s")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
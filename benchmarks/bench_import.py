@@ -0,0 +1,41 @@
+"""
+Start-up cost of importing rvpy, measured in fresh interpreters.
+
+Pass a budget in milliseconds to fail (exit status 1) when a bare
+"import rvpy" regresses past it, e.g. in CI:
+
+    python benchmarks/bench_import.py [budget_ms]
+"""
+import subprocess
+import sys
+
+SNIPPETS = [
+    ('numpy alone', "import numpy"),
+    ('import rvpy', "import rvpy"),
+    ('+ Normal, Binomial', "import rvpy; rvpy.Normal; rvpy.Binomial"),
+    ('+ Normal(0, 1).pdf(0)', "import rvpy; rvpy.Normal(0, 1).pdf(0)"),
+    ('+ Normal(0, 1).mean', "import rvpy; rvpy.Normal(0, 1).mean"),
+    ('scipy.stats alone', "import scipy.stats"),
+]
+
+TIMER = "import time; _t = time.perf_counter(); {}; print(time.perf_counter() - _t)"
+
+def import_time(code, repeat=5):
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', TIMER.format(code)],
+                cwd='.', check=True, stdout=subprocess.PIPE, universal_newlines=True)
+        times.append(float(out.stdout))
+    return min(times)
+
+def main(budget_ms=None):
+    results = {}
+    for name, code in SNIPPETS:
+        results[name] = import_time(code) * 1e3
+        print(f"{name:<24} {results[name]:>8.1f} ms")
+    if budget_ms is not None and results['import rvpy'] > budget_ms:
+        print(f"import rvpy exceeded budget of {budget_ms} ms")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main(*[float(a) for a in sys.argv[1:]])
@@ -0,0 +1,58 @@
+"""
+Continuous sampling and quantiles: exact inversion versus tabulated inverse cdfs.
+
+"exact" is the default path. "table" enables rvpy.set_tabulated(), which
+evaluates quantile() (and samples) through a monotone interpolation table
+built once per object; "build" is that one-off construction, and "max err"
+is the largest |cdf(quantile(u)) - u| observed over the draws. Gumbel and
+Pareto, whose quantiles are closed forms, are timed through the table
+directly for comparison; they are not tabulated by default.
+
+Run from the repository root:
+
+    python benchmarks/bench_inverse.py [n]
+"""
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+from rvpy import tables
+
+CASES = [
+    ('Beta(2, 5)', lambda: rvpy.Beta(2., 5.)),
+    ('Beta(0.5, 0.5)', lambda: rvpy.Beta(0.5, 0.5)),
+    ('T(3)', lambda: rvpy.T(3)),
+    ('F(5, 7)', lambda: rvpy.F(5, 7)),
+    ('Gumbel(0, 1)', lambda: rvpy.Gumbel(0., 1.)),
+    ('Pareto(2, 1)', lambda: rvpy.Pareto(2., 1.)),
+]
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(n=10**6):
+    u = np.random.default_rng(0).random(n)
+    print(f"n = {n}")
+    print(f"{'family':<15} {'exact (ns)':>11} {'table (ns)':>11} {'speedup':>8} "
+          f"{'build (ms)':>11} {'nodes':>6} {'max err':>8}")
+    for name, make in CASES:
+        X = make()
+        exact = timed(lambda: X.quantile(u)) / n
+        build = timed(lambda: tables.InverseTable(make(), 1e-12, 1e-10), repeat=1)
+        table = tables.InverseTable(X, 1e-12, 1e-10)
+        tab = timed(lambda: table.quantile(u)) / n
+        err = np.abs(X.cdf(table.quantile(u)) - u).max()
+        print(f"{name:<15} {exact*1e9:>11.1f} {tab*1e9:>11.1f} {exact/tab:>7.1f}x "
+              f"{build*1e3:>11.2f} {table.u.size:>6} {err:>8.1e}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,53 @@
+"""
+Eager versus lazy n-ary sums of random variables.
+
+"eager" folds sum() through __add__, building one intermediate per term.
+"lazy" builds an expression graph with rvpy.set_lazy(True) and collapses it
+in one pass on evaluation. Both include constructing the n terms.
+
+Run from the repository root:
+
+    python benchmarks/bench_lazy.py [n]
+"""
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import numpy as np
+
+import rvpy
+
+CASES = [
+    ('Normal', lambda a, b: rvpy.Normal(a, b + 0.1)),
+    ('Gamma', lambda a, b: rvpy.Gamma(a + 0.1, 2.0)),
+    ('Poisson', lambda a, b: rvpy.Poisson(int(10*a) + 1)),
+    ('Binomial', lambda a, b: rvpy.Binomial(int(10*a) + 1, 0.3)),
+    ('ChiSq', lambda a, b: rvpy.ChiSq(int(10*a) + 1)),
+]
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def lazy_sum(terms):
+    rvpy.set_lazy(True)
+    try:
+        return sum(terms()).evaluate()
+    finally:
+        rvpy.set_lazy(False)
+
+def main(n=10000):
+    a, b = np.random.default_rng(0).random((2, n))
+    print(f"n = {n}")
+    print(f"{'family':<10} {'eager (ms)':>11} {'lazy (ms)':>10} {'speedup':>8}")
+    for name, make in CASES:
+        terms = lambda: (make(x, y) for x, y in zip(a.tolist(), b.tolist()))
+        # Eager sums start from a term, since e.g. Gamma + 0 is undefined
+        eager_t = min(timed(lambda: sum(terms(), make(0., 0.))) for _ in range(3))
+        lazy_t = min(timed(lambda: lazy_sum(terms)) for _ in range(3))
+        print(f"{name:<10} {eager_t*1e3:>11.1f} {lazy_t*1e3:>10.1f} {eager_t/lazy_t:>7.1f}x")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
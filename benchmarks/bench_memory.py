@@ -0,0 +1,53 @@
+"""
+Per-object memory of distribution objects, measured with tracemalloc.
+
+"slots" is the object as it is built today. "dict" is the same object with
+an instance __dict__, via a throwaway subclass without __slots__, which is
+what every object used to carry. The scipy backend is built on first use, so
+neither includes it. "interned"
+builds the same distribution repeatedly with set_interning(True), so all but
+the first construction share one instance.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py [count]
+"""
+import sys
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+CASES = [
+    ('StandardNormal', rvpy.StandardNormal, ()),
+    ('Normal', rvpy.Normal, (1.5, 2.0)),
+    ('ChiSq', rvpy.ChiSq, (1,)),
+    ('Exponential', rvpy.Exponential, (2.0,)),
+    ('Binomial', rvpy.Binomial, (20, 0.3)),
+]
+
+def per_object(make, count):
+    """Average bytes retained per object over count constructions"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def main(count=2000):
+    print(f"{'family':<15} {'dict (B)':>9} {'slots (B)':>10} {'interned (B)':>13}")
+    for name, cls, args in CASES:
+        with_dict = type('Dict' + name, (cls,), {})
+        # Warm up module imports
+        with_dict(*args)
+        dict_b = per_object(lambda: with_dict(*args), count)
+        slots_b = per_object(lambda: cls(*args), count)
+        rvpy.set_interning(True)
+        interned_b = per_object(lambda: cls(*args), count)
+        rvpy.set_interning(False)
+        print(f"{name:<15} {dict_b:>9.0f} {slots_b:>10.0f} {interned_b:>13.0f}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
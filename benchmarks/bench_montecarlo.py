@@ -0,0 +1,43 @@
+"""
+Cost of the Monte Carlo fallback for arithmetic without a closed form:
+building the Empirical result of Normal + Gamma from samples draws, then
+evaluating cdf() and quantile() at, and bootstrap sampling, queries points.
+
+Run from the repository root:
+
+    python benchmarks/bench_montecarlo.py [samples] [queries] [chunk_size]
+"""
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+def main(samples=10**7, queries=10**6, chunk_size=2**20):
+    rvpy.set_rng(0)
+    rvpy.set_monte_carlo(samples=samples, chunk_size=chunk_size)
+    X, Y = rvpy.Normal(0., 1.), rvpy.Gamma(2., 1.)
+
+    start = time.perf_counter()
+    Z = X + Y
+    build = time.perf_counter() - start
+
+    q = np.random.default_rng(0).random(queries)
+    timings = []
+    for name, func in [('cdf', lambda: Z.cdf(q)), ('quantile', lambda: Z.quantile(q)),
+                       ('sample', lambda: Z.sample(queries))]:
+        start = time.perf_counter()
+        func()
+        timings.append((name, time.perf_counter() - start))
+
+    print(f"samples = {samples}, queries = {queries}, chunk_size = {chunk_size}")
+    print(f"{'build':<10} {build:>9.3f} s")
+    for name, seconds in timings:
+        print(f"{name:<10} {seconds:>9.3f} s {queries / seconds / 1e6:>9.1f} M/s")
+    rvpy.set_monte_carlo(False)
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""
+Multinomial and Dirichlet sampling in bulk, as in an allocation simulator
+drawing total vectors in chunks of 2**20 with sample_iter() and reducing
+each chunk (here, to the per-outcome totals).
+
+"numpy" is the default sampler (numpy's multinomial, or Dirichlet by
+normalized Gammas); "tabulated" runs with rvpy.set_tabulated(), where
+Multinomial draws conditional binomials from stacked alias tables, built
+inside the timing (Dirichlet is unaffected). Rates are in millions of vectors per second.
+
+Run from the repository root:
+
+    python benchmarks/bench_multinomial.py [total]
+"""
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+CASES = [
+    ('Multinomial(10, 4)', rvpy.Multinomial(10, [0.1, 0.2, 0.3, 0.4])),
+    ('Multinomial(100, 5)', rvpy.Multinomial(100, [0.1, 0.2, 0.3, 0.15, 0.25])),
+    ('Multinomial(500, 4)', rvpy.Multinomial(500, [0.4, 0.3, 0.2, 0.1])),
+    ('Multinomial(30, 10)', rvpy.Multinomial(30, np.full(10, 0.1))),
+    ('Dirichlet(4)', rvpy.Dirichlet([0.5, 1., 2., 3.])),
+]
+
+def run(X, total):
+    start = time.perf_counter()
+    counts = sum(chunk.sum(axis=0) for chunk in X.sample_iter(total, rng=0))
+    return time.perf_counter() - start, counts
+
+def main(total=10**7):
+    print(f"vectors = {total}")
+    print(f"{'distribution':<22} {'numpy (s)':>10} {'M/s':>6} {'tabulated (s)':>14} {'M/s':>6}")
+    for name, X in CASES:
+        rvpy.set_tabulated(False)
+        numpy_time, _ = run(X, total)
+        rvpy.set_tabulated(True)
+        # A fresh object, so the tables are built inside the timing
+        tabulated_time, _ = run(type(X)(*[getattr(X, p) for p in X._params]), total)
+        rvpy.set_tabulated(False)
+        print(f"{name:<22} {numpy_time:>10.2f} {total / numpy_time / 1e6:>6.1f} "
+              f"{tabulated_time:>14.2f} {total / tabulated_time / 1e6:>6.1f}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+MultivariateNormal densities and sampling in high dimension, against
+scipy.stats.multivariate_normal.
+
+For each dimension d, "factor" is the one-off Cholesky factorization,
+"logpdf" the density of N points given the cached factor, and
+"sample" the time to draw N vectors. scipy's times include building its
+frozen distribution, which factors the covariance (by eigendecomposition)
+on every construction.
+
+Run from the repository root:
+
+    python benchmarks/bench_mvn.py [points]
+"""
+import sys
+import time
+
+import numpy as np
+from scipy import stats
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+DIMS = (500, 1000, 2000, 5000)
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def main(points=2000):
+    rng = np.random.default_rng(0)
+    print(f"points = {points}")
+    print(f"{'d':>6} {'factor (s)':>11} {'logpdf (s)':>11} {'scipy (s)':>10} "
+          f"{'sample (s)':>11} {'scipy (s)':>10} {'max |diff|':>11}")
+    for d in DIMS:
+        A = rng.standard_normal((d, d)) / np.sqrt(d)
+        cov = A @ A.T + np.eye(d)
+        mu = rng.standard_normal(d)
+        x = rng.standard_normal((points, d))
+
+        X = rvpy.MultivariateNormal(mu, cov)
+        _, factor = timed(lambda: X.chol)
+        ours, logpdf = timed(lambda: X.logpdf(x))
+        _, sample = timed(lambda: X.sample(points, rng=0))
+
+        theirs, scipy_logpdf = timed(lambda: stats.multivariate_normal(mu, cov).logpdf(x))
+        _, scipy_sample = timed(lambda: stats.multivariate_normal(mu, cov).rvs(points, random_state=0))
+        print(f"{d:>6} {factor:>11.3f} {logpdf:>11.3f} {scipy_logpdf:>10.3f} "
+              f"{sample:>11.3f} {scipy_sample:>10.3f} {np.max(np.abs(ours - theirs)):>11.2e}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
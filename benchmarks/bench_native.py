@@ -0,0 +1,48 @@
+"""
+Native numpy kernels versus scipy.stats for pdf, cdf, and quantile.
+
+Times each family at array sizes 1 to 10**7 with both backends and prints the
+per-call time and speedup. Pass a smaller maximum exponent to keep runs short:
+
+    python benchmarks/bench_native.py [max_exponent]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+FAMILIES = [
+    rvpy.Normal(1., 2.), rvpy.LogNormal(0., 1.), rvpy.Exponential(2.),
+    rvpy.Gamma(2.5, 1.5), rvpy.CUniform(0, 3), rvpy.Laplace(0, 2),
+    rvpy.Cauchy(0, 1), rvpy.Logistic(0, 1), rvpy.LogLogistic(1., 3.),
+    rvpy.Pareto(1., 3.), rvpy.Weibull(1.5, 2.), rvpy.Rayleigh(1.),
+    rvpy.Gumbel(0., 1.), rvpy.Gompertz(0.5, 1.),
+]
+
+def best_time(func, arg):
+    # Aim for roughly 0.2s of work per measurement
+    number = max(1, int(0.2 / max(timeit.timeit(lambda: func(arg), number=1), 1e-7)))
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=3)) / number
+
+def main(max_exp=7):
+    rng = np.random.default_rng(0)
+    for X in FAMILIES:
+        print(X)
+        print(f"  {'size':>9} {'method':>9} {'scipy (us)':>12} {'native (us)':>12} {'speedup':>8}")
+        for e in range(max_exp + 1):
+            n = 10**e
+            q = rng.random(n)
+            x = X.quantile(q)
+            for name, arg in (('pdf', x), ('cdf', x), ('quantile', q)):
+                rvpy.set_backend('scipy')
+                t_sp = best_time(getattr(X, name), arg)
+                rvpy.set_backend('native')
+                t_nat = best_time(getattr(X, name), arg)
+                print(f"  {n:>9} {name:>9} {t_sp*1e6:>12.1f} {t_nat*1e6:>12.1f} {t_sp/t_nat:>7.1f}x")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
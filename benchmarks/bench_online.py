@@ -0,0 +1,52 @@
+"""
+Throughput of ConjugateUpdater on an event stream replayed from local
+files: the (value, arm) events are saved as .npy files, memory-mapped, and
+ingested in micro-batches, with a checkpoint at the end.
+
+Run from the repository root:
+
+    python benchmarks/bench_online.py [events] [arms] [batch]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+def main(events=10**7, arms=10**6, batch=10**4):
+    rng = np.random.default_rng(0)
+    cases = [
+        ('Beta | Bernoulli', rvpy.Beta(1., 1.), rvpy.Bernoulli,
+         (rng.random(events) < 0.1).astype(float)),
+        ('Gamma | Poisson', rvpy.Gamma(2., 1.), rvpy.Poisson,
+         rng.poisson(3., events).astype(float)),
+    ]
+    arm = rng.integers(0, arms, events)
+    print(f"events = {events}, arms = {arms}, micro-batch = {batch}")
+    print(f"{'pair':<18} {'ingest (s)':>11} {'M events/s':>11} {'checkpoint (s)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        np.save(os.path.join(tmp, 'arms.npy'), arm)
+        for name, prior, likelihood, values in cases:
+            np.save(os.path.join(tmp, 'values.npy'), values)
+            stream_values = np.load(os.path.join(tmp, 'values.npy'), mmap_mode='r')
+            stream_arms = np.load(os.path.join(tmp, 'arms.npy'), mmap_mode='r')
+            batches = ((stream_values[i:i + batch], stream_arms[i:i + batch])
+                       for i in range(0, events, batch))
+
+            updater = rvpy.ConjugateUpdater(prior, likelihood, arms=arms)
+            start = time.perf_counter()
+            updater.consume(batches)
+            ingest = time.perf_counter() - start
+
+            start = time.perf_counter()
+            updater.checkpoint(os.path.join(tmp, 'state.npz'))
+            checkpoint = time.perf_counter() - start
+            print(f"{name:<18} {ingest:>11.3f} {events / ingest / 1e6:>11.1f} {checkpoint:>15.3f}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,32 @@
+"""
+Scaling of parallel_sample() across worker counts, with process and thread
+pools, against a single-threaded sample() call.
+
+    python benchmarks/bench_parallel.py [n] [max_workers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main(n=2 * 10**7, max_workers=None):
+    max_workers = max_workers or os.cpu_count()
+    for X in (rvpy.Normal(0., 1.), rvpy.Gamma(2.5, 1.5), rvpy.Binomial(50, 0.3)):
+        base = timed(lambda: X.sample(n, rng=0))
+        print(f"{X}: single-threaded {n / base / 1e6:.1f} M/s")
+        print(f"  {'workers':>7} {'processes (M/s)':>16} {'threads (M/s)':>14}")
+        for w in range(1, max_workers + 1):
+            procs = timed(lambda: rvpy.parallel_sample(X, n, rng=0, workers=w))
+            thrds = timed(lambda: rvpy.parallel_sample(X, n, rng=0, workers=w, threads=True))
+            print(f"  {w:>7} {n / procs / 1e6:>16.1f} {n / thrds / 1e6:>14.1f}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,40 @@
+"""
+Samples per second of sample() versus the previous scipy rvs path, which drew
+from the legacy global RandomState.
+
+    python benchmarks/bench_sample.py [n]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+FAMILIES = [
+    rvpy.Normal(1., 2.), rvpy.LogNormal(0., 1.), rvpy.Gamma(2.5, 1.5),
+    rvpy.Exponential(2.), rvpy.Beta(2., 3.), rvpy.T(5), rvpy.F(3, 7),
+    rvpy.Cauchy(0, 1), rvpy.CUniform(0, 3), rvpy.Laplace(0, 2),
+    rvpy.Logistic(0, 1), rvpy.LogLogistic(1., 3.), rvpy.Pareto(1., 3.),
+    rvpy.Weibull(1.5, 2.), rvpy.Rayleigh(1.), rvpy.Gumbel(0., 1.),
+    rvpy.Gompertz(0.5, 1.), rvpy.Binomial(20, 0.3), rvpy.Poisson(4),
+    rvpy.DUniform(1, 6), rvpy.NegativeBinomial(3, 0.4),
+    rvpy.Hypergeometric(50, 20, 10),
+]
+
+def rate(func, n):
+    number = 5
+    return n * number / min(timeit.repeat(func, number=number, repeat=3))
+
+def main(n=10**6):
+    rng = np.random.default_rng(0)
+    print(f"{'family':<34} {'scipy (M/s)':>12} {'sample (M/s)':>13} {'speedup':>8}")
+    for X in FAMILIES:
+        old = rate(lambda: X.sp.rvs(size=n), n)
+        new = rate(lambda: X.sample(n, rng=rng), n)
+        print(f"{str(X):<34} {old/1e6:>12.1f} {new/1e6:>13.1f} {new/old:>7.1f}x")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+Cost of the sum of n iid copies as n grows.
+
+"loop" folds __add__ n times, as callers had to before sum_iid() (only run
+for small n). Closed forms cost the same for every n; the numerical
+convolution fallback grows with log(n).
+
+Run from the repository root:
+
+    python benchmarks/bench_sum_iid.py
+"""
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+CASES = [
+    ('Bernoulli', rvpy.Bernoulli(0.3)),
+    ('Exponential', rvpy.Exponential(2.0)),
+    ('Normal', rvpy.Normal(1.0, 2.0)),
+    ('DUniform', rvpy.DUniform(1, 6)),
+    ('Laplace', rvpy.Laplace(1.0, 2.0)),
+]
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def loop(X, n):
+    total = X
+    for _ in range(n - 1):
+        total = total + X
+    return total
+
+def main():
+    ns = [2, 10**3, 10**6, 10**9]
+    print(f"{'family':<12} {'loop n=1e3 (ms)':>16} " + ' '.join(f"{f'n={n:.0e} (ms)':>14}" for n in ns))
+    for name, X in CASES:
+        X.sum_iid(2)
+        try:
+            loop_t = f"{timed(lambda: loop(X, 10**3))*1e3:>16.2f}"
+        except (TypeError, AssertionError):
+            loop_t = f"{'unsupported':>16}"
+        times = ' '.join(f"{timed(lambda: X.sum_iid(n))*1e3:>14.3f}" for n in ns)
+        print(f"{name:<12} {loop_t} {times}")
+
+if __name__ == '__main__':
+    main()
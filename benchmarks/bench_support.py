@@ -0,0 +1,75 @@
+"""
+Bounded discrete pmf/cdf/quantile: scipy versus full-support tables.
+
+"scipy" is the default path. "table" enables rvpy.set_support_tables(),
+which tabulates the pmf and cdf over the whole support once per object;
+"build" is that one-off construction, "table (MB)" the memory the table
+holds (rvpy.table_info()), and "peak (MB)" the peak memory allocated while
+building it, measured with tracemalloc.
+
+Run from the repository root:
+
+    python benchmarks/bench_support.py [queries]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, '.')
+
+import rvpy
+
+CASES = [
+    ('Binomial(1e3, .3)', lambda: rvpy.Binomial(10**3, 0.3)),
+    ('Binomial(1e5, .3)', lambda: rvpy.Binomial(10**5, 0.3)),
+    ('Binomial(1e7, .3)', lambda: rvpy.Binomial(10**7, 0.3)),
+    ('Hypergeom(1e6, ..)', lambda: rvpy.Hypergeometric(10**6, 4*10**5, 10**5)),
+]
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(queries=10**5):
+    rng = np.random.default_rng(0)
+    q = rng.random(queries)
+    print(f"queries = {queries}")
+    print(f"{'family':<19} {'method':<9} {'scipy (ns)':>11} {'table (ns)':>11} {'speedup':>8}")
+    sizes = []
+    for name, make in CASES:
+        X = make()
+        k = X.sp.ppf(q)
+        results = {}
+        for method, arg in (('pmf', k), ('cdf', k), ('quantile', q)):
+            results[method] = [timed(lambda: getattr(X, method)(arg)) / queries]
+
+        rvpy.set_support_tables(True)
+        tracemalloc.start()
+        build = timed(lambda: make().pmf(0), repeat=1)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        X.pmf(0)
+        nbytes = rvpy.table_info().nbytes
+        for method, arg in (('pmf', k), ('cdf', k), ('quantile', q)):
+            results[method].append(timed(lambda: getattr(X, method)(arg)) / queries)
+        rvpy.set_support_tables(False)
+        del X
+
+        for method, (exact, table) in results.items():
+            print(f"{name:<19} {method:<9} {exact*1e9:>11.1f} {table*1e9:>11.1f} "
+                  f"{exact/table:>7.1f}x")
+        sizes.append((name, build, nbytes, peak))
+
+    print()
+    print(f"{'family':<19} {'build (ms)':>11} {'table (MB)':>11} {'peak (MB)':>10}")
+    for name, build, nbytes, peak in sizes:
+        print(f"{name:<19} {build*1e3:>11.1f} {nbytes/2**20:>11.1f} {peak/2**20:>10.1f}")
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -1,26 +1,54 @@
-from .distribution import Distribution
-from .normal import Normal, StandardNormal, LogNormal
-from .binomial import Bernoulli, Binomial
-from .cuniform import CUniform
-from .gamma import Gamma, Exponential, ChiSq
-from .beta import Beta
-from .t import T
-from .f import F
-from .cauchy import Cauchy, StandardCauchy
-from .poisson import Poisson
-from .duniform import DUniform
-from .laplace import Laplace
-from .weibull import Weibull, Rayleigh
-from .negbin import NegativeBinomial, Geometric
-from .hypergeom import Hypergeometric
-from .pareto import Pareto
-from .logistic import Logistic, LogLogistic
-from .gompertz import Gompertz
-from .gumbel import Gumbel
-from .degenerate import Degenerate
+import importlib
 
+from .distribution import (
+    Distribution, cache_info, set_backend, set_cache, set_interning, set_lazy, set_monte_carlo,
+    set_rng, set_support_tables, set_tabulated, table_info,
+)
 from .transformations import abs, exp, log, sqrt, pow
 
+# Families are imported on first access (PEP 562), so "import rvpy" does not
+# pull in scipy or modules that are never used.
+_lazy = {
+    'Normal': 'normal', 'StandardNormal': 'normal', 'LogNormal': 'normal',
+    'Bernoulli': 'binomial', 'Binomial': 'binomial',
+    'CUniform': 'cuniform',
+    'Gamma': 'gamma', 'Exponential': 'gamma', 'ChiSq': 'gamma',
+    'Beta': 'beta',
+    'T': 't',
+    'F': 'f',
+    'Cauchy': 'cauchy', 'StandardCauchy': 'cauchy',
+    'Poisson': 'poisson',
+    'DUniform': 'duniform',
+    'Laplace': 'laplace',
+    'Weibull': 'weibull', 'Rayleigh': 'weibull',
+    'NegativeBinomial': 'negbin', 'Geometric': 'negbin',
+    'Hypergeometric': 'hypergeom',
+    'Pareto': 'pareto',
+    'Logistic': 'logistic', 'LogLogistic': 'logistic',
+    'Gompertz': 'gompertz',
+    'Gumbel': 'gumbel',
+    'Degenerate': 'degenerate',
+    'Lattice': 'lattice',
+    'Empirical': 'montecarlo',
+    'MultivariateNormal': 'multivariate',
+    'Dirichlet': 'multivariate',
+    'Multinomial': 'multivariate',
+    'SufficientStatistics': 'fitting',
+    'ConjugateUpdater': 'online',
+    'parallel_sample': 'parallel',
+    'select_family': 'selection',
+}
+
+def __getattr__(name):
+    if name in _lazy:
+        value = getattr(importlib.import_module('.' + _lazy[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
 __all__ = [
     'Normal', 'StandardNormal', "LogNormal",
     'Bernoulli', 'Binomial',
@@ -41,8 +69,19 @@ __all__ = [
     'Gompertz',
     'Gumbel',
     'Degenerate',
+    'Lattice',
+    'Empirical',
+    'MultivariateNormal',
+    'Dirichlet',
+    'Multinomial',
+    'SufficientStatistics',
+    'ConjugateUpdater',
+
+    'abs', 'exp', 'log', 'sqrt', 'pow',
 
-    'abs', 'exp', 'log', 'sqrt', 'pow'
+    'set_backend', 'set_cache', 'cache_info', 'set_interning', 'set_lazy', 'set_rng',
+    'set_tabulated', 'set_support_tables', 'table_info', 'set_monte_carlo', 'parallel_sample',
+    'select_family',
 ]
 
 __version__ = '0.3'
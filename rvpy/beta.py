@@ -1,7 +1,48 @@
 import numpy as np
-from scipy.stats import beta as bta
-from . import distribution
-from . import cuniform
+from . import distribution, fitting
+from . import binomial, cuniform
+
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
+_ITERATIONS = 1000
+
+def _log_incbeta(a, b, x, y):
+    """log I_x(a, b), y = 1 - x, from its continued fraction (modified Lentz),
+    for x below (a + 1) / (a + b + 2)"""
+    tiny = 1e-300
+    c = np.ones_like(x)
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+    h = d
+    for m in range(1, _ITERATIONS):
+        for an in (m * (b - m) * x / ((a + 2*m - 1) * (a + 2*m)),
+                   -(a + m) * (a + b + m) * x / ((a + 2*m) * (a + 2*m + 1))):
+            d = 1 + an * d
+            d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+            c = 1 + an / c
+            c = np.where(np.abs(c) < tiny, tiny, c)
+            h = h * d * c
+        if np.all(np.abs(d * c - 1) < 1e-16):
+            break
+    log_prefactor = special.xlogy(a, x) + special.xlogy(b, y) - np.log(a) - special.betaln(a, b)
+    return log_prefactor + np.log(h)
+
+def _newton_step(alpha, beta, log_x, log_1mx):
+    # Newton step for the Beta likelihood equations
+    total = special.digamma(alpha + beta)
+    grad_a = special.digamma(alpha) - total - log_x
+    grad_b = special.digamma(beta) - total - log_1mx
+    # The Hessian is [[h_a, -t], [-t, h_b]]; solve with its inverse
+    t = fitting.trigamma(alpha + beta)
+    h_a, h_b = fitting.trigamma(alpha) - t, fitting.trigamma(beta) - t
+    det = h_a * h_b - t**2
+    step_a = (h_b * grad_a + t * grad_b) / det
+    step_b = (t * grad_a + h_a * grad_b) / det
+    # Halve steps that would leave the positive quadrant, as often as needed
+    ratio = np.maximum(step_a / alpha, step_b / beta)
+    shrink = np.where(ratio >= 1, 0.5**(np.floor(np.log2(np.maximum(ratio, 1))) + 1), 1)
+    return step_a * shrink, step_b * shrink
 
 class Beta(distribution.Distribution):
     """
@@ -20,12 +61,20 @@ class Beta(distribution.Distribution):
     -------
     to_cuniform()
         Converts self to CUniform if (alpha, beta) == (1, 1)
+    given(likelihood, data, n=None)
+        Posterior given observations of Bernoulli(p), or of Binomial(n, p)
+        with n known, for p with this prior
 
     Relationships
     -------------
     Let X be Beta(1, 1). Then:
     * X is CUniform(0, 1)
     """
+    _params = ('alpha', 'beta')
+    __slots__ = ('alpha', 'beta')
+    _tabulate = 'inverse'
+    _fit_transforms = ('x', 'log', 'log1m')
+
     def __init__(self, alpha, beta):
         """
         Parameters
@@ -35,25 +84,55 @@ class Beta(distribution.Distribution):
         beta : float, positive
             Shape parameter
         """
-        assert alpha > 0 and beta > 0, "alpha and beta must be positive"
+        assert np.all(alpha > 0) and np.all(beta > 0), "alpha and beta must be positive"
 
         # Parameters
         self.alpha = alpha
         self.beta = beta
 
-        # Scipy backend
-        self.sp = bta(alpha, beta)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.beta(self.alpha, self.beta)
+
     def __repr__(self):
         return f"Beta(alpha={self.alpha}, beta={self.beta})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.beta(self.alpha, self.beta, size)
+
+    @classmethod
+    def _fit(cls, s, method):
+        mean = s.mean_of('x')
+        common = mean * (1 - mean) / s.var_of('x') - 1
+        alpha, beta = mean * common, (1 - mean) * common
+        if method == 'mle':
+            # Newton's method on digamma(alpha) - digamma(alpha + beta) = mean(log x)
+            # and digamma(beta) - digamma(alpha + beta) = mean(log(1 - x)), from
+            # the moment estimates
+            alpha, beta = fitting.newton(_newton_step, (alpha, beta),
+                                         (s.mean_of('log'), s.mean_of('log1m')))
+        return alpha, beta
+
+    def _given(self, likelihood, s, n=None):
+        if not issubclass(likelihood, binomial.Binomial):
+            raise TypeError("Beta is a conjugate prior for Binomial and Bernoulli only")
+        if issubclass(likelihood, binomial.Bernoulli):
+            n = 1
+        assert n is not None, "n must be given for Binomial observations"
+        assert np.all(s.min >= 0) and np.all(s.max <= n), "Observations must be in [0, n]"
+        successes = s.n * s.mean_of('x')
+        return Beta(distribution._unwrap(self.alpha + successes),
+                    distribution._unwrap(self.beta + s.n * n - successes))
+
     # TODO: Implement crazy MGF for Beta.
 
     def to_cuniform(self):
-        assert self.alpha == 1 and self.beta == 1, "Alpha and beta must be equal to 1 to cast to CUniform"
+        assert np.all(self.alpha == 1) and np.all(self.beta == 1), "Alpha and beta must be equal to 1 to cast to CUniform"
         return cuniform.CUniform(a=0, b=1)
 
 
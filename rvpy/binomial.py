@@ -1,6 +1,7 @@
 import numpy as np
-from scipy.stats import binom
-from . import distribution
+from . import beta, distribution, gamma
+
+stats = distribution._LazyModule('scipy.stats')
 
 class Binomial(distribution.Distribution):
     """
@@ -21,12 +22,21 @@ class Binomial(distribution.Distribution):
         Converts self to Bernoulli if n == 1
     mgf(t)
         Moment generating function
+    fit(data, method='mle', chunk_size=2**20, n=None)
+        Class method fitting p, and n by the method of moments unless given
+        (likewise fit_groups)
 
     Relationships
     -------------
     Let X, Y be Binomial. Then:
     * X + Y is Binomial
     """
+    _params = ('n', 'p')
+    __slots__ = ('n', 'p', 'q')
+    _discrete = True
+    _tabulate = 'alias'
+    _fit_transforms = ('x',)
+
     def __init__(self, n, p):
         """
         Parameters
@@ -36,36 +46,83 @@ class Binomial(distribution.Distribution):
         p : float between 0 and 1 (exclusive)
             Probability of success per Bernoulli trial
         """
-        assert p < 1 and p > 0, "p must be a float between 0 and 1"
-        assert n > 0, "n must be a positive integer"
-        assert isinstance(p, float), "p must be a float"
-        assert isinstance(n, int), "n must be an integer"
+        assert np.all((p < 1) & (p > 0)), "p must be a float between 0 and 1"
+        assert np.all(n > 0), "n must be a positive integer"
+        assert distribution._is_float(p), "p must be a float"
+        assert distribution._is_integer(n), "n must be an integer"
 
         # Parameters
         self.p = p
         self.q = 1 - p
         self.n = n
 
-        # Scipy backend
-        self.sp = binom(n, p)
-
         # Intialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.binom(self.n, self.p)
+
     def __repr__(self):
         return f"Binomial(n={self.n}, p={self.p})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.binomial(self.n, self.p, size)
+
+    def _logcdf(self, x):
+        # cdf(k) = I_q(n - k, k + 1)
+        k = np.floor(x)
+        return gamma._log_tail(self.sp.cdf(k), beta._log_incbeta,
+                               self.n - k, k + 1, self.q, self.p)
+
+    def _logsf(self, x):
+        # sf(k) = I_p(k + 1, n - k)
+        k = np.floor(x)
+        return gamma._log_tail(self.sp.sf(k), beta._log_incbeta,
+                               k + 1, self.n - k, self.p, self.q)
+
+    def _support(self):
+        return 0, int(self.n)
+
+    def _log_ratio(self, k):
+        return np.log(self.n - k) - np.log1p(k) + np.log(self.p) - np.log(self.q)
+
+    def _sum_iid(self, n):
+        return Binomial(n * self.n, self.p)
+
+    @classmethod
+    def _fit(cls, s, method, n=None):
+        # Given n, both methods give p = mean / n. Otherwise n is estimated
+        # from mean = np and var = np(1 - p), and is at least the largest count
+        mean = s.mean_of('x')
+        if n is None:
+            var = s.var_of('x')
+            with np.errstate(divide='ignore', invalid='ignore'):
+                n = np.where(mean > var, np.round(mean**2 / (mean - var)), 0)
+            n = np.maximum(n, s.max).astype(int)
+        return n, mean / n
+
     def __add__(self, Y):
-        if isinstance(Y, Binomial) and self.p == Y.p:
+        if isinstance(Y, Binomial) and np.all(self.p == Y.p):
             return Binomial(self.n + Y.n, self.p)
         else:
             raise TypeError("Can only add Binomials or Benoulli to Binomials")
 
+    @classmethod
+    def _sum(cls, terms):
+        # n-ary form of __add__, used when evaluating lazy sums
+        p = terms[0].p
+        if any(np.any(t.p != p) for t in terms):
+            raise TypeError("Can only add Binomials or Benoulli to Binomials")
+        return Binomial(sum(t.n for t in terms), p)
+
     def mgf(self, t):
         return (self.q + self.p * np.exp(t))**self.n
 
     def to_bernoulli(self):
-        assert self.n == 1, \
+        assert np.all(self.n == 1), \
                 "Must have n == 1 to convert to downcast to Bernoulli"
         return Bernoulli(self.p)
 
@@ -92,6 +149,9 @@ class Bernoulli(Binomial):
     Let X, Y be Bernoulli. Then:
     * X + Y is Binomial
     """
+    _params = ('p',)
+    __slots__ = ()
+
     def __init__(self, p):
         # Get Bernoulli distribution initialization
         super().__init__(n=1, p=p)
@@ -99,5 +159,9 @@ class Bernoulli(Binomial):
     def __repr__(self):
         return f"Bernoulli(p={self.p})"
 
+    @classmethod
+    def _fit(cls, s, method, n=None):
+        return s.mean_of('x'),
+
     def to_binomial(self):
         return Binomial(n=1, p=self.p)
@@ -1,8 +1,9 @@
 import numpy as np
-from scipy.stats import cauchy
 from . import distribution
 from . import t
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Cauchy(distribution.Distribution):
     """
     Cauchy Distribution using the following parameterization:
@@ -31,6 +32,9 @@ class Cauchy(distribution.Distribution):
     * 1/X is Cauchy
     * If X as parameters (0, 1), is StandardCauchy and T(1)
     """
+    _params = ('loc', 'scale')
+    __slots__ = ('loc', 'scale')
+
     def __init__(self, loc=0, scale=1):
         """
         Parameters
@@ -40,23 +44,70 @@ class Cauchy(distribution.Distribution):
         scale : float, positive
             Scale parameter
         """
-        assert scale > 0, "scale parameter must be positive"
+        assert np.all(scale > 0), "scale parameter must be positive"
 
         # Parameters
         self.loc = loc
         self.scale = scale
 
-        # Scipy backend
-        self.sp = cauchy(loc, scale)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.cauchy(self.loc, self.scale)
+
     def __repr__(self):
         return f"Cauchy(loc={self.loc}, scale={self.scale})"
 
+    # Native kernels
+    def _pdf(self, x):
+        z = (x - self.loc) / self.scale
+        return 1 / (np.pi * self.scale * (1 + z**2))
+
+    def _logpdf(self, x):
+        # For large |z|, log(1 + z**2) = 2 log|z| + log(1 + z**-2), as z**2
+        # overflows
+        z = (x - self.loc) / self.scale
+        log_tail = 2*np.log(np.abs(z)) + np.log1p(z**-2.)
+        return -np.log(np.pi * self.scale) - np.where(np.abs(z) > 1, log_tail, np.log1p(z**2))
+
+    def _cdf(self, x):
+        # arctan2 keeps full relative precision in the lower tail
+        return np.arctan2(1, -(x - self.loc) / self.scale) / np.pi
+
+    def _logcdf(self, x):
+        return np.log(self._cdf(x))
+
+    def _sf(self, x):
+        return np.arctan2(1, (x - self.loc) / self.scale) / np.pi
+
+    def _logsf(self, x):
+        return np.log(self._sf(x))
+
+    def _ppf(self, q):
+        # Work from the nearer tail so the argument of tan stays accurate
+        x = np.where(q < 0.5,
+                self.loc - self.scale / np.tan(np.pi * q),
+                self.loc + self.scale / np.tan(np.pi * (1 - q)))
+        return distribution._ppf_bounds(q, x, -np.inf, np.inf)
+
+    def _isf(self, q):
+        return 2*self.loc - self._ppf(q)
+
+    def _rvs(self, size, rng):
+        return self.loc + self.scale * rng.standard_cauchy(size)
+
+    def _sum_iid(self, n):
+        return Cauchy(n * self.loc, n * self.scale)
+
+    def _mean_iid(self, n):
+        # The mean of iid Cauchy variables has the same distribution
+        return self
+
     def __add__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Cauchy(self.loc + other, self.scale)
         elif isinstance(other, Cauchy):
             return Cauchy(self.loc + other.loc, self.scale + other.scale)
@@ -64,7 +115,7 @@ class Cauchy(distribution.Distribution):
             raise TypeError(f"Can't add objects of type {type(other)} to Cauchy")
 
     def __sub__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return self.__add__(-other)
         elif isinstance(other, Cauchy):
             return Cauchy(self.loc - other.loc, self.scale + other.scale)
@@ -72,7 +123,7 @@ class Cauchy(distribution.Distribution):
             raise TypeError(f"Can't subtract objects of type {type(other)} from Cauchy")
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Cauchy(other*self.loc, abs(other)*self.scale)
         else:
             raise TypeError(f"Can't multiply objects of type {type(other)} to Cauchy")
@@ -81,16 +132,16 @@ class Cauchy(distribution.Distribution):
         return self.__mul__(1/other)
 
     def __rtruediv__(self, other):
-        assert self.loc == 0, 'Can only invert Cauchy distributions with location 0'
+        assert np.all(self.loc == 0), 'Can only invert Cauchy distributions with location 0'
         if other == 1:
             return Cauchy(0, 1/self.scale)
-        elif isinstance(other, (int, float)):
+        elif isinstance(other, distribution._CONSTANTS):
             return other*Cauchy(0, 1/self.scale)
         else:
             raise TypeError(f"Can't divide objects of type {type(other)} by Cauchy")
 
     def to_standard(self):
-        assert self.loc == 0 and self.scale == 1, \
+        assert np.all(self.loc == 0) and np.all(self.scale == 1), \
                 "Must have Cauchy(0, 1) to convert to StandardCauchy"
         return StandardCauchy()
 
@@ -114,6 +165,9 @@ class StandardCauchy(Cauchy):
     -------------
     Let X be StandardCauchy. Then:
     """
+    _params = ()
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(0, 1)
 
@@ -1,42 +1,81 @@
 import numpy as np
-from scipy.stats import uniform
 from . import distribution
 from . import beta
 
+stats = distribution._LazyModule('scipy.stats')
+
 class CUniform(distribution.Distribution):
+    _params = ('a', 'b')
+    __slots__ = ('a', 'b')
+
     def __init__(self, a=0, b=1):
-        assert b > a, "b must be larger than a"
+        assert np.all(b > a), "b must be larger than a"
 
         # Parameters
         self.a = a
         self.b = b
 
-        # Scipy backend
-        self.sp = uniform(a, b - a)
-
         # Intialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.uniform(self.a, self.b - self.a)
+
     def __repr__(self):
         return f"CUniform(a={self.a}, b={self.b})"
 
+    # Native kernels
+    def _pdf(self, x):
+        pdf = np.where((x < self.a) | (x > self.b), 0., 1 / (self.b - self.a))
+        return np.where(np.isnan(x), np.nan, pdf)
+
+    def _logpdf(self, x):
+        return np.log(self._pdf(x))
+
+    def _cdf(self, x):
+        return np.clip((x - self.a) / (self.b - self.a), 0., 1.)
+
+    def _logcdf(self, x):
+        return np.log(self._cdf(x))
+
+    def _sf(self, x):
+        return np.clip((self.b - x) / (self.b - self.a), 0., 1.)
+
+    def _logsf(self, x):
+        return np.log(self._sf(x))
+
+    def _ppf(self, q):
+        x = self.a + q * (self.b - self.a)
+        return distribution._ppf_bounds(q, x, self.a, self.b)
+
+    def _isf(self, q):
+        x = self.b - q * (self.b - self.a)
+        return distribution._ppf_bounds(q, x, self.b, self.a)
+
+    def _rvs(self, size, rng):
+        return rng.uniform(self.a, self.b, size)
+
     def __add__(self, c):
-        if isinstance(c, (int, float)):
+        if isinstance(c, distribution._CONSTANTS):
             return CUniform(self.a + c, self.b + c)
         else:
             raise TypeError("Only scalar addition for CUniforms is supported.")
 
     def __mul__(self, c):
-        if isinstance(c, (int, float)):
+        if isinstance(c, distribution._CONSTANTS):
             return CUniform(self.a * c, self.b * c)
         else:
             raise TypeError("Only scalar multiplication for CUniforms is supported.")
 
     def __truediv__(self, other):
-        if isinstance(other, (int, float)) and other != 0:
+        if isinstance(other, distribution._CONSTANTS):
+            if not np.all(other != 0):
+                raise ZeroDivisionError("Division by zero error")
             return self.__mul__(1 / other)
         else:
-            raise ZeroDivisionError("Division by zero error")
+            raise TypeError(f"Dividing CUniform by {type(other).__name__} not supported")
 
     def __pow__(self, n):
         assert isinstance(n, int), "Can only raise CUniform to integer power"
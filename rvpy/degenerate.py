@@ -1,8 +1,9 @@
 import numpy as np
-from scipy.stats import uniform
 
 from . import distribution
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Degenerate(distribution.Distribution):
     """
     Degenerate Distribution using the following parameterization:
@@ -23,6 +24,9 @@ class Degenerate(distribution.Distribution):
     Let X be Degenerate, c float. Then:
     * X + c is Degenerate
     """
+    _params = ('k',)
+    __slots__ = ('k',)
+
     def __init__(self, k):
         """
         Parameters
@@ -33,9 +37,6 @@ class Degenerate(distribution.Distribution):
         # Parameters
         self.k = k
 
-        # Scipy backend
-        self.sp = uniform(loc=k, scale=0)
-
         # Moments
         self.mean = k
         self.std = 0
@@ -45,17 +46,44 @@ class Degenerate(distribution.Distribution):
         self.kurtosis = np.nan
         self.entropy = 0
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.uniform(loc=self.k, scale=0)
+
     def __repr__(self):
         return f"Degenerate(k={self.k})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return np.full(size, self.k)
+
+    def _sum_iid(self, n):
+        return Degenerate(n * self.k)
+
+    def _mean_iid(self, n):
+        return self
+
     def pdf(self, x):
         return np.where(x == self.k, 1, 0)
 
+    def logpdf(self, x):
+        return np.where(x == self.k, 0., -np.inf)
+
     def cdf(self, x):
         return np.where(x < self.k, 0, 1)
 
+    def logcdf(self, x):
+        return np.where(x < self.k, -np.inf, 0.)
+
+    def sf(self, x):
+        return np.where(x < self.k, 1, 0)
+
+    def logsf(self, x):
+        return np.where(x < self.k, 0., -np.inf)
+
     def __add__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Degenerate(self.k + other)
         else:
             raise TypeError("Can only add constants to Degenerate")
@@ -1,42 +1,734 @@
-class Distribution:
+import collections
+import functools
+import hashlib
+import importlib
+import threading
+import weakref
+
+import numpy as np
+
+from . import expression, fitting, parallel, tables
+
+class _LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access, so
+    that importing rvpy does not pay for importing scipy.
+    """
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        # Later lookups hit the instance dict and never reach __getattr__
+        self.__dict__.update(vars(module))
+        return getattr(module, attr)
+
+def _is_real(x):
+    """True for real scalars and real-valued numpy arrays"""
+    if isinstance(x, np.ndarray):
+        return x.dtype.kind in 'iuf'
+    return isinstance(x, (int, float, np.integer, np.floating)) and not isinstance(x, bool)
+
+def _is_integer(x):
+    """True for integer scalars and integer-valued numpy arrays"""
+    if isinstance(x, np.ndarray):
+        return x.dtype.kind in 'iu'
+    return isinstance(x, (int, np.integer)) and not isinstance(x, bool)
+
+def _is_float(x):
+    """True for float scalars and float-valued numpy arrays"""
+    if isinstance(x, np.ndarray):
+        return x.dtype.kind == 'f'
+    return isinstance(x, (float, np.floating))
+
+def _as_float(x):
+    """Python float for scalars, float array for batches"""
+    x = np.asarray(x, dtype=float)
+    return float(x) if x.ndim == 0 else x
+
+def _unwrap(x):
+    """Python scalar for numpy scalars and 0-d arrays, anything else unchanged"""
+    if isinstance(x, np.generic) or (isinstance(x, np.ndarray) and x.ndim == 0):
+        return x.item()
+    return x
+
+def _ppf_bounds(q, x, at_zero, at_one):
+    """Pin a native quantile to the support at q == 0, 1 and nan outside [0, 1]"""
+    x = np.where(q == 0, at_zero, x)
+    x = np.where(q == 1, at_one, x)
+    return np.where((q >= 0) & (q <= 1), x, np.nan)
+
+# Types accepted as constants in arithmetic with random variables
+_CONSTANTS = (int, float, np.integer, np.floating, np.ndarray)
+
+# Whether pdf/cdf/quantile use a family's native numpy kernels when it has them
+_native = True
+
+# Library-wide default numpy Generator for sample(), created on first use
+_rng = None
+
+# Whether sample() draws from precomputed tables, the tail mass they drop,
+# and the maximum u-space error of tabulated inverse cdfs
+_tabulated = False
+_tail = 1e-12
+_u_error = 1e-10
+
+# Whether bounded discrete families answer pmf, cdf and quantile from a table
+# of their whole support, and the largest support they tabulate
+_support_tables = False
+_support_max = 2**24
+
+# Whether unsupported arithmetic falls back to Monte Carlo, with how many
+# draws, generated how many at a time
+_monte_carlo = False
+_mc_samples = 2**20
+_mc_chunk = 2**20
+
+def set_backend(name):
+    """
+    Select how pdf, cdf, quantile, and their log and survival variants are
+    evaluated.
+
+    Parameters
+    ----------
+    name : {'native', 'scipy'}
+        'native' (the default) evaluates closed forms directly with numpy and
+        scipy.special ufuncs, and samples with numpy Generator methods, for
+        families that provide them, falling back to scipy.stats for the rest.
+        'scipy' always uses scipy.stats.
+    """
+    global _native
+    assert name in ('native', 'scipy'), "backend must be 'native' or 'scipy'"
+    _native = name == 'native'
+
+def set_rng(seed=None):
+    """
+    Set the library-wide default random number generator used by sample()
+    when no rng is passed.
+
+    Parameters
+    ----------
+    seed : None, int, array of ints, SeedSequence, BitGenerator, or Generator
+        Anything accepted by numpy.random.default_rng. A Generator is used as
+        is; None seeds a fresh generator from OS entropy.
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+def set_tabulated(enabled=True, tail=1e-12, u_error=1e-10):
+    """
+    Enable or disable sampling from precomputed tables.
+
+    While enabled, sample() on a scalar Binomial, Poisson, NegativeBinomial,
+    Geometric or Hypergeometric draws from a Walker/Vose alias table over its
+    support, in O(1) per variate whatever the parameters. (DUniform already
+    samples in O(1) with no table.) Multinomial draws its components as
+    conditional binomials from stacked alias tables, one per component.
+
+    For scalar Beta, T and F, whose exact quantiles are iterative, both
+    sample() and quantile() use a tabulated inverse cdf: a monotone
+    interpolant x(u) refined until |cdf(x(u)) - u| <= u_error, evaluated by
+    vectorized table lookup. Beyond the tail mass on either side, the exact
+    quantile is used. (Families with closed-form quantiles, such as Gumbel
+    or Pareto, already invert faster than a table lookup.)
+
+    Tables are built once per object and settings, and cached on the object.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to sample from tables
+    tail : float
+        Probability mass left out of each end of a table. Alias tables drop it
+        and renormalize the rest. Unbounded supports must be truncated; bounded
+        ones only lose points of negligible mass.
+    u_error : float
+        Maximum absolute error in u-space of tabulated inverse cdfs
+    """
+    global _tabulated, _tail, _u_error
+    assert 0 < tail < 0.5, "tail must be between 0 and 0.5"
+    assert u_error >= 1e-14, "u_error must be at least 1e-14"
+    _tabulated = bool(enabled)
+    _tail = tail
+    _u_error = u_error
+
+def set_support_tables(enabled=True, max_size=2**24):
+    """
+    Enable or disable full-support pmf/cdf tables for bounded discrete families.
+
+    While enabled, the first pmf(), cdf(), prob_interval() or quantile() call
+    on a scalar Binomial, Bernoulli or Hypergeometric computes its pmf over
+    the entire support with a log-space recurrence on successive pmf ratios,
+    anchored at the mode and normalized, together with its cumulative sums.
+    The tables are cached on the object, and later calls are answered by
+    array indexing (quantile by binary search on the cdf). Supports of more
+    than max_size points fall back to the usual evaluation. (DUniform is
+    already answered in O(1) by arithmetic, with no table.)
+
+    Each table takes 16 bytes per support point, e.g. 160 MB for
+    Binomial(10**7, p); see table_info() for the memory held by live tables.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to use support tables
+    max_size : int
+        Largest number of support points to tabulate
+    """
+    global _support_tables, _support_max
+    assert max_size > 0, "max_size must be positive"
+    _support_tables = bool(enabled)
+    _support_max = max_size
+
+def set_monte_carlo(enabled=True, samples=2**20, error=None, chunk_size=2**20):
+    """
+    Enable or disable the Monte Carlo fallback for unsupported arithmetic.
+
+    While enabled, +, -, *, /, ** and the transformation functions on scalar
+    random variables (and constants) that have no closed form, such as
+    Normal(0, 1) + Gamma(2, 1) or Weibull(1, 2) * Beta(2, 3), return an
+    Empirical distribution of independent draws of the result instead of
+    raising TypeError, ValueError or AssertionError. Results that are
+    undefined for some draws (e.g. the log of a Normal) still raise
+    ValueError. The operands are sampled and combined
+    chunk_size draws at a time, so memory beyond the result stays bounded.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to fall back to Monte Carlo
+    samples : int
+        Number of draws of each result
+    error : float
+        Target maximum error of the result's cdf, overriding samples with
+        the Dvoretzky-Kiefer-Wolfowitz bound at 95% confidence,
+        samples = log(2 / 0.05) / (2 error**2), e.g. 1.8 million for 1e-3
+    chunk_size : int
+        Number of draws generated at a time
+    """
+    global _monte_carlo, _mc_samples, _mc_chunk
+    if error is not None:
+        assert 0 < error < 1, "error must be between 0 and 1"
+        samples = int(np.ceil(np.log(2 / 0.05) / (2 * error**2)))
+    assert samples > 0 and chunk_size > 0, "samples and chunk_size must be positive"
+    _monte_carlo = bool(enabled)
+    _mc_samples = int(samples)
+    _mc_chunk = int(chunk_size)
+
+TableInfo = collections.namedtuple('TableInfo', ['tables', 'nbytes'])
+
+def table_info():
+    """
+    Number and total memory of the live full-support tables (see
+    set_support_tables) as a TableInfo(tables, nbytes) named tuple.
+    """
+    live = list(tables._support_tables)
+    return TableInfo(len(live), sum(t.nbytes for t in live))
+
+def _get_rng(rng=None):
+    """Resolve an rng argument to a numpy Generator"""
+    global _rng
+    if rng is None:
+        if _rng is None:
+            _rng = np.random.default_rng()
+        return _rng
+    return np.random.default_rng(rng)
+
+# Whether arithmetic builds an expression graph instead of evaluating
+_lazy = False
+
+# Per-thread evaluation state; while an Expression is being evaluated, the
+# closed-form rules it applies run eagerly even in lazy mode
+_state = threading.local()
+
+# Methods that lazy mode defers and the cache memoizes, when a family defines them
+_ARITHMETIC = (
+    '__add__', '__sub__', '__rsub__', '__mul__', '__truediv__', '__rtruediv__',
+    '__pow__', '__rpow__', '__neg__', 'exp', 'log', 'abs',
+)
+
+def set_lazy(enabled=True):
+    """
+    Enable or disable lazy arithmetic.
+
+    While enabled, +, -, *, /, ** and the transformation functions (exp, log,
+    sqrt, abs, pow) return an Expression instead of a distribution. The
+    expression is only simplified through the closed-form rules when it is
+    evaluated, so long chains of additions such as sum(Normal(m, s) for ...)
+    collapse in one pass.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether arithmetic is lazy
+    """
+    global _lazy
+    _lazy = bool(enabled)
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class _LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry"""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+# Cache of arithmetic results, None while disabled
+_cache = None
+
+def set_cache(maxsize=1024):
+    """
+    Enable, resize, or disable the cache of arithmetic results.
+
+    While enabled, the closed-form arithmetic of every family (+, -, *, /, **,
+    negation, exp, log, abs) is memoized in a thread-safe LRU cache keyed on
+    the operation, the operand types, and the parameters, so repeating a
+    computation with identical inputs returns the cached distribution.
+    Results are shared, so they must not be mutated. Array parameters of the
+    operands (batches, Empirical samples, ...) are keyed by a digest of their
+    values, computed once per object. Calling set_cache starts a new, empty
+    cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached results; 0 or None disables the cache
+    """
+    global _cache
+    _cache = _LRUCache(maxsize) if maxsize else None
+
+def cache_info():
+    """
+    Statistics of the arithmetic cache as a CacheInfo(hits, misses, maxsize,
+    currsize) named tuple, or None if the cache is disabled.
+    """
+    return _cache.info() if _cache is not None else None
+
+def _typed(x):
+    """Hashable cache key for an operand, distinguishing types as well as values"""
+    if isinstance(x, Distribution):
+        # Computed once per object, since array parameters (batches, samples,
+        # lattices, covariances) take a pass over their values
+        cache = _cache_of(x)
+        try:
+            return cache['_typed']
+        except KeyError:
+            key = cache['_typed'] = (type(x), *[_typed(getattr(x, p)) for p in x._params])
+            return key
+    if isinstance(x, np.ndarray):
+        # A digest of the values, so keys stay small however large the array
+        return (np.ndarray, x.dtype.str, x.shape,
+                hashlib.blake2b(np.ascontiguousarray(x).data, digest_size=16).digest())
+    return (type(x), x)
+
+def _arithmetic(method):
+    """
+    Wrap a family's arithmetic so that it returns an Expression in lazy mode,
+    goes through the result cache when enabled, and falls back to Monte Carlo
+    when enabled and the family has no closed form
+    """
+    def call(self, *args):
+        try:
+            return method(self, *args)
+        # Families also assert that combinations they do not cover are excluded
+        except (TypeError, ValueError, AssertionError):
+            if not _monte_carlo:
+                raise
+            from . import montecarlo
+            if not montecarlo.supports(self, *args):
+                raise
+            return montecarlo.fallback(method.__name__, self, *args)
+
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        if getattr(_state, 'evaluating', False):
+            return call(self, *args)
+        if _lazy or any(isinstance(arg, expression.Expression) for arg in args):
+            return expression.Expression(method.__name__, self, *args)
+        cache = _cache
+        if cache is None:
+            return call(self, *args)
+        try:
+            key = (method.__qualname__, _typed(self), *[_typed(arg) for arg in args])
+            return cache.get(key)
+        except TypeError:
+            # Unhashable operand
+            return call(self, *args)
+        except KeyError:
+            pass
+        value = call(self, *args)
+        cache.put(key, value)
+        return value
+    return wrapper
+
+class _cached:
+    """
+    Descriptor that computes an attribute on first access and stores the
+    result in the instance's _cache slot. Subclasses may still assign the
+    attribute directly (see Degenerate).
+    """
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        cache = _cache_of(obj)
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(obj)
+            return value
+
+    def __set__(self, obj, value):
+        _cache_of(obj)[self.name] = value
+
+def _cache_of(obj):
+    """The instance's attribute cache, created on first use"""
+    try:
+        return obj._cache
+    except AttributeError:
+        obj._cache = {}
+        return obj._cache
+
+def _hashable(x):
+    """Hashable stand-in for a parameter, comparing equal for equal values"""
+    if isinstance(x, np.ndarray):
+        return (x.shape, tuple(x.ravel().tolist())) if x.ndim else x.item()
+    return _unwrap(x)
+
+# Whether constructors return shared instances from the intern table
+_interning = False
+
+# Intern tables: canonical instances by value, and by constructor arguments
+# as a shortcut past construction. Weak, so unused instances are still freed.
+_interned = weakref.WeakValueDictionary()
+_interned_args = weakref.WeakValueDictionary()
+
+def set_interning(enabled=True):
+    """
+    Enable or disable interning of distributions.
+
+    While enabled, constructing a distribution equal to one that is still
+    alive returns the existing instance, e.g. repeated StandardNormal() or
+    ChiSq(1) calls share one object along with its cached moments and scipy
+    backend. Batched distributions are never interned. Interned instances are
+    shared, so they must not be mutated. Disabling clears the table.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to intern
+    """
+    global _interning
+    _interning = bool(enabled)
+    if not _interning:
+        _interned.clear()
+        _interned_args.clear()
+
+class _Interned(type):
+    """Metaclass routing construction through the intern table when enabled"""
+    def __call__(cls, *args, **kwargs):
+        if not _interning:
+            return super().__call__(*args, **kwargs)
+        # Argument types are part of the keys, since 0 == 0.0 but Normal(0, 1)
+        # keeps int parameters, and Poisson(3.0) must still be validated
+        try:
+            key = (cls, tuple((type(a), a) for a in args),
+                   tuple(sorted((k, type(v), v) for k, v in kwargs.items())))
+            return _interned_args[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable (batched) parameters
+            return super().__call__(*args, **kwargs)
+        obj = super().__call__(*args, **kwargs)
+        if obj.shape != ():
+            return obj
+        obj = _interned.setdefault(_typed(obj), obj)
+        _interned_args[key] = obj
+        return obj
+
+class Distribution(metaclass=_Interned):
     """
     This is the base Distribution class from which all other univariate
-    distributions inherit. Each subclass also calls the __init__ method herein,
-    which gives the sublcasses their moments, median, and entropy.
+    distributions inherit. Each subclass also calls the __init__ method herein.
+    Moments, median, and entropy are computed lazily on first access and cached
+    on the instance. Instances use __slots__ and compare (and hash) equal when
+    they are of the same type with equal parameters.
+
+    Parameters may be numpy arrays, in which case the object represents a
+    batch of independent random variables of the broadcast parameter shape.
+    All methods and attributes then broadcast elementwise over the batch.
+
+    Attributes
+    ----------
+    mean, var, std, skew, kurtosis : float or array
+        Moments of the random variable
+    median : float or array
+        Median of the random variable
+    entropy : float or array
+        Differential (or Shannon, if discrete) entropy of the random variable
+    shape : tuple
+        Batch shape of the parameters, () for a single random variable
+    sp : scipy.stats frozen distribution
+        Scipy backend, built on first use, so objects that only take part in
+        arithmetic or repr never pay for it
 
     Methods
     -------
-    pdf(x)
-        If continuous, returns the pdf at point x
-    pmf(x)
-        If discrete, returns the pmf at point x
-    cdf(x)
-        Returns CDF at point x
+    pdf(x), logpdf(x)
+        If continuous, returns the pdf (or its log) at point x
+    pmf(x), logpmf(x)
+        If discrete, returns the pmf (or its log) at point x
+    cdf(x), logcdf(x)
+        Returns CDF (or its log) at point x
+    sf(x), logsf(x)
+        Returns the survival function 1 - cdf(x) (or its log) at point x
     prob_interval(a, b)
         For a random variable X, returns P(a <= X < b). This is equivalent to
         cdf(b) - cdf(a)
+    bin_probabilities(edges)
+        Probabilities of the bins between sorted edges, as np.histogram bins
+        them, from a single cdf or sf evaluation per edge
     quantile(x)
         Returns the xth quantile of the random variable
-    sample(*shape)
-        Returns a random sampling of the random variable of the given shape
+    isf(x)
+        Inverse survival function, returns the (1 - x)th quantile
+    sum_iid(n), mean_iid(n)
+        Distribution of the sum (or mean) of n independent copies of the
+        random variable, in closed form where the family has one, otherwise
+        a Lattice computed by convolution by repeated squaring
+    sample(*shape, rng=None, workers=None)
+        Returns a random sampling of the random variable of the given shape.
+        For batches, the batch shape is appended to the given shape. rng may
+        be a seed or numpy Generator; by default the library-wide generator
+        (see set_rng) is used. With workers, the draw is split across a
+        process pool (see rvpy.parallel_sample).
+    sample_iter(total, chunk_size=2**20, rng=None)
+        Yields total draws in chunks of at most chunk_size, for streaming
+        reductions in bounded memory
+    sample_into(out, chunk_size=2**20, rng=None)
+        Fills an existing (possibly memory-mapped) array with draws, chunk_size
+        rows at a time
+    given(likelihood, data, groups=None, chunk_size=2**20, **known)
+        For conjugate priors (Beta, Gamma, Normal), the closed-form posterior
+        given observations data from the family likelihood, e.g.
+        Beta(1, 1).given(Binomial, successes, n=10). data may stream like
+        fit() data, or be a summary from statistics(). Batches of priors are
+        updated elementwise, from data of shape (m,) + shape or from the
+        values of groups, indices into the flattened batch
+
+    Class Methods
+    -------------
+    statistics(data, chunk_size=2**20)
+        Mergeable one-pass summary of data (see rvpy.SufficientStatistics)
+        for the families that support fit()
+    fit(data, method='mle', chunk_size=2**20)
+        Maximum likelihood ('mle') or method of moments ('mom') fit to data,
+        which may be an array, a memory-mapped array, an iterable of chunks,
+        or a (merged) summary from statistics()
+    fit_groups(values, group_ids, method='mle', arrays=False)
+        Fits to the values of every group at once, with grouped reductions
+        and Newton iterations vectorized across groups. Returns the sorted
+        distinct group ids and a batched distribution of the fits in that
+        order, or with arrays=True a dict of parameter arrays, holding NaN
+        for groups without an estimate
     """
+    # Names of the constructor arguments, in positional order
+    _params = ()
+
+    # Subclasses declare slots for the attributes they set, so instances carry
+    # no __dict__
+    __slots__ = ('_cache', '__weakref__')
+
+    # Make numpy defer to our reflected operators, e.g. array + X
+    __array_ufunc__ = None
+
+    # Native kernels taking a float array, overridden by families with closed
+    # forms. Inputs outside the support need not raise warnings; the caller
+    # silences them.
+    _pdf = None
+    _logpdf = None
+    _cdf = None
+    _logcdf = None
+    _sf = None
+    _logsf = None
+    _ppf = None
+    _isf = None
+
+    # Native sampler taking (size, rng) with rng a numpy Generator
+    _rvs = None
+
+    # Whether the family is supported on the integers
+    _discrete = False
+
+    # Kind of precomputed sampling table the family uses when tabulated
+    # sampling is enabled, if any
+    _tabulate = None
+
+    # Closed forms for the sum and mean of n iid copies, taking n
+    _sum_iid = None
+    _mean_iid = None
+
+    # Families that support fit() summarize these transforms of the data (see
+    # fitting.SufficientStatistics) and define _fit(stats, method), returning
+    # the fitted parameters. It must work elementwise on the per-group arrays
+    # of grouped summaries too, giving NaN where there is no estimate.
+    _fit_transforms = None
+
+    # Maximum likelihood without finite sufficient statistics: families define
+    # _fit_passes(params, stats, sums), refining the parameters from _fit by
+    # further passes over the data, where sums(func, where=None) totals the
+    # rows of func(x, i) over the data (per group, and only over the groups
+    # where `where` is true) and params[i] are the parameters of the values x
+    _fit_passes = None
+
+    # Conjugate priors define _given(likelihood, stats, **known), returning the
+    # posterior given the summary stats (see fitting.observations) of
+    # observations from the family likelihood, whose other parameters are the
+    # known keywords, or raise TypeError for families they are not conjugate to
+    _given = None
+
+    # Bounded discrete families with full-support tables define _support(),
+    # returning the integer bounds (lo, hi), and _log_ratio(k), returning
+    # log(pmf(k + 1) / pmf(k)) for a float array of k in [lo, hi)
+    _support = None
+    _log_ratio = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in _ARITHMETIC:
+            if name in vars(cls):
+                setattr(cls, name, _arithmetic(vars(cls)[name]))
+
     def __init__(self):
-        self._moments()
+        pass
+
+    @property
+    def shape(self):
+        return np.broadcast(*[getattr(self, p) for p in self._params]).shape \
+                if self._params else ()
+
+    def __getitem__(self, idx):
+        if self.shape == ():
+            raise TypeError(f"{type(self).__name__} is not batched")
+        params = [np.broadcast_to(getattr(self, p), self.shape)[idx] for p in self._params]
+        return type(self)(*[_unwrap(p) for p in params])
+
+    def _key(self):
+        return (type(self),) + tuple(_hashable(getattr(self, p)) for p in self._params)
+
+    def __eq__(self, other):
+        if not isinstance(other, Distribution):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
 
-    def _moments(self):
-        m, v, s, k = self.sp.stats(moments = 'mvsk')
-        self.mean = float(m)
-        self.var = float(v)
-        self.std = self.var**0.5
-        self.skew = float(s)
-        self.kurtosis = float(k)
+    @_cached
+    def mean(self):
+        return _as_float(self.sp.stats(moments='m'))
 
-        self.median = float(self.sp.median())
-        self.entropy = float(self.sp.entropy())
+    @_cached
+    def var(self):
+        return _as_float(self.sp.stats(moments='v'))
+
+    @_cached
+    def std(self):
+        return self.var**0.5
+
+    @_cached
+    def skew(self):
+        return _as_float(self.sp.stats(moments='s'))
+
+    @_cached
+    def kurtosis(self):
+        return _as_float(self.sp.stats(moments='k'))
+
+    @_cached
+    def median(self):
+        return _as_float(self.sp.median())
+
+    @_cached
+    def entropy(self):
+        return _as_float(self.sp.entropy())
 
     def __pos__(self):
         return self
 
+    # Arithmetic without a closed form in the family; see set_monte_carlo
+    @_arithmetic
+    def __add__(self, other):
+        raise TypeError(f"Adding {type(other).__name__} to {type(self).__name__} not supported")
+
+    @_arithmetic
+    def __mul__(self, other):
+        raise TypeError(f"Multiplying {type(self).__name__} by {type(other).__name__} "
+                        f"not supported")
+
+    @_arithmetic
+    def __truediv__(self, other):
+        raise TypeError(f"Dividing {type(self).__name__} by {type(other).__name__} "
+                        f"not supported")
+
+    @_arithmetic
+    def __rtruediv__(self, other):
+        raise TypeError(f"Dividing {type(other).__name__} by {type(self).__name__} "
+                        f"not supported")
+
+    @_arithmetic
+    def __pow__(self, other):
+        raise TypeError(f"Powers of {type(self).__name__} not supported")
+
+    @_arithmetic
+    def __rpow__(self, other):
+        raise TypeError(f"Powers by {type(self).__name__} not supported")
+
+    @_arithmetic
+    def __neg__(self):
+        raise TypeError(f"Negating {type(self).__name__} not supported")
+
+    @_arithmetic
+    def exp(self):
+        raise TypeError(f"Exponential of {type(self).__name__} not supported")
+
+    @_arithmetic
+    def log(self):
+        raise TypeError(f"Logarithm of {type(self).__name__} not supported")
+
+    @_arithmetic
+    def abs(self):
+        raise TypeError(f"Absolute value of {type(self).__name__} not supported")
+
     def __radd__(self, other):
         return self.__add__(other)
 
@@ -49,20 +741,203 @@ class Distribution:
     def __rmul__(self, other):
         return self.__mul__(other)
 
+    def _evaluate(self, name, x):
+        # Use the native kernel _<name> if there is one, else scipy's <name>
+        kernel = getattr(self, '_' + name)
+        if _native and kernel is not None:
+            with np.errstate(all='ignore'):
+                return kernel(np.asarray(x, dtype=float))[()]
+        return getattr(self.sp, name)(x)
+
     def pdf(self, x):
-        return self.sp.pdf(x)
+        return self._evaluate('pdf', x)
+
+    def logpdf(self, x):
+        return self._evaluate('logpdf', x)
+
+    def _support_table(self):
+        # Full-support pmf/cdf table, if enabled and available for self
+        if _support_tables and self._log_ratio is not None and self.shape == ():
+            return tables._support_table(self)
+        return None
 
     def pmf(self, x):
+        table = self._support_table()
+        if table is not None:
+            return table.pmf(x)[()]
         return self.sp.pmf(x)
 
+    def logpmf(self, x):
+        return self.sp.logpmf(x)
+
     def cdf(self, x):
-        return self.sp.cdf(x)
+        table = self._support_table()
+        if table is not None:
+            return table.cdf(x)[()]
+        return self._evaluate('cdf', x)
+
+    def logcdf(self, x):
+        return self._evaluate('logcdf', x)
+
+    def sf(self, x):
+        return self._evaluate('sf', x)
+
+    def logsf(self, x):
+        return self._evaluate('logsf', x)
 
     def prob_interval(self, a, b):
         return self.cdf(b) - self.cdf(a)
 
+    def bin_probabilities(self, edges):
+        """
+        Probability of each bin [edges[i], edges[i + 1]), the last one closed
+        like np.histogram, so for discrete families the result gives expected
+        histogram counts of integer samples. For batches, the batch shape is
+        appended to the number of bins.
+
+        Each edge is evaluated once: through cdf() below the mean and through
+        sf() above it, so bins in the upper tail are differences of small
+        survival probabilities rather than of cdf values close to 1.
+        """
+        edges = np.asarray(edges, dtype=float)
+        assert edges.ndim == 1 and edges.size > 1, "edges must be a 1-d array of at least 2 edges"
+        assert np.all(np.diff(edges) >= 0), "edges must be sorted"
+        if self._discrete:
+            # P(X < e) = cdf(ceil(e) - 1); the last bin includes its right edge
+            edges = np.append(np.ceil(edges[:-1]) - 1, np.floor(edges[-1]))
+
+        if self.shape == ():
+            upper = edges >= self.mean
+            split = np.count_nonzero(~upper)
+            values = np.concatenate([self.cdf(edges[:split]), self.sf(edges[split:])])
+        else:
+            # One row per edge, one column per batch element
+            upper = edges[:, None] >= np.asarray(self.mean).ravel()
+            values = np.empty(upper.shape)
+            columns = np.arange(upper.shape[1])
+            for row, edge in enumerate(edges):
+                for mask, name in ((~upper[row], 'cdf'), (upper[row], 'sf')):
+                    if mask.all():
+                        values[row] = np.ravel(getattr(self, name)(edge))
+                    elif mask.any():
+                        values[row, mask] = getattr(self._take(columns[mask]), name)(edge)
+
+        # Bins below the mean differ in cdf, bins above it in sf, and the bin
+        # straddling it, if any, is 1 minus both tails
+        probs = values[1:] - values[:-1]
+        np.negative(probs, out=probs, where=upper[:-1])
+        straddle = upper[1:] & ~upper[:-1]
+        probs[straddle] = 1 - values[1:][straddle] - values[:-1][straddle]
+        return probs.reshape(probs.shape[:1] + self.shape)
+
+    def _take(self, index):
+        # Flat batch of the elements of self at the given flat indices
+        return type(self)(*[np.broadcast_to(getattr(self, p), self.shape).ravel()[index]
+                            for p in self._params])
+
     def quantile(self, x):
-        return self.sp.ppf(x)
+        if _tabulated and self._tabulate == 'inverse' and self.shape == ():
+            return tables._table(self).quantile(x)[()]
+        table = self._support_table()
+        if table is not None:
+            return table.quantile(x)[()]
+        return self._evaluate('ppf', x)
+
+    def isf(self, x):
+        return self._evaluate('isf', x)
+
+    def sum_iid(self, n):
+        assert _is_integer(n) and np.all(n > 0), "n must be a positive integer"
+        if self._sum_iid is not None:
+            return self._sum_iid(n)
+        from . import lattice
+        return lattice.convolution_power(self, n)
+
+    def mean_iid(self, n):
+        assert _is_integer(n) and np.all(n > 0), "n must be a positive integer"
+        if self._mean_iid is not None:
+            return self._mean_iid(n)
+        from . import lattice
+        return lattice.Lattice.from_distribution(self.sum_iid(n))._affine(1 / n, 0)
+
+    def given(self, likelihood, data, groups=None, chunk_size=2**20, **known):
+        if self._given is None:
+            raise TypeError(f"{type(self).__name__} is not a conjugate prior")
+        s = fitting.observations(data, self.shape, groups, chunk_size)
+        return self._given(likelihood, s, **known)
+
+    @classmethod
+    def statistics(cls, data, chunk_size=2**20):
+        if '_fit' not in vars(cls):
+            raise TypeError(f"{cls.__name__} does not support fit()")
+        return fitting.statistics(data, cls._fit_transforms, chunk_size)
+
+    @classmethod
+    def fit(cls, data, method='mle', chunk_size=2**20, **kwargs):
+        assert method in ('mle', 'mom'), "method must be 'mle' or 'mom'"
+        if method == 'mle' and cls._fit_passes is not None:
+            fitting.check_passes(data)
+        return cls._fit_summary(cls.statistics(data, chunk_size), data, method, chunk_size,
+                                **kwargs)
+
+    @classmethod
+    def _fit_summary(cls, s, data, method='mle', chunk_size=2**20, **kwargs):
+        # fit(), given the summary s of data
+        params = cls._fit(s, method, **kwargs)
+        if method == 'mle' and cls._fit_passes is not None:
+            params = cls._fit_passes(params, s, lambda func, where=None:
+                                     fitting.sums(data, func, chunk_size))
+        return cls(*[_unwrap(p) for p in params])
+
+    @classmethod
+    def fit_groups(cls, values, group_ids, method='mle', arrays=False, **kwargs):
+        assert method in ('mle', 'mom'), "method must be 'mle' or 'mom'"
+        groups = fitting.Groups(values, group_ids)
+        s = cls.statistics(groups)
+        with np.errstate(all='ignore'):
+            params = cls._fit(s, method, **kwargs)
+            if method == 'mle' and cls._fit_passes is not None:
+                params = cls._fit_passes(params, s, groups.sums)
+        params = [np.broadcast_to(p, groups.labels.shape) for p in params]
+        if arrays:
+            return groups.labels, dict(zip(cls._params, params))
+        missing = np.count_nonzero(~np.all([np.isfinite(p) for p in params], axis=0))
+        if missing:
+            raise ValueError(f"No {cls.__name__} estimate for {missing} of {groups.labels.size} "
+                             f"groups (too few or too similar values); use arrays=True to "
+                             f"get NaN for them")
+        return groups.labels, cls(*params)
+
+    def sample(self, *shape, rng=None, workers=None):
+        if workers is not None:
+            return parallel.parallel_sample(self, *shape, rng=rng, workers=workers)
+        size = shape + self.shape
+        rng = _get_rng(rng)
+        if _tabulated and self._tabulate is not None and self.shape == ():
+            return tables._table(self).sample(size, rng)[()]
+        if _native and self._rvs is not None:
+            return np.asarray(self._rvs(size, rng))[()]
+        return self.sp.rvs(size=size, random_state=rng)
+
+    # Generators fill their output element by element from a single stream, so
+    # consecutive chunks drawn from one Generator concatenate to exactly what
+    # one large sample() call with the same seed would return.
+    def sample_iter(self, total, chunk_size=2**20, rng=None):
+        assert chunk_size > 0, "chunk_size must be positive"
+        rng = _get_rng(rng)
+        for start in range(0, total, chunk_size):
+            yield self.sample(min(chunk_size, total - start), rng=rng)
 
-    def sample(self, *shape):
-        return self.sp.rvs(size=shape)
+    def sample_into(self, out, chunk_size=2**20, rng=None):
+        assert chunk_size > 0, "chunk_size must be positive"
+        rng = _get_rng(rng)
+        shape = out.shape[:out.ndim - len(self.shape)]
+        assert out.shape[len(shape):] == self.shape, \
+                "Trailing dimensions of out must match the batch shape"
+        if shape == ():
+            out[...] = self.sample(rng=rng)
+            return out
+        for start in range(0, shape[0], chunk_size):
+            stop = min(start + chunk_size, shape[0])
+            out[start:stop] = self.sample(stop - start, *shape[1:], rng=rng)
+        return out
@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.stats import randint
 from . import distribution
 
+stats = distribution._LazyModule('scipy.stats')
+
 class DUniform(distribution.Distribution):
     """
     Discrete Uniform Distribution using the following parameterization:
@@ -25,6 +26,10 @@ class DUniform(distribution.Distribution):
     * X + k is DUniform
     * kX and -X are DUniform (not yet implemented)
     """
+    _params = ('a', 'b')
+    __slots__ = ('a', 'b')
+    _discrete = True
+
     def __init__(self, a, b):
         """
         Parameters
@@ -34,25 +39,63 @@ class DUniform(distribution.Distribution):
         b : integer
             Right boundary
         """
-        assert isinstance(a, int) and isinstance(b, int), \
+        assert distribution._is_integer(a) and distribution._is_integer(b), \
                 "DUniform bounds must be integers"
-        assert a < b, "a must be less than b"
+        assert np.all(a < b), "a must be less than b"
 
         # Parameters
         self.a = a
         self.b = b
 
-        # Scipy backend
-        self.sp = randint(a, b + 1)
-
         # Initalize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.randint(self.a, self.b + 1)
+
     def __repr__(self):
         return f"DUniform(a={self.a}, b={self.b})"
 
+    # Native kernels, by arithmetic on the bounds
+    def pmf(self, x):
+        if not distribution._native:
+            return self.sp.pmf(x)
+        x = np.asarray(x, dtype=float)
+        inside = (x >= self.a) & (x <= self.b) & (x == np.floor(x))
+        pmf = np.where(inside, 1 / (self.b - self.a + 1), 0.)
+        return np.where(np.isnan(x), np.nan, pmf)[()]
+
+    def logpmf(self, x):
+        if not distribution._native:
+            return self.sp.logpmf(x)
+        with np.errstate(divide='ignore'):
+            return np.log(self.pmf(x))
+
+    def _cdf(self, x):
+        return np.clip((np.floor(x) - self.a + 1) / (self.b - self.a + 1), 0, 1)
+
+    def _sf(self, x):
+        return 1 - self._cdf(x)
+
+    def _ppf(self, q):
+        # Smallest k with cdf(k) >= q, taking a cdf within a few ulps below q
+        # as equal to it, to allow for rounding in q * n
+        n = self.b - self.a + 1
+        k = np.ceil(q * n)
+        k = np.where((k - 1) / n >= q * (1 - 4 * np.finfo(float).eps), k - 1, k)
+        k = self.a - 1 + k
+        return distribution._ppf_bounds(q, k, self.a - 1, self.b)
+
+    def _isf(self, q):
+        return self._ppf(1 - q)
+
+    def _rvs(self, size, rng):
+        return rng.integers(self.a, self.b, size, endpoint=True)
+
     def __add__(self, c):
-        assert isinstance(c, int), \
+        assert distribution._is_integer(c), \
                 "Only adding integers to DUniform is supported"
 
         return DUniform(self.a + c, self.b + c)
@@ -0,0 +1,174 @@
+import numpy as np
+
+from . import distribution
+
+class Expression:
+    """
+    Unevaluated arithmetic on random variables, built by +, -, *, /, ** and
+    the transformation functions while lazy mode is enabled (see
+    rvpy.set_lazy), or whenever an operand is itself an Expression.
+
+    Nothing is computed until the expression is evaluated, either explicitly
+    with evaluate() or implicitly by accessing any attribute or method of the
+    resulting distribution (mean, pdf, sample, ...). Evaluation applies the
+    same closed-form rules as eager arithmetic, except that a chain of
+    additions is flattened and collapsed in a single pass where the family
+    provides an n-ary rule (Normal, Gamma, ChiSq, Poisson, Binomial and
+    NegativeBinomial), instead of building one intermediate per term.
+
+    Methods
+    -------
+    evaluate()
+        Returns the resulting distribution, computed once and cached
+    """
+    __slots__ = ('op', 'args', '_value')
+
+    # Make numpy defer to our reflected operators, e.g. array + X
+    __array_ufunc__ = None
+
+    def __init__(self, op, *args):
+        # op is the name of the eager method applied to the first argument
+        self.op = op
+        self.args = args
+        self._value = None
+
+    def __getattr__(self, name):
+        # Only public names are delegated, so unset slots and copy/pickle
+        # protocol lookups fail normally instead of evaluating
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.evaluate(), name)
+
+    def __repr__(self):
+        return f"Expression({_format(self)})"
+
+    def evaluate(self):
+        if self._value is None:
+            previous = getattr(distribution._state, 'evaluating', False)
+            distribution._state.evaluating = True
+            try:
+                self._value = _evaluate(self)
+            finally:
+                distribution._state.evaluating = previous
+        return self._value
+
+    def __add__(self, other):
+        return Expression('__add__', self, other)
+
+    def __radd__(self, other):
+        return Expression('__add__', self, other)
+
+    def __sub__(self, other):
+        return Expression('__sub__', self, other)
+
+    def __rsub__(self, other):
+        return Expression('__rsub__', self, other)
+
+    def __mul__(self, other):
+        return Expression('__mul__', self, other)
+
+    def __rmul__(self, other):
+        return Expression('__rmul__', self, other)
+
+    def __truediv__(self, other):
+        return Expression('__truediv__', self, other)
+
+    def __rtruediv__(self, other):
+        return Expression('__rtruediv__', self, other)
+
+    def __pow__(self, other):
+        return Expression('__pow__', self, other)
+
+    def __rpow__(self, other):
+        return Expression('__rpow__', self, other)
+
+    def __neg__(self):
+        return Expression('__neg__', self)
+
+    def __pos__(self):
+        return self
+
+    def exp(self):
+        return Expression('exp', self)
+
+    def log(self):
+        return Expression('log', self)
+
+    def abs(self):
+        return Expression('abs', self)
+
+_SYMBOLS = {
+    '__add__': '{} + {}', '__sub__': '{} - {}', '__rsub__': '{1} - {0}',
+    '__mul__': '{} * {}', '__rmul__': '{1} * {0}',
+    '__truediv__': '{} / {}', '__rtruediv__': '{1} / {0}',
+    '__pow__': '{}**{}', '__rpow__': '{1}**{0}', '__neg__': '-{}',
+}
+
+def _format(node):
+    if not isinstance(node, Expression):
+        return repr(node)
+    if node.op == '__add__':
+        return ' + '.join(_format(term) for term in _terms(node))
+    args = [_format(arg) for arg in node.args]
+    if node.op in _SYMBOLS:
+        args = [f"({arg})" if isinstance(node_arg, Expression) else arg
+                for arg, node_arg in zip(args, node.args)]
+        return _SYMBOLS[node.op].format(*args)
+    return f"{node.op}({args[0]})"
+
+def _terms(node):
+    """Operands of the maximal chain of additions rooted at node, in order"""
+    terms = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        # Nested sums already evaluated are taken as single terms
+        if isinstance(item, Expression) and item.op == '__add__' \
+                and (item is node or item._value is None):
+            stack.extend(reversed(item.args))
+        else:
+            terms.append(item)
+    return terms
+
+def _evaluate(root):
+    # Post-order walk with an explicit stack, so deep chains do not recurse
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if node._value is not None:
+            stack.pop()
+            continue
+        args = _terms(node) if node.op == '__add__' else node.args
+        pending = [a for a in args if isinstance(a, Expression) and a._value is None]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        args = [a._value if isinstance(a, Expression) else a for a in args]
+        if node.op == '__add__':
+            node._value = _sum(args)
+        else:
+            node._value = getattr(args[0], node.op)(*args[1:])
+    return root._value
+
+def _sum(terms):
+    """Sum of distributions and constants in one pass where possible"""
+    rvs = [t for t in terms if isinstance(t, distribution.Distribution)]
+    constant = sum(t for t in terms if not isinstance(t, distribution.Distribution))
+    if not rvs:
+        return constant
+
+    # Use the n-ary rule of the most specific family all terms belong to
+    for cls in type(rvs[0]).__mro__:
+        if '_sum' in vars(cls) and all(isinstance(t, cls) for t in rvs):
+            total = cls._sum(rvs)
+            break
+    else:
+        total = rvs[0]
+        for t in rvs[1:]:
+            total = total + t
+
+    # Adding zero (e.g. the start value of sum()) is always the identity
+    if np.all(np.equal(constant, 0)):
+        return total
+    return total + constant
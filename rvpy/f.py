@@ -1,8 +1,9 @@
 import numpy as np
-from scipy.stats import f
 from . import distribution
 from . import t
 
+stats = distribution._LazyModule('scipy.stats')
+
 class F(distribution.Distribution):
     """
     Snedecor's F Distribution
@@ -22,6 +23,10 @@ class F(distribution.Distribution):
     -------------
     None implemented
     """
+    _params = ('df1', 'df2')
+    __slots__ = ('df1', 'df2')
+    _tabulate = 'inverse'
+
     def __init__(self, df1, df2):
         """
         Parameters
@@ -31,17 +36,23 @@ class F(distribution.Distribution):
         df2 : float, positive
             Denominator degrees of freedom
         """
-        assert df1 > 0 and df2 > 0, "degrees of freedom must be positive"
+        assert np.all(df1 > 0) and np.all(df2 > 0), "degrees of freedom must be positive"
 
         # Parameters
         self.df1 = df1
         self.df2 = df2
 
-        # Scipy backend
-        self.sp = f(df1, df2)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.f(self.df1, self.df2)
+
     def __repr__(self):
         return f"F(df1={self.df1}, df2={self.df2})"
+
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.f(self.df1, self.df2, size)
@@ -0,0 +1,277 @@
+import numpy as np
+
+# Transforms of the data that families summarize for fitting
+_TRANSFORMS = {
+    'x': lambda x: x,
+    'log': np.log,
+    'log1m': lambda x: np.log1p(-x),
+}
+
+def trigamma(x):
+    """
+    polygamma(1, x) for positive x, for Newton slopes: six steps of the
+    recurrence, then the asymptotic series from x + 6. Accurate to about
+    1e-12 relative, and several times faster than scipy's.
+    """
+    x = np.asarray(x, dtype=float)
+    total = sum(1 / (x + k)**2 for k in range(6))
+    z = 1 / (x + 6)
+    z2 = z * z
+    return total + z + z2/2 + z*z2*(1/6 - z2*(1/30 - z2*(1/42 - z2*(1/30 - z2*5/66))))
+
+def newton(step, x, args=(), rtol=1e-10, maxiter=100):
+    """
+    Newton's method x -= step(*x, *args) for the parameter arrays x, elementwise
+    over independent problems (e.g. the groups of a grouped fit), iterating
+    only on the problems not yet converged. NaN steps, from problems without
+    a solution, count as converged.
+    """
+    shape = np.shape(x[0])
+    x = [np.array(v, dtype=float, ndmin=1).ravel() for v in x]
+    args = [np.broadcast_to(a, shape).ravel() for a in args]
+    active = np.arange(x[0].size)
+    for _ in range(maxiter):
+        current = [v[active] for v in x]
+        steps = step(*current, *[a[active] for a in args])
+        moving = np.zeros(active.size, dtype=bool)
+        for v, c, d in zip(x, current, steps):
+            v[active] = c - d
+            moving |= np.abs(d) > rtol * np.abs(c - d)
+        active = active[moving]
+        if active.size == 0:
+            break
+    return [v.reshape(shape) for v in x]
+
+class SufficientStatistics:
+    """
+    One-pass, mergeable summary of a data set: its size, minimum and maximum,
+    and the mean and centered sum of squares of each of a family's transforms
+    of the data (the data itself, its log, log(1 - x), ...).
+
+    Summaries of disjoint parts of a data set merge exactly with +, in any
+    order (Chan et al.'s pairwise update, which avoids the cancellation of
+    raw sums of squares), and pickle, so data can be summarized in parallel
+    or out of core and fitted afterwards:
+
+        parts = pool.map(Gamma.statistics, chunks)
+        Gamma.fit(sum(parts))
+
+    Summaries of grouped data (see Groups) hold one entry per group in each
+    of n, min, max, and the rows of mean and m2.
+
+    Attributes
+    ----------
+    transforms : tuple of str
+        Names of the summarized transforms
+    n : int
+        Number of observations
+    min, max : float
+        Smallest and largest observation
+    mean, m2 : arrays of floats
+        Mean and centered sum of squares of each transform
+    """
+    __slots__ = ('transforms', 'n', 'min', 'max', 'mean', 'm2')
+
+    def __init__(self, transforms, n=0, min=np.inf, max=-np.inf, mean=None, m2=None):
+        self.transforms = tuple(transforms)
+        self.n = n
+        self.min = min
+        self.max = max
+        self.mean = np.zeros(len(self.transforms)) if mean is None else mean
+        self.m2 = np.zeros(len(self.transforms)) if m2 is None else m2
+
+    @classmethod
+    def of(cls, x, transforms):
+        """Summary of one chunk of data"""
+        x = np.asarray(x, dtype=float).ravel()
+        if x.size == 0:
+            return cls(transforms)
+        values = [_TRANSFORMS[name](x) for name in transforms]
+        mean = np.array([v.mean() for v in values])
+        m2 = np.array([np.sum((v - m)**2) for v, m in zip(values, mean)])
+        return cls(transforms, x.size, float(x.min()), float(x.max()), mean, m2)
+
+    def __repr__(self):
+        return f"SufficientStatistics(transforms={self.transforms}, n={self.n})"
+
+    def __add__(self, other):
+        if not isinstance(other, SufficientStatistics):
+            raise TypeError(f"Can't add objects of type {type(other)} to SufficientStatistics")
+        if other.transforms != self.transforms:
+            raise ValueError("Can only merge summaries of the same transforms")
+        n = self.n + other.n
+        weight = other.n / np.maximum(n, 1)
+        delta = other.mean - self.mean
+        mean = self.mean + delta * weight
+        m2 = self.m2 + other.m2 + delta**2 * self.n * weight
+        return SufficientStatistics(self.transforms, n, np.minimum(self.min, other.min),
+                                    np.maximum(self.max, other.max), mean, m2)
+
+    def __radd__(self, other):
+        # Lets sum() start from 0
+        if isinstance(other, int) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def subset(self, transforms):
+        """Summary of some of the summarized transforms"""
+        rows = [self.transforms.index(name) for name in transforms]
+        return SufficientStatistics(transforms, self.n, self.min, self.max,
+                                    self.mean[rows], self.m2[rows])
+
+    def mean_of(self, name):
+        """Mean of a transform of the data"""
+        return self.mean[self.transforms.index(name)]
+
+    def var_of(self, name):
+        """Variance (with denominator n) of a transform of the data"""
+        return self.m2[self.transforms.index(name)] / self.n
+
+class Groups:
+    """
+    Values split into groups by label, for grouped fits: labels holds the
+    sorted distinct group ids, and index the position of each value's group
+    in labels. With size, the ids are indices into size groups, some of
+    which may be empty, and labels is range(size).
+    """
+    __slots__ = ('values', 'labels', 'index')
+
+    def __init__(self, values, group_ids, size=None):
+        values = np.asarray(values, dtype=float).ravel()
+        group_ids = np.asarray(group_ids).ravel()
+        assert values.shape == group_ids.shape, "values and group_ids must have the same size"
+        assert values.size > 0, "Cannot fit to empty data"
+
+        if size is not None:
+            assert group_ids.dtype.kind in 'iu' and group_ids.min() >= 0 \
+                    and group_ids.max() < size, f"group ids must be indices below {size}"
+            self.labels = np.arange(size)
+            self.index = group_ids
+        # Dense integer ids 0, ..., G - 1 are already indices, which saves a
+        # sort; ids up to the number of values keep bincount small
+        elif group_ids.dtype.kind in 'iu' and group_ids.min() >= 0 \
+                and group_ids.max() < group_ids.size and np.all(np.bincount(group_ids) > 0):
+            self.labels = np.arange(group_ids.max() + 1)
+            self.index = group_ids
+        else:
+            self.labels, self.index = np.unique(group_ids, return_inverse=True)
+        self.values = values
+
+    def sum(self, x):
+        """Sum of x over each group"""
+        return np.bincount(self.index, x, minlength=self.labels.size)
+
+    def sums(self, func, where=None):
+        """Sums over each group of the rows of func(values, index), as one row per
+        row of func, where index gives the group of each value; only over the
+        groups where `where` is true, if given, and zero for the others"""
+        values, index = self.values, self.index
+        if where is not None:
+            keep = where[index]
+            values, index = values[keep], index[keep]
+        return np.array([np.bincount(index, row, minlength=self.labels.size)
+                         for row in func(values, index)])
+
+    def statistics(self, transforms):
+        n = np.bincount(self.index, minlength=self.labels.size)
+        lo = np.full(self.labels.size, np.inf)
+        hi = np.full(self.labels.size, -np.inf)
+        np.minimum.at(lo, self.index, self.values)
+        np.maximum.at(hi, self.index, self.values)
+        mean, m2 = [], []
+        for name in transforms:
+            t = _TRANSFORMS[name](self.values)
+            # Empty groups have mean and m2 zero
+            mean.append(self.sum(t) / np.maximum(n, 1))
+            m2.append(self.sum((t - mean[-1][self.index])**2))
+        return SufficientStatistics(transforms, n, lo, hi, np.array(mean), np.array(m2))
+
+def _is_array(data):
+    # Lists and tuples are chunks, unless they hold plain numbers
+    if isinstance(data, (list, tuple)):
+        return all(np.ndim(item) == 0 for item in data)
+    return isinstance(data, np.ndarray)
+
+def _chunks(data, chunk_size):
+    """
+    Flat float chunks of an array (or memmap, or list of numbers), or of an
+    iterable of chunks such as a list of arrays
+    """
+    assert chunk_size > 0, "chunk_size must be positive"
+    if not _is_array(data):
+        for chunk in data:
+            yield np.asarray(chunk, dtype=float).ravel()
+        return
+    data = np.asarray(data)
+    if data.ndim == 0:
+        data = data.reshape(1)
+    rows = max(1, chunk_size // max(1, int(np.prod(data.shape[1:]))))
+    for start in range(0, data.shape[0], rows):
+        yield np.asarray(data[start:start + rows], dtype=float).ravel()
+
+def statistics(data, transforms, chunk_size=2**20):
+    """Summary of data in one pass, chunk_size values at a time"""
+    if isinstance(data, Groups):
+        return data.statistics(transforms)
+    if isinstance(data, SufficientStatistics):
+        if not set(transforms) <= set(data.transforms):
+            raise ValueError(f"Summary of {data.transforms} given, {tuple(transforms)} needed")
+        return data if data.transforms == tuple(transforms) else data.subset(transforms)
+    total = SufficientStatistics(transforms)
+    for chunk in _chunks(data, chunk_size):
+        total = total + SufficientStatistics.of(chunk, transforms)
+    assert total.n > 0, "Cannot fit to empty data"
+    return total
+
+def observations(data, shape=(), groups=None, chunk_size=2**20):
+    """
+    Summary of the observations of each element of a batch of the given
+    shape, for conjugate updates: n, min, max and the single rows of mean
+    and m2 broadcast against shape. Observations of a single random variable
+    stream like statistics(), and may be empty. For a batch, data has shape
+    shape (one observation each) or (m,) + shape (m each), or data are the
+    values of the groups group_ids, indices into the flattened batch.
+    """
+    if isinstance(data, SufficientStatistics):
+        return statistics(data, ('x',))
+    if groups is not None:
+        assert shape != (), "groups apply to batches only"
+        s = Groups(data, groups, int(np.prod(shape))).statistics(('x',))
+        return SufficientStatistics(('x',), s.n.reshape(shape), s.min.reshape(shape),
+                                    s.max.reshape(shape), s.mean.reshape((1,) + shape),
+                                    s.m2.reshape((1,) + shape))
+
+    total = SufficientStatistics(('x',))
+    if shape == ():
+        for chunk in _chunks(data, chunk_size):
+            total = total + SufficientStatistics.of(chunk, ('x',))
+        return total
+    x = np.asarray(data, dtype=float)
+    if x.shape == shape:
+        x = x[None]
+    assert x.shape[1:] == shape, f"Observations must have shape {shape} or (m,) + {shape}"
+    rows = max(1, chunk_size // int(np.prod(shape)))
+    for start in range(0, x.shape[0], rows):
+        chunk = x[start:start + rows]
+        mean = chunk.mean(axis=0)
+        total = total + SufficientStatistics(('x',), chunk.shape[0], chunk.min(axis=0),
+                                             chunk.max(axis=0), mean[None],
+                                             np.sum((chunk - mean)**2, axis=0)[None])
+    return total
+
+def check_passes(data):
+    """Fits whose likelihood equations have no finite sufficient statistics
+    pass over the data repeatedly, which only arrays, memmaps and lists or
+    tuples of chunks allow"""
+    if not isinstance(data, (np.ndarray, list, tuple)):
+        raise TypeError("Maximum likelihood for this family takes several passes over "
+                        "the data; pass an array, memmap or list of chunks, "
+                        "or use method='mom'")
+
+def sums(data, func, chunk_size=2**20):
+    """
+    Totals of the rows of func(chunk, ()) over a further pass through data:
+    the ungrouped counterpart of Groups.sums, where indexing the fitted
+    parameters with () leaves them as they are
+    """
+    return sum(np.asarray(func(chunk, ())).sum(axis=-1) for chunk in _chunks(data, chunk_size))
@@ -1,6 +1,68 @@
 import numpy as np
-from scipy.stats import gamma
-from . import distribution, laplace, weibull
+from . import distribution, fitting, laplace, normal, poisson, weibull
+
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
+# Below this, the logs of gammainc and gammaincc are computed from the power
+# series and the continued fraction instead, as both underflow soon after
+_TINY = 1e-250
+_ITERATIONS = 1000
+
+def _log_prefactor(a, z):
+    """log(z**a exp(-z) / Gamma(a)), without cancellation for large a"""
+    large = a >= 100
+    b = np.where(large, a, 100.)
+    d = (z - b) / b
+    log_ratio = np.where(np.abs(d) < 0.5, np.log1p(d), np.log(z) - np.log(b))
+    stirling = 1/(12*b) - 1/(360*b**3) + 1/(1260*b**5)
+    log_large = 0.5*np.log(b / (2*np.pi)) - stirling + b*(log_ratio - d)
+    return np.where(large, log_large, special.xlogy(a, z) - z - special.gammaln(a))
+
+def _log_lower(a, z):
+    """log P(a, z) from its power series, for z well below a"""
+    term = total = 1 / a
+    n = a
+    for _ in range(_ITERATIONS):
+        n = n + 1
+        term = term * z / n
+        total = total + term
+        if np.all(term <= total * 1e-17):
+            break
+    else:
+        # The terms decrease at least geometrically from here on
+        ratio = z / (n + 1)
+        total = total + term * ratio / (1 - ratio)
+    return _log_prefactor(a, z) + np.log(total)
+
+def _log_upper(a, z):
+    """log Q(a, z) from its continued fraction (modified Lentz), for z above a"""
+    tiny = 1e-300
+    b = z + 1 - a
+    c = np.full_like(b, 1 / tiny)
+    d = 1 / b
+    h = d
+    for i in range(1, _ITERATIONS):
+        an = -i * (i - a)
+        b = b + 2
+        d = an * d + b
+        d = np.where(np.abs(d) < tiny, tiny, d)
+        c = b + an / c
+        c = np.where(np.abs(c) < tiny, tiny, c)
+        d = 1 / d
+        h = h * d * c
+        if np.all(np.abs(d * c - 1) < 1e-16):
+            break
+    return _log_prefactor(a, z) + np.log(h)
+
+def _log_tail(p, func, *args):
+    """log(p), with func(*args) where p underflows and args are positive"""
+    logp = np.array(np.log(p))
+    args = np.broadcast_arrays(*args, logp)[:-1]
+    far = (p < _TINY) & np.all([(arg > 0) & np.isfinite(arg) for arg in args], axis=0)
+    if np.any(far):
+        logp[far] = func(*[arg[far].astype(float) for arg in args])
+    return logp
 
 class Gamma(distribution.Distribution):
     """
@@ -23,6 +85,10 @@ class Gamma(distribution.Distribution):
         Converts self to ChiSq if beta == 2
     mgf(t)
         Moment generating function
+    given(likelihood, data, mu=None)
+        Posterior given observations of Poisson(rate), of Exponential with
+        rate 1 / scale, or of Normal(mu, 1 / sqrt(rate)) with mu known, for
+        the rate with this prior
 
     Relationships
     -------------
@@ -30,6 +96,10 @@ class Gamma(distribution.Distribution):
     * X + Y is Gamma if betas match
     * cX is Gamma
     """
+    _params = ('alpha', 'beta')
+    __slots__ = ('alpha', 'beta')
+    _fit_transforms = ('x', 'log')
+
     def __init__(self, alpha, beta):
         """
         Parameters
@@ -39,29 +109,110 @@ class Gamma(distribution.Distribution):
         beta : float, positive
             Scale parameter
         """
-        assert alpha > 0 and beta > 0, "alpha and beta must be positive"
+        assert np.all(alpha > 0) and np.all(beta > 0), "alpha and beta must be positive"
 
         self.alpha = alpha
         self.beta = beta
 
-        # Scipy backend
-        self.sp = gamma(a=alpha, scale=beta)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.gamma(a=self.alpha, scale=self.beta)
+
     def __repr__(self):
         return f"Gamma(alpha={self.alpha}, beta={self.beta})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(self._logpdf(x))
+
+    def _logpdf(self, x):
+        logpdf = special.xlogy(self.alpha - 1, x) - x / self.beta \
+                - special.gammaln(self.alpha) - self.alpha * np.log(self.beta)
+        return np.where(x < 0, -np.inf, logpdf)
+
+    def _cdf(self, x):
+        return np.where(x < 0, 0., special.gammainc(self.alpha, x / self.beta))
+
+    def _logcdf(self, x):
+        return _log_tail(self._cdf(x), _log_lower, self.alpha, x / self.beta)
+
+    def _sf(self, x):
+        return np.where(x < 0, 1., special.gammaincc(self.alpha, x / self.beta))
+
+    def _logsf(self, x):
+        return _log_tail(self._sf(x), _log_upper, self.alpha, x / self.beta)
+
+    def _ppf(self, q):
+        x = self.beta * special.gammaincinv(self.alpha, q)
+        return distribution._ppf_bounds(q, x, 0., np.inf)
+
+    def _isf(self, q):
+        x = self.beta * special.gammainccinv(self.alpha, q)
+        return distribution._ppf_bounds(q, x, np.inf, 0.)
+
+    def _rvs(self, size, rng):
+        return rng.gamma(self.alpha, self.beta, size)
+
+    def _sum_iid(self, n):
+        return Gamma(n * self.alpha, self.beta)
+
+    def _mean_iid(self, n):
+        return Gamma(n * self.alpha, self.beta / n)
+
+    def _given(self, likelihood, s, mu=None):
+        # Updates of the shape and of the rate 1 / beta
+        if issubclass(likelihood, poisson.Poisson):
+            assert np.all(s.min >= 0), "Poisson observations must be nonnegative"
+            shape, rate = s.n * s.mean_of('x'), s.n
+        elif issubclass(likelihood, Exponential):
+            assert np.all(s.min >= 0), "Exponential observations must be nonnegative"
+            shape, rate = s.n, s.n * s.mean_of('x')
+        elif likelihood is normal.Normal:
+            assert mu is not None, "mu must be given for Normal observations"
+            shape = s.n / 2
+            rate = (s.m2[0] + s.n * (s.mean_of('x') - mu)**2) / 2
+        else:
+            raise TypeError("Gamma is a conjugate prior for Poisson, Exponential "
+                            "and Normal precision only")
+        return Gamma(distribution._unwrap(self.alpha + shape),
+                     distribution._unwrap(self.beta / (1 + self.beta * rate)))
+
+    @classmethod
+    def _fit(cls, s, method):
+        mean = s.mean_of('x')
+        if method == 'mom':
+            alpha = mean**2 / s.var_of('x')
+            return alpha, mean / alpha
+        # Newton's method on log(alpha) - digamma(alpha) = log(mean) - mean(log x),
+        # from Minka's closed-form approximation
+        d = np.log(mean) - s.mean_of('log')
+        alpha = (3 - d + np.sqrt((d - 3)**2 + 24*d)) / (12*d)
+        step = lambda alpha, d: ((np.log(alpha) - special.digamma(alpha) - d)
+                                 / (1/alpha - fitting.trigamma(alpha)),)
+        alpha, = fitting.newton(step, (alpha,), (d,))
+        return alpha, mean / alpha
+
     def __add__(self, other):
         if isinstance(other, Gamma):
-            if self.beta != other.beta:
+            if np.any(self.beta != other.beta):
                 raise ValueError("Scale paramters of Gamma families must match")
             else:
                 return Gamma(self.alpha + other.alpha, self.beta)
         else:
             raise TypeError("Only addition/subtraction of Gamma families supported")
 
+    @classmethod
+    def _sum(cls, terms):
+        # n-ary form of __add__, used when evaluating lazy sums
+        beta = terms[0].beta
+        if any(np.any(t.beta != beta) for t in terms):
+            raise ValueError("Scale paramters of Gamma families must match")
+        return Gamma(sum(t.alpha for t in terms), beta)
+
     def __sub__(self, other):
         try:
             other = other.to_exponential()
@@ -69,22 +220,25 @@ class Gamma(distribution.Distribution):
         except:
             raise TypeError("Only subtraction of two Exponential random variables currently supported")
 
-        if other.scale == self.to_exponential().scale:
+        if np.all(other.scale == self.to_exponential().scale):
             return laplace.Laplace(0, other.scale)
         else:
             raise TypeError("Difference of Exponentials must share scale parameter")
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Gamma(self.alpha, other*self.beta)
         else:
             raise TypeError("Only multiplication by scalar supported")
 
     def __truediv__(self, other):
-        if isinstance(other, (int, float)) and other != 0:
+        if isinstance(other, distribution._CONSTANTS):
+            if not np.all(other != 0):
+                raise ZeroDivisionError("Cannot divide by zero!")
             return self.__mul__(1 / other)
         else:
-            raise ZeroDivisionError("Cannot divide by zero!")
+            raise TypeError(f"Dividing {type(self).__name__} by {type(other).__name__} "
+                            f"not supported")
 
     def mgf(self, t):
         return np.where(t < 1/self.beta,
@@ -93,11 +247,11 @@ class Gamma(distribution.Distribution):
                )
 
     def to_exponential(self):
-        assert self.alpha == 1, "Alpha must be 1 to downcast to Exponential"
+        assert np.all(self.alpha == 1), "Alpha must be 1 to downcast to Exponential"
         return Exponential(self.beta)
 
     def to_chisq(self):
-        assert self.beta == 2, "Beta must be 2 to downcast to ChiSq"
+        assert np.all(self.beta == 2), "Beta must be 2 to downcast to ChiSq"
         return ChiSq(2*self.alpha)
 
 class Exponential(Gamma):
@@ -125,6 +279,10 @@ class Exponential(Gamma):
     * sqrt(X) is Rayleigh (not yet implemented)
     * cX is Exponential
     """
+    _params = ('scale',)
+    __slots__ = ('scale', 'rate')
+    _fit_transforms = ('x',)
+
     def __init__(self, scale):
         """
         Parameters
@@ -142,8 +300,43 @@ class Exponential(Gamma):
     def __repr__(self):
         return f"Exponential(scale={self.scale})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.where(x < 0, 0., np.exp(-x / self.scale) / self.scale)
+
+    def _logpdf(self, x):
+        return np.where(x < 0, -np.inf, -x / self.scale - np.log(self.scale))
+
+    def _cdf(self, x):
+        return np.where(x < 0, 0., -np.expm1(-x / self.scale))
+
+    def _logcdf(self, x):
+        return np.where(x < 0, -np.inf, np.log(-np.expm1(-x / self.scale)))
+
+    def _sf(self, x):
+        return np.where(x < 0, 1., np.exp(-x / self.scale))
+
+    def _logsf(self, x):
+        return np.where(x < 0, 0., -x / self.scale)
+
+    def _ppf(self, q):
+        x = -self.scale * np.log1p(-q)
+        return distribution._ppf_bounds(q, x, 0., np.inf)
+
+    def _isf(self, q):
+        x = -self.scale * np.log(q)
+        return distribution._ppf_bounds(q, x, np.inf, 0.)
+
+    def _rvs(self, size, rng):
+        return rng.exponential(self.scale, size)
+
+    @classmethod
+    def _fit(cls, s, method):
+        # Both methods give the sample mean
+        return s.mean_of('x'),
+
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Exponential(other*self.scale)
         else:
             raise TypeError("Only multiplication by scalar supported")
@@ -181,6 +374,9 @@ class ChiSq(Gamma):
     Let X, Y be Chi Squared. Then:
     * X + Y is Chi Squared
     """
+    _params = ('df',)
+    __slots__ = ('df',)
+
     def __init__(self, df):
         """
         Parameters
@@ -188,7 +384,7 @@ class ChiSq(Gamma):
         df : integer, positive
             Degrees of freedom
         """
-        assert isinstance(df, int), "Only integer degrees of freedome allowed."
+        assert distribution._is_integer(df), "Only integer degrees of freedome allowed."
         # Get Gamma distribution initialization
         super().__init__(alpha=df/2, beta=2)
 
@@ -198,12 +394,24 @@ class ChiSq(Gamma):
     def __repr__(self):
         return f"ChiSq(df={self.df})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.chisquare(self.df, size)
+
+    def _sum_iid(self, n):
+        return ChiSq(n * self.df)
+
     def __add__(self, other):
         if isinstance(other, ChiSq):
             return ChiSq(self.df + other.df)
         else:
             return self.to_gamma() + other
 
+    @classmethod
+    def _sum(cls, terms):
+        # n-ary form of __add__, used when evaluating lazy sums
+        return ChiSq(sum(t.df for t in terms))
+
     def to_gamma(self):
         return Gamma(alpha=self.df/2, beta=2)
 
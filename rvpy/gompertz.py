@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.stats import gompertz
 from . import distribution
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Gompertz(distribution.Distribution):
     """
     Gompertz Distribution using the following parameterization:
@@ -23,6 +24,9 @@ class Gompertz(distribution.Distribution):
     -------------
     None implemented
     """
+    _params = ('eta', 'b')
+    __slots__ = ('eta', 'b')
+
     def __init__(self, eta, b):
         """
         Parameters
@@ -32,18 +36,53 @@ class Gompertz(distribution.Distribution):
         b : float, positive
             Inverse scale parameter
         """
-        assert eta > 0, "eta must be positive"
-        assert b > 0, "b must be positive"
+        assert np.all(eta > 0), "eta must be positive"
+        assert np.all(b > 0), "b must be positive"
 
         # Parameters
         self.eta = eta
         self.b = b
 
-        # Scipy backend
-        self.sp = gompertz(c=eta, scale=1/b)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.gompertz(c=self.eta, scale=1/self.b)
+
     def __repr__(self):
         return f"Gompertz(eta={self.eta}, b={self.b})"
+
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(self._logpdf(x))
+
+    def _logpdf(self, x):
+        bx = self.b * x
+        logpdf = np.log(self.b * self.eta) + bx - self.eta * np.expm1(bx)
+        return np.where(x < 0, -np.inf, logpdf)
+
+    def _cdf(self, x):
+        return -np.expm1(self._logsf(x))
+
+    def _logcdf(self, x):
+        return np.log(self._cdf(x))
+
+    def _sf(self, x):
+        return np.exp(self._logsf(x))
+
+    def _logsf(self, x):
+        return np.where(x < 0, 0., -self.eta * np.expm1(self.b * x))
+
+    def _ppf(self, q):
+        x = np.log1p(-np.log1p(-q) / self.eta) / self.b
+        return distribution._ppf_bounds(q, x, 0., np.inf)
+
+    def _isf(self, q):
+        x = np.log1p(-np.log(q) / self.eta) / self.b
+        return distribution._ppf_bounds(q, x, np.inf, 0.)
+
+    def _rvs(self, size, rng):
+        # Inverse transform sampling
+        return self._ppf(rng.random(size))
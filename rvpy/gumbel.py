@@ -1,8 +1,9 @@
 import numpy as np
-from scipy.stats import gumbel_r
 from . import distribution
 from . import logistic
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Gumbel(distribution.Distribution):
     """
     Gumbel Distribution using the following parameterization:
@@ -20,13 +21,20 @@ class Gumbel(distribution.Distribution):
 
     Methods
     -------
-    None
+    fit(data, method='mle', chunk_size=2**20)
+        Class method. Maximum likelihood takes one pass over the data per
+        Newton step, so data must be an array or memmap rather than a stream
+        of chunks or a summary.
 
     Relationships
     -------------
     Let X, Y be Gumbel with the same beta. Then:
     * X - Y is Logistic 
     """
+    _params = ('mu', 'beta')
+    __slots__ = ('mu', 'beta')
+    _fit_transforms = ('x',)
+
     def __init__(self, mu, beta):
         """
         Parameters
@@ -36,23 +44,89 @@ class Gumbel(distribution.Distribution):
         beta : float, positive
             Scale parameter
         """
-        assert beta > 0, "scale parameter must be positive"
+        assert np.all(beta > 0), "scale parameter must be positive"
 
         # Parameters
         self.mu = mu
         self.beta = beta
         
-        # Scipy backend
-        self.sp = gumbel_r(loc=mu, scale=beta)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.gumbel_r(loc=self.mu, scale=self.beta)
+
     def __repr__(self):
         return f"Gumbel(mu={self.mu}, beta={self.beta})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(self._logpdf(x))
+
+    def _logpdf(self, x):
+        z = (x - self.mu) / self.beta
+        return -(z + np.exp(-z)) - np.log(self.beta)
+
+    def _cdf(self, x):
+        return np.exp(self._logcdf(x))
+
+    def _logcdf(self, x):
+        return -np.exp(-(x - self.mu) / self.beta)
+
+    def _sf(self, x):
+        return -np.expm1(self._logcdf(x))
+
+    def _logsf(self, x):
+        # log(1 - exp(-t)) is log(t) = -z to double precision once t underflows
+        z = (x - self.mu) / self.beta
+        t = np.exp(-z)
+        return np.where(t < 1e-300, -z, np.log(-np.expm1(-t)))
+
+    def _ppf(self, q):
+        x = self.mu - self.beta * np.log(-np.log(q))
+        return distribution._ppf_bounds(q, x, -np.inf, np.inf)
+
+    def _isf(self, q):
+        x = self.mu - self.beta * np.log(-np.log1p(-q))
+        return distribution._ppf_bounds(q, x, np.inf, -np.inf)
+
+    def _rvs(self, size, rng):
+        # -log(E) is standard Gumbel for E standard Exponential, and faster
+        # than Generator.gumbel
+        return self.mu - self.beta * np.log(rng.standard_exponential(size))
+
+    @classmethod
+    def _fit(cls, s, method):
+        # Moment estimates, also the starting point of maximum likelihood
+        beta = np.sqrt(6 * s.var_of('x')) / np.pi
+        return s.mean_of('x') - np.euler_gamma * beta, beta
+
+    @classmethod
+    def _fit_passes(cls, params, s, sums):
+        # Newton's method on beta = -sum(d w) / sum(w), with d = x - mean(x)
+        # and w = exp(-d / beta)
+        mean = np.asarray(s.mean_of('x'))
+        beta = np.asarray(params[1], dtype=float)
+        def moments(x, i):
+            d = x - mean[i]
+            w = np.exp(-d / beta[i])
+            return w, d * w, d**2 * w
+
+        active = np.ones(np.shape(beta), dtype=bool)
+        for _ in range(100):
+            a, b, c = sums(moments, active)
+            step = np.where(active, (beta + b/a) / (1 + (c/a - (b/a)**2) / beta**2), 0)
+            beta = beta - step
+            active &= np.abs(step) > 1e-10 * beta
+            if not np.any(active):
+                break
+        a = sums(moments)[0]
+        return mean - beta * np.log(a / s.n), beta
+
     def __sub__(self, other):
-        if isinstance(other, Gumbel) and self.beta == other.beta:
+        if isinstance(other, Gumbel) and np.all(self.beta == other.beta):
             return logistic.Logistic(self.mu - other.mu, self.beta)
         elif isinstance(other, Gumbel):
             raise ValueError("To subtract two Gumbels, betas must match")
@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.stats import hypergeom
 from . import distribution
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Hypergeometric(distribution.Distribution):
     """
     Hypergeometric Distribution using the following parameterization:
@@ -25,21 +26,39 @@ class Hypergeometric(distribution.Distribution):
     -------------
     None implemented
     """
+    _params = ('N', 'M', 'K')
+    __slots__ = ('N', 'M', 'K')
+    _discrete = True
+    _tabulate = 'alias'
+
     def __init__(self, N, M, K):
-        assert N >= 0 and M >= 0 and K >= 0, \
+        assert np.all(N >= 0) and np.all(M >= 0) and np.all(K >= 0), \
                 "All parameters of hypergeometric distribution must be nonnegative"
-        assert K < N and M < N, "K and M must be less than N"
+        assert np.all(K < N) and np.all(M < N), "K and M must be less than N"
 
         # Parameters
         self.N = N
         self.M = M
         self.K = K
 
-        # Scipy backend
-        self.sp = hypergeom(M=N, n=M, N=K)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.hypergeom(M=self.N, n=self.M, N=self.K)
+
     def __repr__(self):
         return f"Hypergeometric(N={self.N}, M={self.M}, K={self.K})"
+
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.hypergeometric(self.M, self.N - self.M, self.K, size)
+
+    def _support(self):
+        return int(max(0, self.K - (self.N - self.M))), int(min(self.M, self.K))
+
+    def _log_ratio(self, k):
+        return np.log(self.M - k) + np.log(self.K - k) - np.log1p(k) \
+                - np.log(self.N - self.M - self.K + k + 1)
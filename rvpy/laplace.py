@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.stats import laplace
 from . import distribution, gamma
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Laplace(distribution.Distribution):
     """
     Laplace Distribution using the following parameterization:
@@ -19,6 +20,10 @@ class Laplace(distribution.Distribution):
     -------
     abs()
         Returns |self|, which is Exponential
+    fit(data, method='mle', chunk_size=2**20)
+        Class method. The maximum likelihood mu is the median, found by
+        bisection with one pass over the data per step, so data must be an
+        array or memmap rather than a stream of chunks or a summary.
 
     Relationships
     -------------
@@ -26,6 +31,10 @@ class Laplace(distribution.Distribution):
     * X + c is Laplace
     * cX is Laplace
     """
+    _params = ('mu', 'b')
+    __slots__ = ('mu', 'b')
+    _fit_transforms = ('x',)
+
     def __init__(self, mu=0, b=1):
         """
         Parameters
@@ -35,29 +44,94 @@ class Laplace(distribution.Distribution):
         b : float, positive
             Scale parameter
         """
-        assert b > 0, "b must be positive"
+        assert np.all(b > 0), "b must be positive"
 
         # Parameters
         self.mu = mu
         self.b = b
 
-        # Scipy backend
-        self.sp = laplace(loc=mu, scale=b)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.laplace(loc=self.mu, scale=self.b)
+
     def __repr__(self):
         return f"Laplace(mu={self.mu}, b={self.b})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(-np.abs(x - self.mu) / self.b) / (2 * self.b)
+
+    def _logpdf(self, x):
+        return -np.abs(x - self.mu) / self.b - np.log(2 * self.b)
+
+    def _cdf(self, x):
+        z = (x - self.mu) / self.b
+        tail = 0.5 * np.exp(-np.abs(z))
+        return np.where(z < 0, tail, 1 - tail)
+
+    def _logcdf(self, x):
+        z = (x - self.mu) / self.b
+        return np.where(z < 0, np.log(0.5) + z, np.log1p(-0.5 * np.exp(-z)))
+
+    def _sf(self, x):
+        # Symmetric about mu
+        return self._cdf(2*self.mu - x)
+
+    def _logsf(self, x):
+        return self._logcdf(2*self.mu - x)
+
+    def _ppf(self, q):
+        x = np.where(q < 0.5,
+                self.mu + self.b * np.log(2*q),
+                self.mu - self.b * np.log(2 - 2*q))
+        return distribution._ppf_bounds(q, x, -np.inf, np.inf)
+
+    def _isf(self, q):
+        return 2*self.mu - self._ppf(q)
+
+    def _rvs(self, size, rng):
+        return rng.laplace(self.mu, self.b, size)
+
+    @classmethod
+    def _fit(cls, s, method):
+        # Moment estimates, from var = 2 b**2
+        return s.mean_of('x'), np.sqrt(s.var_of('x') / 2)
+
+    @classmethod
+    def _fit_passes(cls, params, s, sums):
+        # mu is the median: bisect [min, max] on the sign of sum(sign(x - mu)),
+        # then b is the mean absolute deviation from it
+        lo = np.array(s.min, dtype=float)
+        hi = np.array(s.max, dtype=float)
+        mu = (lo + hi) / 2
+        def balance(x, i):
+            return np.sign(x - mu[i]),
+
+        active = np.ones(np.shape(mu), dtype=bool)
+        for _ in range(200):
+            above = sums(balance, active)[0]
+            lo = np.where(active & (above > 0), mu, lo)
+            hi = np.where(active & (above < 0), mu, hi)
+            # A zero balance means mu is a median already
+            active &= (above != 0) & (hi - lo > 1e-14 * np.maximum(np.abs(lo), np.abs(hi)))
+            mu = np.where(active, (lo + hi) / 2, mu)
+            if not np.any(active):
+                break
+        deviation = sums(lambda x, i: (np.abs(x - mu[i]),))[0]
+        return mu, deviation / s.n
+
     def __add__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Laplace(self.mu + other, self.b)
         else:
             raise TypeError(f"Can't add objects of type {type(other)} to Laplace")
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Laplace(other*self.mu, abs(other)*self.b)
         else:
             raise TypeError(f"Can't multiply or divide objects of type {type(other)} to Laplace")
@@ -66,5 +140,5 @@ class Laplace(distribution.Distribution):
         return self.__mul__(1/other)
 
     def abs(self):
-        assert self.mu == 0, "Must have mu == 0 for conversion to Exponential"
+        assert np.all(self.mu == 0), "Must have mu == 0 for conversion to Exponential"
         return gamma.Exponential(self.b)
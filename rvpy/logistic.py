@@ -1,8 +1,9 @@
 import numpy as np
-from math import log, exp
-from scipy.stats import logistic, fisk
 from . import distribution
 
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
 class Logistic(distribution.Distribution):
     """
     Logistic Distribution using the following parameterization:
@@ -22,6 +23,10 @@ class Logistic(distribution.Distribution):
     -------
     exp()
         Transforms self to LogLogistic
+    fit(data, method='mle', chunk_size=2**20)
+        Class method. Maximum likelihood takes one pass over the data per
+        Newton step, so data must be an array or memmap rather than a stream
+        of chunks or a summary.
 
     Relationships
     -------------
@@ -29,6 +34,10 @@ class Logistic(distribution.Distribution):
     * aX + b is Logistic
     * exp(X) is Log-Logistic
     """
+    _params = ('loc', 'scale')
+    __slots__ = ('loc', 'scale')
+    _fit_transforms = ('x',)
+
     def __init__(self, loc=0, scale=1):
         """
         Parameters
@@ -38,40 +47,113 @@ class Logistic(distribution.Distribution):
         scale : float, positive
             Scale parameter
         """
-        assert scale > 0, "scale parameter must be positive"
+        assert np.all(scale > 0), "scale parameter must be positive"
 
         # Parameters
         self.loc = loc
         self.scale = scale
 
-        # Scipy backend
-        self.sp = logistic(loc=loc, scale=scale)
-
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.logistic(loc=self.loc, scale=self.scale)
+
     def __repr__(self):
         return f"Logistic(loc={self.loc}, scale={self.scale})"
 
+    # Native kernels
+    def _pdf(self, x):
+        # Symmetric in z, so use |z| to avoid overflow in the tails
+        e = np.exp(-np.abs(x - self.loc) / self.scale)
+        return e / (self.scale * (1 + e)**2)
+
+    def _logpdf(self, x):
+        z = np.abs(x - self.loc) / self.scale
+        return -z - np.log(self.scale) - 2*np.log1p(np.exp(-z))
+
+    def _cdf(self, x):
+        return special.expit((x - self.loc) / self.scale)
+
+    def _logcdf(self, x):
+        return -np.logaddexp(0, -(x - self.loc) / self.scale)
+
+    def _sf(self, x):
+        return special.expit(-(x - self.loc) / self.scale)
+
+    def _logsf(self, x):
+        return -np.logaddexp(0, (x - self.loc) / self.scale)
+
+    def _ppf(self, q):
+        return self.loc + self.scale * special.logit(q)
+
+    def _isf(self, q):
+        return self.loc - self.scale * special.logit(q)
+
+    def _rvs(self, size, rng):
+        return rng.logistic(self.loc, self.scale, size)
+
+    @classmethod
+    def _fit(cls, s, method):
+        # Moment estimates, from var = (pi scale)**2 / 3, also the starting
+        # point of maximum likelihood
+        return s.mean_of('x'), np.sqrt(3 * s.var_of('x')) / np.pi
+
+    @classmethod
+    def _fit_passes(cls, params, s, sums):
+        # Newton's method on sum(t) = 0 and sum(z t) = n, with z = (x - loc) / scale
+        # and t = tanh(z / 2)
+        loc = np.array(params[0], dtype=float)
+        scale = np.array(params[1], dtype=float)
+        def moments(x, i):
+            z = (x - loc[i]) / scale[i]
+            t = np.tanh(z / 2)
+            dt = (1 - t**2) / 2
+            return t, z * t, dt, z * dt, z**2 * dt
+
+        n = s.n
+        active = np.ones(np.shape(loc), dtype=bool)
+        for _ in range(100):
+            t, zt, dt, zdt, z2dt = sums(moments, active)
+            f1, f2 = t, zt - n
+            # Jacobian in (loc, scale), times -scale
+            j11, j12 = dt, zdt
+            j21, j22 = t + zdt, zt + z2dt
+            det = j11 * j22 - j12 * j21
+            step_loc = -scale * (j22 * f1 - j12 * f2) / det
+            step_scale = -scale * (j11 * f2 - j21 * f1) / det
+            # Halve steps that would make the scale negative
+            ratio = step_scale / scale
+            shrink = np.where(ratio >= 1, 0.5**(np.floor(np.log2(np.maximum(ratio, 1))) + 1), 1)
+            step_loc = np.where(active, step_loc * shrink, 0)
+            step_scale = np.where(active, step_scale * shrink, 0)
+            loc, scale = loc - step_loc, scale - step_scale
+            active &= (np.abs(step_loc) > 1e-10 * scale) | (np.abs(step_scale) > 1e-10 * scale)
+            if not np.any(active):
+                break
+        return loc, scale
+
     def __add__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Logistic(self.loc + other, self.scale)
         else:
             raise TypeError(f"Can't add or subtract objects of type {type(other)} to Logistic")
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return Logistic(other * self.loc, other * self.scale)
         else:
             raise TypeError(f"Can't multiply objects of type {type(other)} by Logistic")
 
     def __truediv__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return self.__mul__(1/other)
         else:
             raise TypeError(f"Can't divide objects of type {type(other)} by Logistic")
 
     def exp(self):
-        return LogLogistic(alpha=exp(self.loc), beta=1/self.scale)
+        return LogLogistic(alpha=distribution._unwrap(np.exp(self.loc)), beta=1/self.scale)
 
     # TODO: Gumbel - Gumbel = Logistic
 
@@ -99,6 +181,9 @@ class LogLogistic(distribution.Distribution):
     * kX is LogLogistic
     * log(X) is Logistic
     """
+    _params = ('alpha', 'beta')
+    __slots__ = ('alpha', 'beta')
+
     def __init__(self, alpha, beta):
         """
         Parameters
@@ -108,29 +193,71 @@ class LogLogistic(distribution.Distribution):
         beta : float, positive
             Shape parameter
         """
-        assert alpha > 0, "alpha must be positive"
-        assert beta > 0, "alpha must be positive"
+        assert np.all(alpha > 0), "alpha must be positive"
+        assert np.all(beta > 0), "alpha must be positive"
         
         # Parameters
         self.alpha = alpha
         self.beta = beta
 
-        # Scipy backend
-        self.sp = fisk(c=beta, scale=alpha)
-
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.fisk(c=self.beta, scale=self.alpha)
+
     def __repr__(self):
         return f"LogLogistic(alpha={self.alpha}, beta={self.beta})"
 
+    # Native kernels
+    def _pdf(self, x):
+        # Divide through by y**(2 * beta) above the scale to avoid inf / inf
+        y = x / self.alpha
+        c = self.beta / self.alpha
+        pdf = np.where(y <= 1,
+                c * y**(self.beta - 1) / (1 + y**self.beta)**2,
+                c * y**(-self.beta - 1) / (1 + y**-self.beta)**2)
+        return np.where(x < 0, 0., pdf)
+
+    def _logpdf(self, x):
+        t = self.beta * np.log(x / self.alpha)
+        logpdf = np.log(self.beta / x) - np.logaddexp(0, t) - np.logaddexp(0, -t)
+        return np.where(x > 0, logpdf, np.log(self._pdf(x)))
+
+    def _cdf(self, x):
+        return np.where(x <= 0, 0., special.expit(self.beta * np.log(x / self.alpha)))
+
+    def _logcdf(self, x):
+        return np.where(x <= 0, -np.inf,
+                -np.logaddexp(0, -self.beta * np.log(x / self.alpha)))
+
+    def _sf(self, x):
+        return np.where(x <= 0, 1., special.expit(-self.beta * np.log(x / self.alpha)))
+
+    def _logsf(self, x):
+        return np.where(x <= 0, 0.,
+                -np.logaddexp(0, self.beta * np.log(x / self.alpha)))
+
+    def _ppf(self, q):
+        return self.alpha * np.exp(special.logit(q) / self.beta)
+
+    def _isf(self, q):
+        return self.alpha * np.exp(-special.logit(q) / self.beta)
+
+    def _rvs(self, size, rng):
+        # Inverse transform sampling, skipping _ppf's bounds handling
+        u = rng.random(size)
+        return self.alpha * (u / (1 - u))**(1 / self.beta)
+
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return LogLogistic(other*self.alpha, self.beta)
         else:
             raise TypeError(f"Can't multiply objects of type {type(other)} by LogLogistic")
 
     def __truediv__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, distribution._CONSTANTS):
             return self.__mul__(1/other)
         else:
             raise TypeError(f"Can't divide objects of type {type(other)} by LogLogistic")
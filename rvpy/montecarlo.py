@@ -0,0 +1,228 @@
+import numpy as np
+from . import distribution
+
+stats = distribution._LazyModule('scipy.stats')
+
+# Elementwise counterparts of the arithmetic methods, for combining draws
+_OPERATIONS = {
+    '__add__': np.add,
+    '__sub__': np.subtract,
+    '__rsub__': lambda x, y: y - x,
+    '__mul__': np.multiply,
+    '__truediv__': np.divide,
+    '__rtruediv__': lambda x, y: y / x,
+    '__pow__': np.power,
+    '__rpow__': lambda x, y: y**x,
+    '__neg__': np.negative,
+    'exp': np.exp,
+    'log': np.log,
+    'abs': np.abs,
+}
+
+def supports(rv, *args):
+    """Whether fallback() can sample rv and args: scalar random variables and constants"""
+    for x in (rv,) + args:
+        if isinstance(x, distribution.Distribution):
+            if x.shape != ():
+                return False
+        elif not (isinstance(x, distribution._CONSTANTS) and np.ndim(x) == 0):
+            return False
+    return True
+
+def fallback(name, rv, *args):
+    """
+    Empirical distribution of the arithmetic method name applied to rv and
+    args, from independent draws of the random operands, chunk by chunk
+    """
+    operation = _OPERATIONS[name]
+    n, chunk_size = distribution._mc_samples, distribution._mc_chunk
+    rng = distribution._get_rng()
+    values = np.empty(n)
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        operands = [x.sample(size, rng=rng) if isinstance(x, distribution.Distribution) else x
+                    for x in (rv,) + args]
+        with np.errstate(all='ignore'):
+            values[start:start + size] = operation(*operands)
+    if np.isnan(values).any():
+        raise ValueError(f"{name} of {rv} is undefined on part of its support")
+    return Empirical(values)
+
+class Empirical(distribution.Distribution):
+    """
+    Empirical Distribution of a sample, placing mass 1/n on each of its n
+    values, as returned by the Monte Carlo fallback of unsupported
+    arithmetic (see rvpy.set_monte_carlo).
+
+    The values are kept sorted, so cdf(x) and sf(x) are a binary search,
+    quantile(q) is an index, and sample() resamples the values with
+    replacement (the bootstrap). pdf() and entropy come from a histogram of
+    the values (scipy.stats.rv_histogram). Arithmetic with constants and
+    the transformation functions apply to the values directly; with other
+    random variables, it falls back to Monte Carlo again.
+
+    Parameters
+    ----------
+    values : array of floats
+        Sample
+
+    Methods
+    -------
+    pmf(x)
+        Fraction of the values equal to x
+
+    Relationships
+    -------------
+    Let X be Empirical, c float. Then:
+    * X + c, cX, exp(X), log(X), abs(X), X**c and c**X are Empirical
+    """
+    _params = ('values',)
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        """
+        Parameters
+        ----------
+        values : array of floats
+            Sample
+        """
+        values = np.sort(np.asarray(values, dtype=float).ravel())
+        assert values.size > 0, "values must not be empty"
+        assert not np.isnan(values[-1]), "values must not be NaN"
+
+        self.values = values
+
+        super().__init__()
+
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.rv_histogram(np.histogram(self.values, bins='auto'), density=True)
+
+    def __repr__(self):
+        return f"Empirical(n={self.values.size}, mean={self.mean})"
+
+    @property
+    def shape(self):
+        return ()
+
+    def _key(self):
+        return (type(self), self.values.tobytes())
+
+    @distribution._cached
+    def _discrete(self):
+        return bool(np.all(self.values == np.floor(self.values)))
+
+    @distribution._cached
+    def mean(self):
+        return float(np.mean(self.values))
+
+    @distribution._cached
+    def var(self):
+        return float(np.var(self.values))
+
+    @distribution._cached
+    def skew(self):
+        return float(np.mean((self.values - self.mean)**3) / self.var**1.5)
+
+    @distribution._cached
+    def kurtosis(self):
+        return float(np.mean((self.values - self.mean)**4) / self.var**2 - 3)
+
+    @distribution._cached
+    def median(self):
+        return float(self._ppf(0.5))
+
+    def _count(self, x, side):
+        # Number of values below x (or at most x, for side 'right'). Many
+        # queries are searched in sorted order, which keeps the binary
+        # searches in cache
+        x = np.asarray(x, dtype=float)
+        if x.size < 1024:
+            return np.searchsorted(self.values, x, side=side)
+        order = np.argsort(x, axis=None)
+        count = np.empty(x.size, dtype=np.int64)
+        count[order] = np.searchsorted(self.values, x.ravel()[order], side=side)
+        return count.reshape(x.shape)
+
+    # Native kernels
+    def _cdf(self, x):
+        cdf = self._count(x, 'right') / self.values.size
+        return np.where(np.isnan(x), np.nan, cdf)
+
+    def _logcdf(self, x):
+        return np.log(self._cdf(x))
+
+    def _sf(self, x):
+        return 1 - self._cdf(x)
+
+    def _logsf(self, x):
+        return np.log(self._sf(x))
+
+    def _ppf(self, q):
+        # Smallest value whose cdf is at least q
+        n = self.values.size
+        k = np.clip(np.ceil(np.nan_to_num(q) * n).astype(np.int64) - 1, 0, n - 1)
+        return np.where((q >= 0) & (q <= 1), self.values[k], np.nan)
+
+    def _isf(self, q):
+        return self._ppf(1 - q)
+
+    def pmf(self, x):
+        x = np.asarray(x, dtype=float)
+        count = self._count(x, 'right') - self._count(x, 'left')
+        return np.where(np.isnan(x), np.nan, count / self.values.size)[()]
+
+    def _rvs(self, size, rng):
+        return self.values[rng.integers(0, self.values.size, size)]
+
+    def _map(self, func):
+        with np.errstate(all='ignore'):
+            values = func(self.values)
+        if np.isnan(values).any():
+            raise ValueError("Transformation undefined on part of the sample")
+        return Empirical(values)
+
+    def __add__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0:
+            return self._map(lambda x: x + other)
+        raise TypeError(f"Adding {type(other).__name__} to Empirical not supported")
+
+    def __mul__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0:
+            return self._map(lambda x: x * other)
+        raise TypeError(f"Multiplying Empirical by {type(other).__name__} not supported")
+
+    def __truediv__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0:
+            if other == 0:
+                raise ZeroDivisionError("Cannot divide by zero!")
+            return self._map(lambda x: x / other)
+        raise TypeError(f"Dividing Empirical by {type(other).__name__} not supported")
+
+    def __rtruediv__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0:
+            return self._map(lambda x: other / x)
+        raise TypeError(f"Dividing {type(other).__name__} by Empirical not supported")
+
+    def __pow__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0:
+            return self._map(lambda x: x**other)
+        raise TypeError("Only powers by constants supported")
+
+    def __rpow__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0:
+            return self._map(lambda x: other**x)
+        raise TypeError("Only powers of constants supported")
+
+    def __neg__(self):
+        return self._map(np.negative)
+
+    def exp(self):
+        return self._map(np.exp)
+
+    def log(self):
+        return self._map(np.log)
+
+    def abs(self):
+        return self._map(np.abs)
@@ -0,0 +1,469 @@
+import numpy as np
+from . import distribution, tables
+from . import beta, binomial, degenerate, normal
+
+linalg = distribution._LazyModule('scipy.linalg')
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
+# Values per block when evaluating densities of many points
+_BLOCK = 2**22
+
+# Largest number of entries in the conditional alias tables of a Multinomial
+_TABLE_MAX = 2**20
+
+# Distance from 1 up to which the components of a point sum to 1
+_SIMPLEX_TOL = 1e-10
+
+class _RandomVector(distribution.Distribution):
+    """Distribution of a random vector, whose shape is the shape of one draw"""
+    __slots__ = ()
+
+    def sample(self, *shape, rng=None, workers=None):
+        # scipy's multivariate rvs take the number of draws, not the shape of
+        # the output, so draws are native under either backend
+        if workers is not None:
+            return super().sample(*shape, rng=rng, workers=workers)
+        return np.asarray(self._rvs(shape + self.shape, distribution._get_rng(rng)))[()]
+
+    # Moments of the components without a closed form here, which scipy's
+    # multivariate distributions do not provide either
+    @property
+    def skew(self):
+        raise TypeError(f"Skewness of {type(self).__name__} not supported")
+
+    @property
+    def kurtosis(self):
+        raise TypeError(f"Kurtosis of {type(self).__name__} not supported")
+
+    @property
+    def median(self):
+        raise TypeError(f"Median of {type(self).__name__} not supported")
+
+class MultivariateNormal(_RandomVector):
+    """
+    Multivariate Normal Distribution of a random vector of dimension d, using
+    the following parameterization:
+
+    f(x | mu, cov) = (2 pi)**(-d/2) det(cov)**(-1/2) exp(-1/2 (x - mu)' cov^-1 (x - mu))
+
+    The Cholesky factor L of cov (cov = L L') and log(det(cov)) are computed
+    once, on first use, and cached. Densities of an (N, d) array of points
+    cost one triangular solve against L per block of points, and samples are
+    mu + L z for standard normal z. The shape attribute is (d,), the shape of
+    one draw, so sample(n) returns an (n, d) array.
+
+    Parameters
+    ----------
+    mu : array of floats, shape (d,)
+        Mean vector
+    cov : array of floats, shape (d, d), symmetric positive definite
+        Covariance matrix
+
+    Methods
+    -------
+    marginal(idx)
+        Marginal distribution of the components idx (also X[idx]): Normal
+        for a single index, MultivariateNormal otherwise
+    logpdf(x), pdf(x)
+        Density at the points x, an array of shape (..., d), returning shape (...)
+
+    Relationships
+    -------------
+    Let X, Y be independent MultivariateNormal, A a matrix, a, b vectors,
+    c float. Then:
+    * X + Y is MultivariateNormal
+    * A @ X + b and cX are MultivariateNormal
+    * a @ X and X[i] are Normal
+    """
+    _params = ('mu', 'cov')
+    __slots__ = ('mu', 'cov')
+
+    def __init__(self, mu, cov):
+        """
+        Parameters
+        ----------
+        mu : array of floats, shape (d,)
+            Mean vector
+        cov : array of floats, shape (d, d), symmetric positive definite
+            Covariance matrix
+        """
+        mu = np.asarray(mu, dtype=float)
+        cov = np.asarray(cov, dtype=float)
+        assert mu.ndim == 1 and mu.size > 0, "mu must be a non-empty vector"
+        assert cov.shape == mu.shape * 2, "cov must be a (d, d) matrix for d = len(mu)"
+        assert np.allclose(cov, cov.T), "cov must be symmetric"
+
+        self.mu = mu
+        self.cov = cov
+
+        super().__init__()
+
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.multivariate_normal(self.mu, self.cov)
+
+    def __repr__(self):
+        return f"MultivariateNormal(mu={self.mu}, cov={self.cov})"
+
+    @property
+    def shape(self):
+        return self.mu.shape
+
+    @property
+    def dim(self):
+        return self.mu.size
+
+    # Cholesky factor and log-determinant of cov, computed once
+    @distribution._cached
+    def chol(self):
+        return np.linalg.cholesky(self.cov)
+
+    @distribution._cached
+    def logdet(self):
+        return float(2 * np.sum(np.log(np.diag(self.chol))))
+
+    @distribution._cached
+    def mean(self):
+        return self.mu
+
+    @distribution._cached
+    def median(self):
+        return self.mu
+
+    @distribution._cached
+    def var(self):
+        return np.diag(self.cov).copy()
+
+    @distribution._cached
+    def entropy(self):
+        return 0.5 * (self.dim * (1 + np.log(2 * np.pi)) + self.logdet)
+
+    def logpdf(self, x):
+        x = np.asarray(x, dtype=float)
+        assert x.shape[-1:] == self.shape, "Last axis of x must have length d"
+        points = x.reshape(-1, self.dim)
+        maha = np.empty(points.shape[0])
+        rows = max(1, _BLOCK // self.dim)
+        for start in range(0, points.shape[0], rows):
+            # Solve L z = x - mu for a block of points, as columns
+            z = linalg.solve_triangular(self.chol, (points[start:start + rows] - self.mu).T,
+                                        lower=True, check_finite=False)
+            maha[start:start + rows] = np.einsum('ij,ij->j', z, z)
+        logpdf = -0.5 * (maha + self.dim * np.log(2 * np.pi) + self.logdet)
+        return logpdf.reshape(x.shape[:-1])[()]
+
+    def pdf(self, x):
+        return np.exp(self.logpdf(x))
+
+    def _rvs(self, size, rng):
+        return self.mu + rng.standard_normal(size) @ self.chol.T
+
+    def _sum_iid(self, n):
+        return MultivariateNormal(n * self.mu, n * self.cov)
+
+    def _mean_iid(self, n):
+        return MultivariateNormal(self.mu, self.cov / n)
+
+    def _with_factor(self, mu, scale):
+        # MultivariateNormal(mu, scale**2 cov), keeping the cached factor
+        other = MultivariateNormal(mu, self.cov if scale**2 == 1 else scale**2 * self.cov)
+        cache = distribution._cache_of(self)
+        if 'chol' in cache:
+            other.chol = abs(scale) * cache['chol']
+            other.logdet = self.logdet + 2 * self.dim * np.log(abs(scale))
+        return other
+
+    def marginal(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            return normal.Normal(float(self.mu[idx]), float(self.cov[idx, idx])**0.5)
+        idx = np.arange(self.dim)[idx]
+        marginal = MultivariateNormal(self.mu[idx], self.cov[np.ix_(idx, idx)])
+        # The factor of a leading block is the leading block of the factor
+        cache = distribution._cache_of(self)
+        if 'chol' in cache and np.array_equal(idx, np.arange(idx.size)):
+            marginal.chol = cache['chol'][:idx.size, :idx.size]
+        return marginal
+
+    def __getitem__(self, idx):
+        return self.marginal(idx)
+
+    def __add__(self, other):
+        if isinstance(other, MultivariateNormal):
+            assert other.shape == self.shape, "Dimensions must match"
+            return MultivariateNormal(self.mu + other.mu, self.cov + other.cov)
+        elif isinstance(other, distribution._CONSTANTS) and np.ndim(other) <= 1:
+            return self._with_factor(self.mu + other, 1)
+        else:
+            raise TypeError(f"Adding {type(other)} to MultivariateNormal not supported")
+
+    def __mul__(self, other):
+        if isinstance(other, distribution._CONSTANTS) and np.ndim(other) == 0 and other != 0:
+            return self._with_factor(other * self.mu, other)
+        else:
+            raise TypeError("Only multiplication by a nonzero scalar supported; use A @ X")
+
+    def __truediv__(self, other):
+        return self.__mul__(1 / other)
+
+    def __neg__(self):
+        return self._with_factor(-self.mu, -1)
+
+    def __rmatmul__(self, A):
+        A = np.asarray(A, dtype=float)
+        if A.ndim == 1:
+            return normal.Normal(float(A @ self.mu), float(A @ self.cov @ A)**0.5)
+        elif A.ndim == 2:
+            cov = A @ self.cov @ A.T
+            # Symmetric up to rounding
+            return MultivariateNormal(A @ self.mu, (cov + cov.T) / 2)
+        else:
+            raise TypeError("Only a matrix or vector @ MultivariateNormal supported")
+
+class Dirichlet(_RandomVector):
+    """
+    Dirichlet Distribution of a random vector on the k-simplex, using the
+    following parameterization:
+
+    f(x | alpha) = Gamma(sum(alpha)) / prod(Gamma(alpha)) * prod(x**(alpha - 1))
+
+    for x_i >= 0 with sum(x) == 1. The shape attribute is (k,), the shape of
+    one draw, so sample(n) returns an (n, k) array, drawn in one call by
+    normalizing Gamma variates.
+
+    Parameters
+    ----------
+    alpha : array of floats, shape (k,), positive
+        Concentration parameters
+
+    Methods
+    -------
+    marginal(i)
+        Beta distribution of the component i (also X[i])
+    logpdf(x), pdf(x)
+        Density at the points x, an array of shape (..., k), returning shape (...)
+
+    Relationships
+    -------------
+    Let X be Dirichlet(alpha). Then:
+    * X[i] is Beta(alpha[i], sum(alpha) - alpha[i])
+    """
+    _params = ('alpha',)
+    __slots__ = ('alpha', 'alpha0')
+
+    def __init__(self, alpha):
+        """
+        Parameters
+        ----------
+        alpha : array of floats, shape (k,), positive
+            Concentration parameters
+        """
+        alpha = np.asarray(alpha, dtype=float)
+        assert alpha.ndim == 1 and alpha.size > 1, "alpha must be a vector of length at least 2"
+        assert np.all(alpha > 0), "alpha must be positive"
+
+        self.alpha = alpha
+        self.alpha0 = float(alpha.sum())
+
+        super().__init__()
+
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.dirichlet(self.alpha)
+
+    def __repr__(self):
+        return f"Dirichlet(alpha={self.alpha})"
+
+    @property
+    def shape(self):
+        return self.alpha.shape
+
+    @distribution._cached
+    def mean(self):
+        return self.alpha / self.alpha0
+
+    @distribution._cached
+    def var(self):
+        mean = self.mean
+        return mean * (1 - mean) / (self.alpha0 + 1)
+
+    @distribution._cached
+    def cov(self):
+        mean = self.mean
+        return (np.diag(mean) - np.outer(mean, mean)) / (self.alpha0 + 1)
+
+    @distribution._cached
+    def _log_norm(self):
+        return float(special.gammaln(self.alpha0) - special.gammaln(self.alpha).sum())
+
+    def logpdf(self, x):
+        x = np.asarray(x, dtype=float)
+        assert x.shape[-1:] == self.shape, "Last axis of x must have length k"
+        with np.errstate(divide='ignore', invalid='ignore'):
+            logpdf = self._log_norm + special.xlogy(self.alpha - 1, x).sum(axis=-1)
+        inside = np.all(x >= 0, axis=-1) & (np.abs(x.sum(axis=-1) - 1) <= _SIMPLEX_TOL)
+        return np.where(inside, logpdf, -np.inf)[()]
+
+    def pdf(self, x):
+        return np.exp(self.logpdf(x))
+
+    def _rvs(self, size, rng):
+        # numpy normalizes Gamma variates (or breaks sticks with Beta
+        # variates when every alpha is small, where Gammas underflow)
+        return rng.dirichlet(self.alpha, size[:-1])
+
+    def marginal(self, i):
+        assert isinstance(i, (int, np.integer)), "Marginals are of single components"
+        return beta.Beta(self.alpha[i], self.alpha0 - self.alpha[i])
+
+    def __getitem__(self, i):
+        return self.marginal(i)
+
+class Multinomial(_RandomVector):
+    """
+    Multinomial Distribution of the counts of k outcomes in n independent
+    trials, using the following parameterization:
+
+    f(x | n, p) = n! / prod(x!) * prod(p**x)
+
+    for nonnegative integers x with sum(x) == n. The shape attribute is (k,),
+    the shape of one draw, so sample(m) returns an (m, k) array of counts.
+
+    Draws come from numpy's multinomial sampler. With rvpy.set_tabulated(),
+    they are sequential conditional binomials instead, each vectorized over
+    all draws through alias tables of Binomial(m, q) for every number m of
+    trials left, built once per object. This takes k <= n and at most 2**20
+    table entries in all (n up to several hundred), and is several times
+    faster for n well above k.
+
+    Parameters
+    ----------
+    n : int
+        Number of trials
+    p : array of floats, shape (k,), summing to 1
+        Probability of each outcome per trial
+
+    Methods
+    -------
+    marginal(i)
+        Binomial distribution of the count of outcome i (also X[i])
+    logpmf(x), pmf(x)
+        Probability of the counts x, an array of shape (..., k), returning shape (...)
+
+    Relationships
+    -------------
+    Let X, Y be Multinomial with the same p. Then:
+    * X + Y is Multinomial
+    * X[i] is Binomial(n, p[i])
+    """
+    _params = ('n', 'p')
+    __slots__ = ('n', 'p')
+    _discrete = True
+    _tabulate = 'conditional'
+
+    def __init__(self, n, p):
+        """
+        Parameters
+        ----------
+        n : int
+            Number of trials
+        p : array of floats, shape (k,), summing to 1
+            Probability of each outcome per trial
+        """
+        p = np.asarray(p, dtype=float)
+        assert distribution._is_integer(n) and np.ndim(n) == 0 and n > 0, \
+                "n must be a positive integer"
+        assert p.ndim == 1 and p.size > 1, "p must be a vector of length at least 2"
+        assert np.all(p >= 0) and abs(p.sum() - 1) <= _SIMPLEX_TOL, \
+                "p must be nonnegative and sum to 1"
+
+        self.n = n
+        self.p = p
+
+        super().__init__()
+
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.multinomial(self.n, self.p)
+
+    def __repr__(self):
+        return f"Multinomial(n={self.n}, p={self.p})"
+
+    @property
+    def shape(self):
+        return self.p.shape
+
+    @distribution._cached
+    def mean(self):
+        return self.n * self.p
+
+    @distribution._cached
+    def var(self):
+        return self.n * self.p * (1 - self.p)
+
+    @distribution._cached
+    def cov(self):
+        return self.n * (np.diag(self.p) - np.outer(self.p, self.p))
+
+    @distribution._cached
+    def _conditional_p(self):
+        # Probability of each outcome given that none of the earlier ones occurred
+        rest = np.cumsum(self.p[::-1])[::-1]
+        return np.divide(self.p, rest, out=np.zeros_like(self.p), where=rest > 0).clip(0, 1)
+
+    def _conditional_pmfs(self):
+        # pmfs of Binomial(m, q) for m = 0, ..., n, as rows, for each outcome
+        # but the last, with q its conditional probability
+        m = np.arange(self.n + 1)
+        return [stats.binom.pmf(m, m[:, None], q) for q in self._conditional_p[:-1]]
+
+    def logpmf(self, x):
+        x = np.asarray(x, dtype=float)
+        assert x.shape[-1:] == self.shape, "Last axis of x must have length k"
+        with np.errstate(divide='ignore', invalid='ignore'):
+            logpmf = special.gammaln(self.n + 1) + np.sum(special.xlogy(x, self.p)
+                                                          - special.gammaln(x + 1), axis=-1)
+        inside = np.all((x >= 0) & (x == np.floor(x)), axis=-1) & (x.sum(axis=-1) == self.n)
+        return np.where(inside, logpmf, -np.inf)[()]
+
+    def pmf(self, x):
+        return np.exp(self.logpmf(x))
+
+    def _rvs(self, size, rng):
+        k = self.p.size
+        # With fewer trials than outcomes, most conditional draws are of no
+        # trials left, which numpy's sampler skips
+        if distribution._tabulated and k <= self.n and (k - 1) * (self.n + 1)**2 <= _TABLE_MAX:
+            out = np.empty(size, dtype=np.int64)
+            left = np.full(size[:-1], self.n, dtype=np.int64)
+            # The uniforms of each draw are consecutive in the stream, so
+            # chunked draws match a single sample()
+            u = rng.random(size[:-1] + (k - 1,))
+            for i, table in enumerate(tables._table(self)):
+                out[..., i] = table.lookup(left, u[..., i])
+                left -= out[..., i]
+            out[..., -1] = left
+            return out
+        return rng.multinomial(self.n, self.p, size[:-1])
+
+    def _sum_iid(self, n):
+        return Multinomial(n * self.n, self.p)
+
+    def marginal(self, i):
+        assert isinstance(i, (int, np.integer)), "Marginals are of single components"
+        p = float(self.p[i])
+        if p == 0 or p == 1:
+            return degenerate.Degenerate(self.n if p == 1 else 0)
+        return binomial.Binomial(self.n, p)
+
+    def __getitem__(self, i):
+        return self.marginal(i)
+
+    def __add__(self, other):
+        if isinstance(other, Multinomial) and np.array_equal(other.p, self.p):
+            return Multinomial(self.n + other.n, self.p)
+        else:
+            raise TypeError("Only Multinomials with the same p can be added")
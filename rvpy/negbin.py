@@ -1,6 +1,16 @@
 import numpy as np
-from scipy.stats import nbinom
-from . import distribution
+from . import beta, distribution, fitting, gamma
+
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
+# Largest fitted r, for data that are not overdispersed (where the MLE of r
+# is infinite: the Poisson limit)
+_MAX_R = 10**6
+
+def _fitted_p(r, mean):
+    # MLE of p given r; all-zero data have no estimate
+    return np.where(mean > 0, r / (r + mean), np.nan)
 
 class NegativeBinomial(distribution.Distribution):
     """
@@ -19,12 +29,22 @@ class NegativeBinomial(distribution.Distribution):
     -------
     to_geometric()
         Converts self to Geometric if r == 1
+    fit(data, method='mle', chunk_size=2**20)
+        Class method. r is restricted to integers, at most 10**6. Maximum
+        likelihood takes one pass over the data per Newton step, so data must
+        be an array or memmap rather than a stream of chunks or a summary.
 
     Relationships
     -------------
     Let X, Y be NegativeBinomial. Then:
     * X + Y is NegativeBinomial
     """
+    _params = ('r', 'p')
+    __slots__ = ('r', 'p', 'q')
+    _discrete = True
+    _tabulate = 'alias'
+    _fit_transforms = ('x',)
+
     def __init__(self, r, p):
         """
         Parameters
@@ -34,31 +54,111 @@ class NegativeBinomial(distribution.Distribution):
         p : float, 0 < p < 1
             Probability of success
         """
-        assert isinstance(r, int) and r > 0, 'r must be positive integer'
-        assert p > 0 and p < 1, 'p must be a number between 0 and 1'
+        assert distribution._is_integer(r) and np.all(r > 0), 'r must be positive integer'
+        assert np.all((p > 0) & (p < 1)), 'p must be a number between 0 and 1'
 
         # Parameters
         self.r = r
         self.p = p
         self.q = 1 - p
 
-        # Scipy backend
-        self.sp = nbinom(r, p)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.nbinom(self.r, self.p)
+
     def __repr__(self):
         return f"NegativeBinomial(r={self.r}, p={self.p})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.negative_binomial(self.r, self.p, size)
+
+    def _logcdf(self, x):
+        # cdf(k) = I_p(r, k + 1)
+        k = np.floor(x)
+        return gamma._log_tail(self.sp.cdf(k), beta._log_incbeta,
+                               self.r, k + 1, self.p, self.q)
+
+    def _logsf(self, x):
+        # sf(k) = I_q(k + 1, r)
+        k = np.floor(x)
+        return gamma._log_tail(self.sp.sf(k), beta._log_incbeta,
+                               k + 1, self.r, self.q, self.p)
+
+    def _sum_iid(self, n):
+        return NegativeBinomial(n * self.r, self.p)
+
+    @classmethod
+    def _fit(cls, s, method):
+        # Moment estimates from mean = r q / p and var = mean / p; maximum
+        # likelihood starts from the unrounded r
+        mean, var = s.mean_of('x'), s.var_of('x')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = np.where(var > mean, mean**2 / (var - mean), _MAX_R)
+        r = np.clip(r, 1e-3, _MAX_R)
+        if method == 'mom':
+            r = np.maximum(1, np.round(r)).astype(int)
+        return r, _fitted_p(r, mean)
+
+    @classmethod
+    def _fit_passes(cls, params, s, sums):
+        # Newton's method in log(r) on the profile score, with p = r / (r + mean):
+        # sum(digamma(x + r) - digamma(r)) - n log(1 + mean / r) = 0
+        mean, n = s.mean_of('x'), s.n
+        r = np.asarray(params[0], dtype=float)
+        def scores(x, i):
+            return special.digamma(x + r[i]) - digamma_r[i], \
+                   fitting.trigamma(x + r[i]) - trigamma_r[i]
+
+        active = np.ones(np.shape(r), dtype=bool)
+        for _ in range(100):
+            digamma_r, trigamma_r = special.digamma(r), fitting.trigamma(r)
+            a, b = sums(scores, active)
+            score = a - n * np.log1p(mean / r)
+            slope = b + n * mean / (r * (r + mean))
+            step = np.where(active, np.clip(-score / (r * slope), -1, 1), 0)
+            r = np.minimum(r * np.exp(step), _MAX_R)
+            # Groups at the bound are done, as are groups whose score is down to
+            # the rounding error of the digamma differences (the likelihood is
+            # then flat in r to about 1e-12)
+            noise = 1e-13 * n * np.abs(digamma_r)
+            active &= (r * np.abs(step) > 1e-6) & (r < _MAX_R) & (np.abs(score) > noise)
+            if not np.any(active):
+                break
+
+        # The better of the integers around r
+        lo = np.maximum(1, np.floor(r))
+        hi = np.minimum(lo + 1, _MAX_R)
+        gammaln_lo, gammaln_hi = special.gammaln(lo), special.gammaln(hi)
+        def loglik(x, i):
+            return special.gammaln(x + lo[i]) - gammaln_lo[i], \
+                   special.gammaln(x + hi[i]) - gammaln_hi[i]
+        a, b = sums(loglik)
+        profile = lambda r, total: total - n * r * np.log1p(mean / r) \
+                                   - n * mean * np.log1p(r / mean)
+        r = np.where(profile(lo, a) >= profile(hi, b), lo, hi).astype(int)
+        return r, _fitted_p(r, mean)
+
     def __add__(self, other):
-        if isinstance(other, NegativeBinomial) and other.p == self.p:
+        if isinstance(other, NegativeBinomial) and np.all(other.p == self.p):
             return NegativeBinomial(self.r + other.r, self.p)
         else:
             raise TypeError("Can only add Geometric or NegativeBinomial to NegativeBinomial")
 
+    @classmethod
+    def _sum(cls, terms):
+        # n-ary form of __add__, used when evaluating lazy sums
+        p = terms[0].p
+        if any(np.any(t.p != p) for t in terms):
+            raise TypeError("Can only add Geometric or NegativeBinomial to NegativeBinomial")
+        return NegativeBinomial(sum(t.r for t in terms), p)
+
     def to_geometric(self):
-        assert self.r == 1, "r must be 1 to cast to negative binomial"
+        assert np.all(self.r == 1), "r must be 1 to cast to negative binomial"
         return Geometric(p=self.p)
 
 class Geometric(NegativeBinomial):
@@ -82,6 +182,9 @@ class Geometric(NegativeBinomial):
     Let X, Y be Geometric. Then:
     * X + Y is NegativeBinomial
     """
+    _params = ('p',)
+    __slots__ = ()
+
     def __init__(self, p):
         """
         Parameters
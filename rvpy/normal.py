@@ -1,8 +1,14 @@
 import numpy as np
-from scipy.stats import norm, lognorm
 from . import distribution
 from . import gamma, cauchy
 
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
+def _std(var):
+    # Fitted standard deviation; constant data have no estimate
+    return np.sqrt(np.where(var > 0, var, np.nan))
+
 class Normal(distribution.Distribution):
     """
     Univariate Normal Distribution using the following parameterization:
@@ -24,6 +30,9 @@ class Normal(distribution.Distribution):
         Exponentiate self to yield LogNormal(mu, sigma)
     mgf(t)
         Moment generating function
+    given(likelihood, data, sigma=None)
+        Posterior given observations of Normal(mu, sigma) with sigma known,
+        for mu with this prior
 
     Relationships
     -------------
@@ -33,6 +42,10 @@ class Normal(distribution.Distribution):
     * exp(X) is LogNormal
     * X/Y is StandardCauchy if X, Y are StandardNormal
     """
+    _params = ('mu', 'sigma')
+    __slots__ = ('mu', 'sigma')
+    _fit_transforms = ('x',)
+
     def __init__(self, mu=0, sigma=1):
         """
         Parameters
@@ -42,47 +55,106 @@ class Normal(distribution.Distribution):
         sigma : float, positive
             Scale and standard devation parameter
         """
-        assert isinstance(mu, (int, float)), "mu must be numeric!"
-        assert isinstance(sigma, (int, float)), "sigma must be numeric!"
-        assert sigma > 0, "sigma must be positive"
+        assert distribution._is_real(mu), "mu must be numeric!"
+        assert distribution._is_real(sigma), "sigma must be numeric!"
+        assert np.all(sigma > 0), "sigma must be positive"
 
         self.mu = mu
         self.sigma = sigma
 
-        # Scipy backend
-        self.sp = norm(mu, sigma)
-
         # Intialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.norm(self.mu, self.sigma)
+
     def __repr__(self):
         return f"Normal(mu={self.mu}, sigma={self.sigma})"
 
+    # Native kernels
+    def _pdf(self, x):
+        z = (x - self.mu) / self.sigma
+        return np.exp(-0.5*z**2) / (self.sigma * np.sqrt(2*np.pi))
+
+    def _logpdf(self, x):
+        z = (x - self.mu) / self.sigma
+        return -0.5*z**2 - np.log(self.sigma) - 0.5*np.log(2*np.pi)
+
+    def _cdf(self, x):
+        return special.ndtr((x - self.mu) / self.sigma)
+
+    def _logcdf(self, x):
+        return special.log_ndtr((x - self.mu) / self.sigma)
+
+    def _sf(self, x):
+        return special.ndtr((self.mu - x) / self.sigma)
+
+    def _logsf(self, x):
+        return special.log_ndtr((self.mu - x) / self.sigma)
+
+    def _ppf(self, q):
+        return self.mu + self.sigma * special.ndtri(q)
+
+    def _isf(self, q):
+        return self.mu - self.sigma * special.ndtri(q)
+
+    def _rvs(self, size, rng):
+        return rng.normal(self.mu, self.sigma, size)
+
+    def _sum_iid(self, n):
+        return Normal(n * self.mu, self.sigma * n**0.5)
+
+    def _mean_iid(self, n):
+        return Normal(self.mu, self.sigma / n**0.5)
+
+    def _given(self, likelihood, s, sigma=None):
+        if likelihood is not Normal:
+            raise TypeError("Normal is a conjugate prior for the mean of Normal only")
+        assert sigma is not None and np.all(sigma > 0), \
+                "sigma must be given, and positive, for Normal observations"
+        precision = self.sigma**-2 + s.n / sigma**2
+        mu = (self.mu / self.sigma**2 + s.n * s.mean_of('x') / sigma**2) / precision
+        return Normal(distribution._unwrap(mu), distribution._unwrap(precision**-0.5))
+
+    @classmethod
+    def _fit(cls, s, method):
+        # Both methods give the sample mean and (biased) standard deviation
+        return s.mean_of('x'), _std(s.var_of('x'))
+
     def __add__(self, other):
         if isinstance(other, Normal):
             new_mu = other.mu + self.mu
-            new_sigma = (self.var + other.var)**0.5
+            new_sigma = (self.sigma**2 + other.sigma**2)**0.5
             return Normal(new_mu, new_sigma)
-        elif isinstance(other, (int, float)):
+        elif isinstance(other, distribution._CONSTANTS):
             return Normal(self.mu + other, self.sigma)
         else:
             raise TypeError(f"Addiing {type(other)} to Normal not supported")
 
+    @classmethod
+    def _sum(cls, terms):
+        # n-ary form of __add__, used when evaluating lazy sums
+        return Normal(sum(t.mu for t in terms), sum(t.sigma**2 for t in terms)**0.5)
+
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
-            return Normal(other*self.mu, float(np.abs(other)*self.sigma))
+        if isinstance(other, distribution._CONSTANTS):
+            return Normal(other*self.mu, distribution._as_float(np.abs(other)*self.sigma))
         else:
             raise TypeError("Only multiplicated by int or float supported.")
 
     def __truediv__(self, other):
-        if isinstance(other, (int, float)) and other != 0:
+        if isinstance(other, distribution._CONSTANTS):
+            if not np.all(other != 0):
+                raise ZeroDivisionError("Cannot divide a Normal by zero!")
             return self.__mul__(1 / other)
         elif isinstance(other, Normal):
             self.to_standard()
             other.to_standard()
             return cauchy.StandardCauchy()
         else:
-            raise ZeroDivisionError("Cannot divide a Normal by zero!")
+            raise TypeError(f"Dividing Normal by {type(other).__name__} not supported")
 
     def __neg__(self):
         return Normal(-self.mu, self.sigma)
@@ -94,10 +166,10 @@ class Normal(distribution.Distribution):
         return LogNormal(self.mu, self.sigma)
 
     def mgf(self, t):
-        return np.exp(t*self.mu + 0.5*(t**2)*(self.var))
+        return np.exp(t*self.mu + 0.5*(t**2)*(self.sigma**2))
 
     def to_standard(self):
-        if np.round(self.mu, 7) == 0 and np.round(self.sigma, 7) == 1:
+        if np.all(np.round(self.mu, 7) == 0) and np.all(np.round(self.sigma, 7) == 1):
             return StandardNormal()
         else:
             raise ValueError("Must be Normal(0, 1) to standardize!")
@@ -124,6 +196,9 @@ class StandardNormal(Normal):
     Let Z be StandardNormal. In addition to Normal relationships,
     * Z**2 is ChiSq with df = 1
     """
+    _params = ()
+    __slots__ = ()
+
     def __init__(self):
         """
         Parameters
@@ -170,6 +245,10 @@ class LogNormal(distribution.Distribution):
     * 1/X is LogNormal
     * X**k is LogNormal
     """
+    _params = ('mu', 'sigma')
+    __slots__ = ('mu', 'sigma')
+    _fit_transforms = ('x', 'log')
+
     def __init__(self, mu=0, sigma=1):
         """
         Parameters
@@ -179,28 +258,68 @@ class LogNormal(distribution.Distribution):
         sigma : float, positive
             Scale parameter
         """
-        assert sigma > 0, "sigma must be positive"
+        assert np.all(sigma > 0), "sigma must be positive"
 
         # Parameters
         self.mu = mu
         self.sigma = sigma
 
-        # Scipy backend
-        self.sp = lognorm(s=sigma, scale=np.exp(mu))
-
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.lognorm(s=self.sigma, scale=np.exp(self.mu))
+
     def __repr__(self):
         return f"LogNormal(mu={self.mu}, sigma={self.sigma})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(self._logpdf(x))
+
+    def _logpdf(self, x):
+        z = (np.log(x) - self.mu) / self.sigma
+        return np.where(x <= 0, -np.inf,
+                -0.5*z**2 - np.log(x * self.sigma) - 0.5*np.log(2*np.pi))
+
+    def _cdf(self, x):
+        return np.where(x <= 0, 0., special.ndtr((np.log(x) - self.mu) / self.sigma))
+
+    def _logcdf(self, x):
+        return np.where(x <= 0, -np.inf, special.log_ndtr((np.log(x) - self.mu) / self.sigma))
+
+    def _sf(self, x):
+        return np.where(x <= 0, 1., special.ndtr((self.mu - np.log(x)) / self.sigma))
+
+    def _logsf(self, x):
+        return np.where(x <= 0, 0., special.log_ndtr((self.mu - np.log(x)) / self.sigma))
+
+    def _ppf(self, q):
+        return np.exp(self.mu + self.sigma * special.ndtri(q))
+
+    def _isf(self, q):
+        return np.exp(self.mu - self.sigma * special.ndtri(q))
+
+    def _rvs(self, size, rng):
+        return rng.lognormal(self.mu, self.sigma, size)
+
+    @classmethod
+    def _fit(cls, s, method):
+        if method == 'mle':
+            return s.mean_of('log'), _std(s.var_of('log'))
+        mean, var = s.mean_of('x'), s.var_of('x')
+        sigma2 = np.log1p(var / mean**2)
+        return np.log(mean) - sigma2 / 2, _std(sigma2)
+
     def log(self):
         return Normal(self.mu, self.sigma)
 
     def __mul__(self, other):
         if isinstance(other, LogNormal):
             return LogNormal(self.mu + other.mu, self.sigma + other.sigma)
-        elif isinstance(other, (int, float)):
-            if other == 0:
+        elif isinstance(other, distribution._CONSTANTS):
+            if np.any(other == 0):
                 raise TypeError("Can't multiply by 0!")
             else:
                 return LogNormal(self.mu + np.log(other), self.sigma)
@@ -211,14 +330,14 @@ class LogNormal(distribution.Distribution):
         return self.__mul__(1/c)
 
     def __rtruediv__(self, c):
-        if isinstance(c, (int, float)):
+        if isinstance(c, distribution._CONSTANTS):
             return c*LogNormal(-self.mu, self.sigma)
         else:
             raise TypeError(f"__rtruediv__ of LogNormal by {type(c)} not supported.")
 
     def __pow__(self, k):
-        if isinstance(k, (int, float)) and k != 0:
-            if k != 0:
+        if isinstance(k, distribution._CONSTANTS) and np.all(k != 0):
+            if np.all(k != 0):
                 return LogNormal(k*self.mu, abs(k)*self.sigma)
             else:
                 raise ValueError("Exponent to LogNormal must be nonzero.")
@@ -0,0 +1,200 @@
+import os
+
+import numpy as np
+
+from . import distribution
+from . import beta, binomial, gamma, normal, poisson
+
+# Per-observation increments of the two posterior parameters, (alpha, beta)
+# of Beta priors and (alpha, rate) of Gamma priors, keyed by prior and
+# likelihood family name, with the names of the known parameters they take
+def _binomial(x, n):
+    return x, n - x
+
+def _poisson(x):
+    return x, 1.
+
+def _exponential(x):
+    return 1., x
+
+def _normal_precision(x, mu):
+    return 0.5, (x - mu)**2 / 2
+
+_UPDATES = {
+    ('Beta', 'Bernoulli'): (_binomial, ('n',)),
+    ('Beta', 'Binomial'): (_binomial, ('n',)),
+    ('Gamma', 'Poisson'): (_poisson, ()),
+    ('Gamma', 'Exponential'): (_exponential, ()),
+    ('Gamma', 'Normal'): (_normal_precision, ('mu',)),
+}
+
+def _prior_family(prior):
+    if isinstance(prior, beta.Beta):
+        return 'Beta'
+    if isinstance(prior, gamma.Gamma):
+        return 'Gamma'
+    raise TypeError(f"{type(prior).__name__} priors cannot be updated online")
+
+def _likelihood_name(likelihood):
+    # Subclasses first: Bernoulli is a Binomial, Exponential a Gamma
+    for family in (binomial.Bernoulli, binomial.Binomial, poisson.Poisson,
+                   gamma.Exponential, normal.Normal):
+        if issubclass(likelihood, family):
+            return family.__name__
+    return likelihood.__name__
+
+class ConjugateUpdater:
+    """
+    Beta or Gamma posteriors of a batch of arms, updated in place from
+    micro-batches of observations, as for a stream of experiment events.
+
+    The state is the two posterior parameters of every arm, (alpha, beta)
+    for Beta priors and (alpha, 1 / beta) for Gamma priors, to which each
+    batch adds its per-arm totals with one unbuffered np.add.at per
+    parameter, whatever the number of arms. The posterior distribution is
+    only built when asked for, once per update.
+
+    The supported pairs are those of Distribution.given(): Beta priors of
+    Bernoulli or Binomial(n) observations, and Gamma priors of Poisson,
+    Exponential (the rate) or Normal(mu) (the precision) observations.
+
+    Parameters
+    ----------
+    prior : Beta or Gamma
+        Prior of every arm, or a batch of priors, one per arm
+    likelihood : family
+        Family of the observations
+    arms : int
+        Number of arms the prior is broadcast to, if given
+    **known : floats or arrays
+        Known parameters of the likelihood (n for Binomial, mu for Normal),
+        per arm or shared
+
+    Attributes
+    ----------
+    posterior : Beta or Gamma
+        Current posterior, batched over the arms
+    shape : tuple
+        Batch shape of the arms, () for a single arm
+    events : int
+        Number of observations ingested
+
+    Methods
+    -------
+    update(values, arms=None)
+        Ingests observations values of the arms arms (indices into the
+        flattened batch; not needed for a single arm)
+    consume(batches)
+        Ingests an iterable of (values, arms) micro-batches
+    checkpoint(path)
+        Atomically saves the state to the .npz file path
+    restore(path)
+        Class method loading an updater from a checkpoint
+    """
+    __slots__ = ('family', 'likelihood', 'known', 'params', 'events', '_posterior')
+
+    def __init__(self, prior, likelihood, arms=None, **known):
+        family = _prior_family(prior)
+        name = _likelihood_name(likelihood)
+        if (family, name) not in _UPDATES:
+            raise TypeError(f"{family} is not a conjugate prior for {name}")
+        if name == 'Bernoulli':
+            known = dict(known, n=1)
+        missing = [k for k in _UPDATES[family, name][1] if k not in known]
+        assert not missing, f"{', '.join(missing)} must be given for {name} observations"
+
+        shape = prior.shape if arms is None else (arms,)
+        known = {k: np.asarray(v, dtype=float) for k, v in known.items()}
+        assert all(v.ndim == 0 or v.shape == shape for v in known.values()), \
+                f"Known parameters must be scalars or of shape {shape}"
+        first, second = prior.alpha, prior.beta
+        if family == 'Gamma':
+            second = 1 / second
+        self.family = family
+        self.likelihood = name
+        self.known = known
+        self.params = [np.array(np.broadcast_to(p, shape), dtype=float) for p in (first, second)]
+        self.events = 0
+        self._posterior = None
+
+    def __repr__(self):
+        return (f"ConjugateUpdater({self.family} | {self.likelihood}, "
+                f"arms={self.params[0].size}, events={self.events})")
+
+    @property
+    def shape(self):
+        return self.params[0].shape
+
+    def update(self, values, arms=None):
+        values = np.asarray(values, dtype=float).ravel()
+        if arms is None:
+            assert self.shape == (), "arms must be given for a batch of posteriors"
+        else:
+            arms = np.asarray(arms).ravel()
+            assert arms.shape == values.shape, "values and arms must have the same size"
+        if values.size == 0:
+            return self
+        if arms is not None:
+            # np.add.at would wrap negative ids around to other arms
+            size = self.params[0].size
+            assert np.issubdtype(arms.dtype, np.integer) and arms.min() >= 0 \
+                    and arms.max() < size, f"arms must be integer indices in [0, {size})"
+
+        func, names = _UPDATES[self.family, self.likelihood]
+        known = {k: self.known[k] if arms is None or self.known[k].ndim == 0
+                 else self.known[k].reshape(-1)[arms] for k in names}
+        self._check(values, known)
+        for param, increment in zip(self.params, func(values, *known.values())):
+            if arms is None:
+                param += np.sum(np.broadcast_to(increment, values.shape))
+            else:
+                np.add.at(param.reshape(-1), arms, increment)
+        self.events += values.size
+        self._posterior = None
+        return self
+
+    def _check(self, values, known):
+        # known holds the known parameters of the arm of each observation
+        if self.likelihood in ('Bernoulli', 'Binomial'):
+            assert values.min() >= 0 and np.all(values <= known['n']), \
+                    "Observations must be in [0, n] for the n of their arm"
+        elif self.likelihood in ('Poisson', 'Exponential'):
+            assert values.min() >= 0, f"{self.likelihood} observations must be nonnegative"
+
+    def consume(self, batches):
+        for values, arms in batches:
+            self.update(values, arms)
+        return self
+
+    @property
+    def posterior(self):
+        if self._posterior is None:
+            first, second = [distribution._unwrap(p.copy()) for p in self.params]
+            if self.family == 'Beta':
+                self._posterior = beta.Beta(first, second)
+            else:
+                self._posterior = gamma.Gamma(first, distribution._unwrap(1 / np.asarray(second)))
+        return self._posterior
+
+    def checkpoint(self, path):
+        # Write a sibling file and rename it over path, so a crash never
+        # leaves a partial checkpoint
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            np.savez(f, family=self.family, likelihood=self.likelihood, events=self.events,
+                     first=self.params[0], second=self.params[1],
+                     **{'known_' + k: v for k, v in self.known.items()})
+        os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path):
+        with np.load(path) as state:
+            updater = cls.__new__(cls)
+            updater.family = str(state['family'])
+            updater.likelihood = str(state['likelihood'])
+            updater.events = int(state['events'])
+            updater.params = [state['first'], state['second']]
+            updater.known = {k[len('known_'):]: state[k] for k in state.files
+                             if k.startswith('known_')}
+            updater._posterior = None
+        return updater
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+
+from . import distribution
+
+# Module-level settings that affect sampling, handed to process workers, which
+# may start from the defaults (under the spawn and forkserver start methods)
+_SETTINGS = ('_native', '_tabulated', '_tail', '_u_error', '_support_tables', '_support_max')
+
+def _seed_sequence(rng):
+    """Resolve an rng argument to a SeedSequence to spawn worker streams from"""
+    if isinstance(rng, np.random.SeedSequence):
+        return rng
+    if rng is None or isinstance(rng, np.random.Generator):
+        # Draw entropy from the generator so set_rng() seeds parallel draws too
+        rng = distribution._get_rng(rng)
+        return np.random.SeedSequence(rng.integers(2**63, size=4))
+    return np.random.SeedSequence(rng)
+
+def _fill_shared(name, shape, dtype, start, stop, rv, seed, settings):
+    from multiprocessing import shared_memory
+
+    for setting, value in settings.items():
+        setattr(distribution, setting, value)
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        rv.sample_into(out[start:stop], rng=np.random.default_rng(seed))
+        # Release the view before closing the mapping
+        del out
+    finally:
+        shm.close()
+
+def parallel_sample(rv, *shape, rng=None, workers=None, threads=False, mp_context=None):
+    """
+    Draws a sample of the given shape, splitting its leading axis across a
+    pool of workers.
+
+    Each worker draws its contiguous block of rows from an independent stream
+    spawned from one numpy SeedSequence, so the result is reproducible for a
+    given seed and number of workers, and is the same with processes or
+    threads. Process workers write straight into shared memory, so no samples
+    are pickled back to the parent, and sample with the parent's backend and
+    table settings whatever the multiprocessing start method.
+
+    Parameters
+    ----------
+    rv : Distribution
+        Random variable to sample
+    *shape : ints
+        Sample shape. For batches, the batch shape is appended.
+    rng : None, int, SeedSequence, or Generator
+        Root of the worker streams. A Generator (or the library-wide default,
+        if None) contributes entropy for a new SeedSequence.
+    workers : int
+        Number of workers, by default os.cpu_count()
+    threads : bool
+        Use a thread pool instead of a process pool. numpy releases the GIL
+        while sampling, so threads avoid process start-up costs.
+    mp_context : multiprocessing context
+        Context the process pool starts its workers with, by default the
+        multiprocessing start method
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    assert workers > 0, "workers must be positive"
+    size = shape + rv.shape
+    if shape == () or size[0] == 0:
+        return rv.sample(*shape, rng=rng)
+
+    workers = min(workers, shape[0])
+    seeds = _seed_sequence(rng).spawn(workers)
+    bounds = np.linspace(0, shape[0], workers + 1).astype(int)
+    dtype = np.asarray(rv.sample(1, rng=0)).dtype
+
+    if threads:
+        out = np.empty(size, dtype=dtype)
+        with ThreadPoolExecutor(workers) as pool:
+            jobs = [
+                pool.submit(rv.sample_into, out[start:stop], rng=np.random.default_rng(seed))
+                for start, stop, seed in zip(bounds[:-1], bounds[1:], seeds)
+            ]
+            for job in jobs:
+                job.result()
+        return out
+
+    from multiprocessing import shared_memory
+
+    settings = {setting: getattr(distribution, setting) for setting in _SETTINGS}
+    nbytes = int(np.prod(size)) * dtype.itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    try:
+        with ProcessPoolExecutor(workers, mp_context=mp_context) as pool:
+            jobs = [
+                pool.submit(_fill_shared, shm.name, size, dtype, start, stop, rv, seed, settings)
+                for start, stop, seed in zip(bounds[:-1], bounds[1:], seeds)
+            ]
+            for job in jobs:
+                job.result()
+        out = np.ndarray(size, dtype=dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return out
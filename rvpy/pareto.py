@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.stats import pareto
 from . import distribution
 
+stats = distribution._LazyModule('scipy.stats')
+
 class Pareto(distribution.Distribution):
     """
     Pareto Distribution using the following parameterization:
@@ -24,6 +25,10 @@ class Pareto(distribution.Distribution):
     Let X be Pareto with alpha = 1. Then:
     * log(X) is exponential
     """
+    _params = ('alpha', 'beta')
+    __slots__ = ('alpha', 'beta')
+    _fit_transforms = ('x', 'log')
+
     def __init__(self, alpha, beta):
         """
         Parameters
@@ -33,20 +38,64 @@ class Pareto(distribution.Distribution):
         beta : float, positive
             Shape parameter
         """
-        assert alpha > 0 and beta > 0, \
+        assert np.all(alpha > 0) and np.all(beta > 0), \
                 "alpha and beta parameters must be positive"
 
         # Parameters
         self.alpha = alpha
         self.beta = beta
 
-        # Scipy backend
-        self.sp = pareto(b=beta, scale=alpha)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.pareto(b=self.beta, scale=self.alpha)
+
     def __repr__(self):
         return f"Pareto(alpha={self.alpha}, beta={self.beta})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(self._logpdf(x))
+
+    def _logpdf(self, x):
+        logpdf = np.log(self.beta) + self.beta * np.log(self.alpha) \
+                - (self.beta + 1) * np.log(x)
+        return np.where(x < self.alpha, -np.inf, logpdf)
+
+    def _cdf(self, x):
+        return np.where(x < self.alpha, 0., -np.expm1(self._logsf(x)))
+
+    def _logcdf(self, x):
+        return np.where(x < self.alpha, -np.inf, np.log(-np.expm1(self._logsf(x))))
+
+    def _sf(self, x):
+        return np.exp(self._logsf(x))
+
+    def _logsf(self, x):
+        return np.where(x < self.alpha, 0., self.beta * np.log(self.alpha / x))
+
+    def _ppf(self, q):
+        x = self.alpha * np.exp(-np.log1p(-q) / self.beta)
+        return distribution._ppf_bounds(q, x, self.alpha, np.inf)
+
+    def _isf(self, q):
+        x = self.alpha * q**(-1 / self.beta)
+        return distribution._ppf_bounds(q, x, np.inf, self.alpha)
+
+    def _rvs(self, size, rng):
+        # log(X / alpha) is Exponential with rate beta
+        return self.alpha * np.exp(rng.standard_exponential(size) / self.beta)
+
+    @classmethod
+    def _fit(cls, s, method):
+        if method == 'mle':
+            return s.min, 1 / (s.mean_of('log') - np.log(s.min))
+        # Solve mean = alpha beta / (beta - 1) and var / mean**2 = 1 / (beta (beta - 2))
+        mean = s.mean_of('x')
+        beta = 1 + (1 + mean**2 / s.var_of('x'))**0.5
+        return mean * (beta - 1) / beta, beta
+
     # TODO: log/exp relationship with Exponential
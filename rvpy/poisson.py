@@ -1,6 +1,7 @@
 import numpy as np
-from scipy.stats import poisson
-from . import distribution
+from . import distribution, gamma
+
+stats = distribution._LazyModule('scipy.stats')
 
 class Poisson(distribution.Distribution):
     """
@@ -22,6 +23,12 @@ class Poisson(distribution.Distribution):
     Let X, Y be Poisson. Then:
     * X + Y is Poisson
     """
+    _params = ('mu',)
+    __slots__ = ('mu',)
+    _discrete = True
+    _tabulate = 'alias'
+    _fit_transforms = ('x',)
+
     def __init__(self, mu):
         """
         Parameters
@@ -29,25 +36,60 @@ class Poisson(distribution.Distribution):
         mu : integer, nonnegative
             Rate parameter
         """
-        assert isinstance(mu, int), "mu must be an integer"
-        assert mu > 0, "mu must be positive integer"
+        assert distribution._is_integer(mu), "mu must be an integer"
+        assert np.all(mu > 0), "mu must be positive integer"
 
         # Parameters
         self.mu = mu
 
-        # Scipy backend
-        self.sp = poisson(mu)
-
         # Intialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.poisson(self.mu)
+
     def __repr__(self):
         return f"Poisson(mu={self.mu})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.poisson(self.mu, size)
+
+    def _logcdf(self, x):
+        # cdf(k) = Q(k + 1, mu)
+        k = np.floor(x)
+        return gamma._log_tail(self.sp.cdf(k), gamma._log_upper, k + 1, self.mu)
+
+    def _logsf(self, x):
+        # sf(k) = P(k + 1, mu)
+        k = np.floor(x)
+        return gamma._log_tail(self.sp.sf(k), gamma._log_lower, k + 1, self.mu)
+
+    def _sum_iid(self, n):
+        return Poisson(n * self.mu)
+
+    @classmethod
+    def _fit(cls, s, method):
+        # mu is restricted to positive integers: the moment estimate is the
+        # nearest one to the mean, and the MLE the better of the two around it
+        mean = s.mean_of('x')
+        if method == 'mom':
+            return np.maximum(1, np.round(mean)).astype(int),
+        lo = np.maximum(1, np.floor(mean))
+        hi = lo + 1
+        return np.where(mean * np.log(lo) - lo >= mean * np.log(hi) - hi, lo, hi).astype(int),
+
     def __add__(self, Y):
         if isinstance(Y, Poisson):
             return Poisson(self.mu + Y.mu)
         else:
             raise TypeError
 
+    @classmethod
+    def _sum(cls, terms):
+        # n-ary form of __add__, used when evaluating lazy sums
+        return Poisson(sum(t.mu for t in terms))
+
 
@@ -0,0 +1,182 @@
+import importlib
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from . import fitting
+
+# Default candidates, by whether the data are integers
+_CONTINUOUS = ('Normal', 'LogNormal', 'Gamma', 'Exponential', 'Weibull', 'Gumbel',
+               'Logistic', 'Laplace', 'Pareto', 'Beta')
+_DISCRETE = ('Poisson', 'NegativeBinomial', 'Binomial')
+
+_CRITERIA = ('aic', 'bic', 'ks')
+
+class FamilyFit(namedtuple('FamilyFit', ['family', 'fitted', 'loglik', 'aic', 'bic', 'ks',
+                                         'fit_time', 'score_time', 'error'])):
+    """
+    One candidate of select_family(): the fitted distribution (None if the
+    family could not be fitted, with the reason in error), its log-likelihood,
+    AIC, BIC and Kolmogorov-Smirnov statistic on the data, and the seconds
+    spent fitting and scoring it.
+    """
+    __slots__ = ()
+
+class Ranking(list):
+    """FamilyFit rows of select_family(), best first, printing as a table"""
+    __slots__ = ('criterion',)
+
+    def __init__(self, rows, criterion):
+        super().__init__(rows)
+        self.criterion = criterion
+
+    @property
+    def best(self):
+        """Fitted distribution of the best candidate"""
+        return self[0].fitted
+
+    def __str__(self):
+        lines = [f"{'family':<18} {'loglik':>14} {'aic':>14} {'bic':>14} {'ks':>8} "
+                 f"{'fit (s)':>8} {'score (s)':>9}"]
+        for row in self:
+            if row.fitted is None:
+                lines.append(f"{row.family:<18} {'failed: ' + row.error}")
+            else:
+                lines.append(f"{row.family:<18} {row.loglik:>14.6g} {row.aic:>14.6g} "
+                             f"{row.bic:>14.6g} {row.ks:>8.4f} {row.fit_time:>8.3f} "
+                             f"{row.score_time:>9.3f}")
+        return '\n'.join(lines)
+
+def _family(candidate):
+    if isinstance(candidate, str):
+        return getattr(importlib.import_module('rvpy'), candidate)
+    return candidate
+
+def _score(fitted, x, chunk_size=2**20):
+    """Log-likelihood and Kolmogorov-Smirnov statistic of fitted on the sorted x"""
+    n = x.size
+    loglik, ks = 0., 0.
+    for start in range(0, n, chunk_size):
+        chunk = x[start:start + chunk_size]
+        if fitted._discrete:
+            loglik += np.sum(fitted.logpmf(chunk))
+            below = fitted.cdf(chunk - 1)
+        else:
+            loglik += np.sum(fitted.logpdf(chunk))
+        cdf = fitted.cdf(chunk)
+        if not fitted._discrete:
+            below = cdf
+        # The empirical cdf jumps from (i - 1) / n to i / n at the i-th value
+        i = np.arange(start + 1, start + chunk.size + 1)
+        ks = max(ks, np.max(i / n - cdf), np.max(below - (i - 1) / n))
+    return float(loglik), float(ks)
+
+def _evaluate(family, s, x):
+    """Fits family to the sorted values x, given their summary s, and scores it"""
+    start = time.perf_counter()
+    try:
+        with np.errstate(all='ignore'):
+            fitted = family._fit_summary(s.subset(family._fit_transforms), x)
+    except (AssertionError, ValueError, ZeroDivisionError) as error:
+        return FamilyFit(family.__name__, None, np.nan, np.nan, np.nan, np.nan,
+                         time.perf_counter() - start, 0., str(error) or type(error).__name__)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with np.errstate(all='ignore'):
+        loglik, ks = _score(fitted, x)
+    k, n = len(family._params), x.size
+    return FamilyFit(family.__name__, fitted, loglik, 2*k - 2*loglik, k*np.log(n) - 2*loglik,
+                     ks, fit_time, time.perf_counter() - start, None)
+
+def _evaluate_shared(family, s, name, size):
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        x = np.ndarray((size,), dtype=float, buffer=shm.buf)
+        result = _evaluate(family, s, x)
+        # Release the view before closing the mapping
+        del x
+    finally:
+        shm.close()
+    return result
+
+def select_family(data, candidates=None, criterion='aic', workers=None, threads=False):
+    """
+    Fits every candidate family to data by maximum likelihood, concurrently,
+    and ranks the fits.
+
+    The data are summarized in one pass over the union of the candidates'
+    transforms (see rvpy.SufficientStatistics), so families with finite
+    sufficient statistics fit without touching the data again. The data are
+    sorted once and shared with the workers (through shared memory for
+    processes), which score every fit by its log-likelihood, AIC, BIC and
+    Kolmogorov-Smirnov statistic.
+
+    Parameters
+    ----------
+    data : array of floats
+        Observations
+    candidates : iterable of families or family names
+        Families supporting fit(). By default Poisson, NegativeBinomial and
+        Binomial for integer data, and otherwise Normal, LogNormal, Gamma,
+        Exponential, Weibull, Gumbel, Logistic, Laplace, Pareto and Beta.
+        Likelihoods of discrete and continuous families are not comparable.
+    criterion : 'aic', 'bic' or 'ks'
+        Ranking criterion, smallest first
+    workers : int
+        Number of workers, by default os.cpu_count(). With one worker, the
+        candidates are fitted in turn in this process.
+    threads : bool
+        Use a thread pool instead of a process pool
+
+    Returns
+    -------
+    Ranking, a list of FamilyFit rows, best first, with the best fit as its
+    best attribute. Candidates that could not be fitted (e.g. Beta to data
+    outside (0, 1)) come last, with fitted None and the reason in error.
+    """
+    assert criterion in _CRITERIA, f"criterion must be one of {_CRITERIA}"
+    x = np.sort(np.asarray(data, dtype=float).ravel())
+    assert x.size > 0, "Cannot fit to empty data"
+    if candidates is None:
+        candidates = _DISCRETE if np.all(x == np.floor(x)) else _CONTINUOUS
+    families = [_family(c) for c in candidates]
+    for family in families:
+        if '_fit' not in vars(family):
+            raise TypeError(f"{family.__name__} does not support fit()")
+
+    transforms = []
+    for family in families:
+        transforms += [t for t in family._fit_transforms if t not in transforms]
+    with np.errstate(all='ignore'):
+        s = fitting.statistics(x, transforms)
+
+    workers = min(workers or os.cpu_count() or 1, len(families))
+    assert workers > 0, "workers must be positive"
+    if workers == 1:
+        rows = [_evaluate(family, s, x) for family in families]
+    elif threads:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as pool:
+            rows = list(pool.map(lambda family: _evaluate(family, s, x), families))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(create=True, size=x.nbytes)
+        try:
+            np.ndarray(x.shape, dtype=float, buffer=shm.buf)[:] = x
+            with ProcessPoolExecutor(workers) as pool:
+                jobs = [pool.submit(_evaluate_shared, family, s, shm.name, x.size)
+                        for family in families]
+                rows = [job.result() for job in jobs]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    key = lambda row: (row.fitted is None, np.nan_to_num(getattr(row, criterion), nan=np.inf))
+    return Ranking(sorted(rows, key=key), criterion)
@@ -1,8 +1,9 @@
 import numpy as np
-from scipy.stats import t
 from . import distribution
 from . import f, cauchy
 
+stats = distribution._LazyModule('scipy.stats')
+
 class T(distribution.Distribution):
     """
     Student's T Distribution
@@ -23,6 +24,10 @@ class T(distribution.Distribution):
     * X**2 is F-distributed
     * 1 / X**2 is F-distributed
     """
+    _params = ('df',)
+    __slots__ = ('df',)
+    _tabulate = 'inverse'
+
     def __init__(self, df):
         """
         Parameters
@@ -30,20 +35,26 @@ class T(distribution.Distribution):
         df : float, positive (usually integer)
             Degrees of freedom
         """
-        assert df > 0, "df must be positive"
+        assert np.all(df > 0), "df must be positive"
 
         # Parameters
         self.df = df
 
-        # Scipy backend
-        self.sp = t(df)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.t(self.df)
+
     def __repr__(self):
         return f"T(df={self.df})"
 
+    # Native kernels
+    def _rvs(self, size, rng):
+        return rng.standard_t(self.df, size)
+
     def __pow__(self, k):
         assert k == 2 or k == -2, "Only squaring t distribution is supported"
         if k == 2:
@@ -52,7 +63,7 @@ class T(distribution.Distribution):
             return f.F(self.df, 1)
 
     def to_cauchy(self):
-        assert self.df == 1, "Can only convert to Cauchy if df == 1"
+        assert np.all(self.df == 1), "Can only convert to Cauchy if df == 1"
         return cauchy.StandardCauchy()
 
 
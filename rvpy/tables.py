@@ -0,0 +1,292 @@
+import weakref
+
+import numpy as np
+
+from . import distribution
+
+class AliasTable:
+    """
+    Walker/Vose alias table for a distribution on the integers start, ...,
+    start + len(probs) - 1: each draw costs one uniform variate, one table
+    lookup and one comparison, whatever the size of the support.
+    """
+    __slots__ = ('start', 'prob', 'alias')
+
+    def __init__(self, start, probs):
+        probs = np.asarray(probs, dtype=float)
+        m = probs.size
+        scaled = probs * (m / probs.sum())
+        prob = np.ones(m)
+        alias = np.arange(m)
+
+        small = list(np.flatnonzero(scaled < 1))
+        large = list(np.flatnonzero(scaled >= 1))
+        while small and large:
+            s, l = small.pop(), large[-1]
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            if scaled[l] < 1:
+                small.append(large.pop())
+        # Leftovers are 1 up to rounding
+
+        self.start = start
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, size, rng):
+        u = rng.random(size) * self.prob.size
+        k = u.astype(np.int64)
+        k = np.where(u - k < self.prob[k], k, self.alias[k])
+        return self.start + k
+
+class ConditionalAliasTable:
+    """
+    Alias tables of Binomial(m, q) for every number of trials m = 0, ..., n,
+    given their pmfs as the rows of an (n + 1, n + 1) array and stacked the
+    same way, for the conditional binomial draws of a Multinomial: drawing
+    for a whole vector of trial counts costs one uniform variate, one lookup
+    and one comparison per element.
+    """
+    __slots__ = ('width', 'prob', 'alias')
+
+    def __init__(self, pmf):
+        n = pmf.shape[0] - 1
+        prob = np.ones((n + 1, n + 1))
+        alias = np.zeros((n + 1, n + 1), dtype=np.int64)
+        for trials in range(n + 1):
+            table = AliasTable(0, pmf[trials, :trials + 1])
+            prob[trials, :trials + 1] = table.prob
+            alias[trials, :trials + 1] = table.alias
+
+        self.width = n + 1
+        self.prob = prob.ravel()
+        self.alias = alias.ravel()
+
+    def sample(self, trials, rng):
+        return self.lookup(trials, rng.random(trials.shape))
+
+    def lookup(self, trials, u):
+        """Draws for the trial counts trials from the uniform variates u"""
+        u = u * (trials + 1)
+        k = u.astype(np.int64)
+        cell = trials * self.width + k
+        return np.where(u - k < self.prob[cell], k, self.alias[cell])
+
+def _alias_table(rv, tail):
+    # Bounded supports are truncated too, which only matters when they are huge
+    lo, hi = int(rv.quantile(tail)), int(rv.isf(tail))
+    return AliasTable(lo, rv.pmf(np.arange(lo, hi + 1)))
+
+
+class InverseTable:
+    """
+    Tabulated inverse cdf of a continuous distribution, in the spirit of
+    PINV/HINV: a monotone cubic Hermite interpolant of x(u) through nodes
+    (u_i, x_i) with u_i = cdf(x_i) and slopes 1 / pdf(x_i), clipped so the
+    interpolant is monotone on every interval (Fritsch-Carlson). Intervals
+    are bisected until |cdf(x(u)) - u| <= u_error / 2 at check points inside
+    every interval. Outside [u_0, u_m], i.e. the outer tail mass on each
+    side, the exact quantile is used instead.
+
+    Lookups go through a guide table of equal u-cells, so locating the
+    interval of a variate costs one index and one comparison, except in the
+    few cells holding more than one node, which fall back to binary search.
+
+    Nodes whose cdf rounds to 0 or 1, or does not increase, are dropped.
+    Intervals that cannot be resolved to u_error, because x is too coarse
+    there in floating point (e.g. at a pole of the density) or because
+    max_nodes is reached, use the exact quantile as well.
+    """
+    __slots__ = ('rv', 'u', 'x', 'coef', 'exact', 'guide', 'wide')
+
+    # Fractions of each interval where the u-error is checked
+    _CHECKS = np.array([0.125, 0.25, 0.5, 0.75, 0.875])
+    # Guide cells per interval
+    _GUIDE = 4
+
+    def __init__(self, rv, tail, u_error, nodes=64, max_nodes=2**20):
+        self.rv = rv
+        x = rv._evaluate('ppf', np.linspace(tail, 1 - tail, nodes))
+        x = np.unique(x[np.isfinite(x)])
+        with np.errstate(divide='ignore'):
+            u, x, slope = _increasing(rv.cdf(x), x, 1 / rv.pdf(x))
+
+        while True:
+            self._fit(u, x, slope)
+            h = np.diff(u)
+            t = self._CHECKS[:, None]
+            err = np.abs(rv.cdf(self._interpolate(t, slice(None))) - (u[:-1] + t*h))
+            # Half of u_error at the check points leaves a margin for the
+            # error between them
+            bad = np.flatnonzero((err > u_error / 2).any(axis=0))
+            # Split failing intervals at the interpolated median of the interval
+            new_x = self._interpolate(0.5, bad)
+            new_x = new_x[(new_x > x[bad]) & (new_x < x[bad + 1])]
+            if new_x.size == 0 or u.size + new_x.size > max_nodes:
+                break
+            x = np.concatenate([x, new_x])
+            order = np.argsort(x)
+            with np.errstate(divide='ignore'):
+                u, x, slope = _increasing(np.concatenate([u, rv.cdf(new_x)])[order], x[order],
+                                          np.concatenate([slope, 1 / rv.pdf(new_x)])[order])
+            if u.size == self.u.size:
+                # Every new node was dropped
+                break
+
+        m = u.size - 1
+        self.exact = np.zeros(m, dtype=bool)
+        self.exact[bad] = True
+
+        # Guide table: first interval of each of the equal cells of [0, 1]
+        cells = self._GUIDE * m
+        guide = np.clip(np.searchsorted(u, np.arange(cells + 1) / cells, side='right') - 1,
+                        0, m - 1)
+        self.guide = guide[:-1]
+        self.wide = np.diff(guide) > 1
+
+    def _fit(self, u, x, slope):
+        # Per-interval end slopes within [0, 3 * secant] keep each cubic monotone
+        self.u, self.x = u, x
+        h, dx = np.diff(u), np.diff(x)
+        secant = dx / h
+        slope = np.nan_to_num(slope, nan=0., posinf=np.inf)
+        a = h * np.clip(slope[:-1], 0, 3*secant)
+        b = h * np.clip(slope[1:], 0, 3*secant)
+        # Cubic in the fraction t of each interval, highest power first
+        self.coef = np.array([a + b - 2*dx, 3*dx - 2*a - b, a, x[:-1]])
+
+    def _interpolate(self, t, i):
+        # Cubic Hermite at fraction t of the intervals i
+        c3, c2, c1, c0 = self.coef[:, i]
+        return ((c3*t + c2)*t + c1)*t + c0
+
+    def _interval(self, q):
+        m = self.u.size - 1
+        k = np.clip(q * self.guide.size, 0, self.guide.size - 1).astype(np.intp)
+        i = self.guide[k]
+        i = i + ((self.u[i + 1] <= q) & (i < m - 1))
+        wide = np.flatnonzero(self.wide[k])
+        if wide.size:
+            i[wide] = np.clip(np.searchsorted(self.u, q[wide], side='right') - 1, 0, m - 1)
+        return i
+
+    def quantile(self, q):
+        shape = np.shape(q)
+        q = np.asarray(q, dtype=float).ravel()
+        i = self._interval(np.nan_to_num(q))
+        h = self.u[i + 1] - self.u[i]
+        t = np.where(h > 0, (q - self.u[i]) / np.where(h > 0, h, 1), 0.)
+        x = self._interpolate(t, i)
+        exact = ~((q >= self.u[0]) & (q < self.u[-1])) | self.exact[i]
+        if exact.any():
+            x[exact] = self.rv._evaluate('ppf', q[exact])
+        return x.reshape(shape)
+
+    def sample(self, size, rng):
+        return self.quantile(rng.random(size))
+
+def _increasing(u, *arrays):
+    """u and arrays at the nodes whose u is inside (0, 1) and above every earlier u"""
+    previous = np.maximum.accumulate(np.concatenate([[0.], u[:-1]]))
+    keep = (u > previous) & (u < 1)
+    return (u[keep],) + tuple(a[keep] for a in arrays)
+
+def _inverse_table(rv, tail):
+    return InverseTable(rv, tail, distribution._u_error)
+
+def _conditional_tables(rv, tail):
+    # One table per component but the last, of its count given the trials left
+    return [ConditionalAliasTable(pmf) for pmf in rv._conditional_pmfs()]
+
+_BUILDERS = {'alias': _alias_table, 'inverse': _inverse_table,
+             'conditional': _conditional_tables}
+
+def _table(rv):
+    """Sampling table of rv for the current settings, built once per object"""
+    key = ('_' + rv._tabulate, distribution._tail, distribution._u_error)
+    cache = distribution._cache_of(rv)
+    try:
+        return cache[key]
+    except KeyError:
+        table = cache[key] = _BUILDERS[rv._tabulate](rv, distribution._tail)
+        return table
+
+
+class SupportTable:
+    """
+    pmf and cdf of a bounded discrete distribution at every integer of its
+    support lo, ..., lo + len(pmf) - 1, answering pmf, cdf and quantile
+    queries by array indexing and binary search.
+
+    The pmf is computed from the log ratios r(k) = log(pmf(k + 1) / pmf(k)),
+    summed outward from the mode (where r changes sign, for log-concave
+    pmfs), so rounding errors grow only into the tails, then exponentiated
+    and normalized.
+    """
+    __slots__ = ('lo', 'pmf_', 'cdf_', '__weakref__')
+
+    def __init__(self, lo, log_ratio):
+        size = log_ratio.size + 1
+        mode = np.count_nonzero(log_ratio > 0)
+        logpmf = np.empty(size)
+        logpmf[mode] = 0
+        np.cumsum(log_ratio[mode:], out=logpmf[mode + 1:])
+        np.cumsum(log_ratio[:mode][::-1], out=logpmf[:mode][::-1])
+        np.negative(logpmf[:mode], out=logpmf[:mode])
+
+        pmf = np.exp(logpmf, out=logpmf)
+        pmf /= pmf.sum()
+        cdf = np.cumsum(pmf)
+        np.minimum(cdf, 1, out=cdf)
+        cdf[-1] = 1
+
+        self.lo = lo
+        self.pmf_ = pmf
+        self.cdf_ = cdf
+
+    @property
+    def nbytes(self):
+        return self.pmf_.nbytes + self.cdf_.nbytes
+
+    def pmf(self, x):
+        x = np.asarray(x, dtype=float)
+        k = x - self.lo
+        inside = (k >= 0) & (k < self.pmf_.size) & (k == np.floor(k))
+        pmf = np.where(inside, self.pmf_[np.where(inside, k, 0).astype(np.intp)], 0.)
+        return np.where(np.isnan(x), np.nan, pmf)
+
+    def cdf(self, x):
+        x = np.asarray(x, dtype=float)
+        k = np.floor(x) - self.lo
+        cdf = self.cdf_[np.clip(np.nan_to_num(k), 0, self.cdf_.size - 1).astype(np.intp)]
+        cdf = np.where(k < 0, 0., cdf)
+        return np.where(np.isnan(x), np.nan, cdf)
+
+    def quantile(self, q):
+        # Smallest k with cdf(k) >= q, taking a cdf(k) within a relative 1e-12
+        # below q as equal to it, to allow for rounding in the cumsum
+        q = np.asarray(q, dtype=float)
+        u = np.nan_to_num(q)
+        k = np.searchsorted(self.cdf_, u, side='left')
+        below = self.cdf_[np.clip(k - 1, 0, self.cdf_.size - 1)]
+        k = np.where((k > 0) & (below >= u * (1 - 1e-12)), k - 1, k)
+        x = self.lo + np.minimum(k, self.cdf_.size - 1)
+        return distribution._ppf_bounds(q, x, self.lo - 1, self.lo + self.cdf_.size - 1)
+
+# Live support tables, for table_info()
+_support_tables = weakref.WeakSet()
+
+def _support_table(rv):
+    """Full-support table of a scalar rv, built once per object; None if too large"""
+    cache = distribution._cache_of(rv)
+    try:
+        table = cache['_support']
+    except KeyError:
+        table = None
+        lo, hi = rv._support()
+        if hi - lo < distribution._support_max:
+            table = SupportTable(lo, rv._log_ratio(np.arange(lo, hi, dtype=float)))
+            _support_tables.add(table)
+        cache['_support'] = table
+    return table
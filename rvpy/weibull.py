@@ -1,8 +1,10 @@
 import numpy as np
-from scipy.stats import weibull_min, rayleigh
 from . import distribution
 from . import gamma as gamm
 
+special = distribution._LazyModule('scipy.special')
+stats = distribution._LazyModule('scipy.stats')
+
 class Weibull(distribution.Distribution):
     """
     Weibull Distribution using the following parameterization:
@@ -22,6 +24,10 @@ class Weibull(distribution.Distribution):
         Converts self to Exponential if gamma == 1
     to_rayleigh()
         Converts self to Rayleigh if gamma == 2
+    fit(data, method='mle', chunk_size=2**20)
+        Class method. Maximum likelihood takes one pass over the data per
+        Newton step, so data must be an array or memmap rather than a stream
+        of chunks or a summary.
 
     Relationships
     -------------
@@ -29,6 +35,10 @@ class Weibull(distribution.Distribution):
     * X is also Exponential if gamma == 1
     * X is also Rayleigh if gamma == 2
     """
+    _params = ('gamma', 'beta')
+    __slots__ = ('gamma', 'beta')
+    _fit_transforms = ('x', 'log')
+
     def __init__(self, gamma, beta):
         """
         Parameters
@@ -38,26 +48,110 @@ class Weibull(distribution.Distribution):
         beta : float, positive
             Scale parameter
         """
-        assert gamma > 0 and beta > 0, "gamma and beta must be positive"
+        assert np.all(gamma > 0) and np.all(beta > 0), "gamma and beta must be positive"
 
         self.gamma = gamma
         self.beta = beta
 
-        # Scipy backend
-        self.sp = weibull_min(c=gamma, scale=beta)
-
         # Initialize super
         super().__init__()
 
+    # Scipy backend, built on first use
+    @distribution._cached
+    def sp(self):
+        return stats.weibull_min(c=self.gamma, scale=self.beta)
+
     def __repr__(self):
         return f"Weibull(gamma={self.gamma}, beta={self.beta})"
 
+    # Native kernels
+    def _pdf(self, x):
+        return np.exp(self._logpdf(x))
+
+    def _logpdf(self, x):
+        y = x / self.beta
+        logpdf = np.log(self.gamma / self.beta) + special.xlogy(self.gamma - 1, y) - y**self.gamma
+        return np.where(x < 0, -np.inf, logpdf)
+
+    def _cdf(self, x):
+        return np.where(x < 0, 0., -np.expm1(-(x / self.beta)**self.gamma))
+
+    def _logcdf(self, x):
+        # log(1 - exp(-t)) is log(t) - t/2 to double precision for tiny t,
+        # taken from log(t) itself so that t may underflow
+        log_t = self.gamma * np.log(x / self.beta)
+        t = np.exp(log_t)
+        logcdf = np.where(t < 1e-10, log_t - t/2, np.log(-np.expm1(-t)))
+        return np.where(x < 0, -np.inf, logcdf)
+
+    def _sf(self, x):
+        return np.exp(self._logsf(x))
+
+    def _logsf(self, x):
+        return np.where(x < 0, 0., -(x / self.beta)**self.gamma)
+
+    def _ppf(self, q):
+        x = self.beta * (-np.log1p(-q))**(1 / self.gamma)
+        return distribution._ppf_bounds(q, x, 0., np.inf)
+
+    def _isf(self, q):
+        x = self.beta * (-np.log(q))**(1 / self.gamma)
+        return distribution._ppf_bounds(q, x, np.inf, 0.)
+
+    def _rvs(self, size, rng):
+        return self.beta * rng.weibull(self.gamma, size)
+
+    @classmethod
+    def _fit(cls, s, method):
+        if method == 'mle':
+            # Starting point for fit(): log X is a Gumbel (minimum) with scale
+            # 1 / gamma, so var(log X) = pi**2 / (6 gamma**2)
+            gamma = np.pi / np.sqrt(6 * s.var_of('log'))
+            return gamma, np.exp(s.mean_of('log') + np.euler_gamma / gamma)
+        # Solve var / mean**2 = Gamma(1 + 2/gamma) / Gamma(1 + 1/gamma)**2 - 1 by
+        # bisection on log(gamma) in [log(1e-3), log(1e4)], over which the ratio
+        # decreases, for all groups at once
+        mean = s.mean_of('x')
+        target = np.log1p(s.var_of('x') / mean**2)
+        lo = np.full(np.shape(mean), np.log(1e-3))
+        hi = np.full(np.shape(mean), np.log(1e4))
+        for _ in range(64):
+            mid = (lo + hi) / 2
+            g = np.exp(mid)
+            above = special.gammaln(1 + 2/g) - 2*special.gammaln(1 + 1/g) > target
+            lo, hi = np.where(above, mid, lo), np.where(above, hi, mid)
+        gamma = np.exp((lo + hi) / 2)
+        return gamma, mean / special.gamma(1 + 1/gamma)
+
+    @classmethod
+    def _fit_passes(cls, params, s, sums):
+        # Newton's method on 1/gamma + mean(log y) - sum(y**gamma log y) / sum(y**gamma) = 0,
+        # with y = x scaled by its geometric mean, so that mean(log y) = 0
+        scale = np.asarray(np.exp(s.mean_of('log')))
+        gamma = np.asarray(params[0], dtype=float)
+        def moments(x, i):
+            y = x / scale[i]
+            w, logy = y**gamma[i], np.log(y)
+            return w, w * logy, w * logy**2
+
+        active = np.ones(np.shape(gamma), dtype=bool)
+        for _ in range(100):
+            a, b, c = sums(moments, active)
+            ratio = b / a
+            step = np.where(active, (1/gamma - ratio) / (-1/gamma**2 - (c/a - ratio**2)), 0)
+            gamma = gamma - step
+            active &= np.abs(step) > 1e-10 * gamma
+            if not np.any(active):
+                break
+        a = sums(moments)[0]
+        return gamma, scale * (a / s.n)**(1 / gamma)
+
     def to_exponential(self):
-        assert self.gamma == 1, "gamma must be 1 to cast as Exponential"
+        assert np.all(self.gamma == 1), "gamma must be 1 to cast as Exponential"
         return gamm.Exponential(self.beta)
 
     def to_rayleigh(self):
-        assert self.gamma == 2, "beta must be 2 to cast as Rayleigh"
+        assert np.all(self.gamma == 2), "beta must be 2 to cast as Rayleigh"
         return Rayleigh(self.beta / 2**0.5)
 
     # TODO: .to_gumbel() --> ???
@@ -85,6 +179,9 @@ class Rayleigh(Weibull):
     * X**2 is Gamma (not yet implemented)
     * X**2 is ChiSquare if scale == 1 (not yet implemented)
     """
+    _params = ('scale',)
+    __slots__ = ('scale', 'sigma')
+
     def __init__(self, scale):
         """
         Parameters
@@ -92,20 +189,32 @@ class Rayleigh(Weibull):
         scale : float, positive
             Scale parameter
         """
-        assert scale > 0, "scale parameter must be positive"
+        assert np.all(scale > 0), "scale parameter must be positive"
 
         self.scale = scale
         self.sigma = scale
 
-        # Scipy backend
-        self.sp = rayleigh(scale=scale)
-
         # Initialize super
         super().__init__(2, scale * 2**0.5)
 
     def __repr__(self):
         return f"Rayleigh(scale={self.scale})"
 
+    # Native kernels
+    def _pdf(self, x):
+        s2 = self.scale**2
+        return np.where(x < 0, 0., x / s2 * np.exp(-x**2 / (2*s2)))
+
+    def _cdf(self, x):
+        return np.where(x < 0, 0., -np.expm1(-x**2 / (2*self.scale**2)))
+
+    def _ppf(self, q):
+        x = self.scale * np.sqrt(-2 * np.log1p(-q))
+        return distribution._ppf_bounds(q, x, 0., np.inf)
+
+    def _rvs(self, size, rng):
+        return rng.rayleigh(self.scale, size)
+
     def to_weibull(self):
         return Weibull(2, self.scale * 2**0.5)
 
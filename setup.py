@@ -1,8 +1,8 @@
 from setuptools import setup
 import sys
 
-if sys.version_info < (3, 6):
-    sys.exit("Sorry, this package requires at least Python 3.6")
+if sys.version_info < (3, 7):
+    sys.exit("Sorry, this package requires at least Python 3.7")
 
 setup(name="rvpy",
       version="0.3",
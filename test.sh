@@ -30,7 +30,7 @@ if [[ $# -eq 0 ]]; then
     dists=( \
         "normal" "binomial" "cuniform" "beta" "t" "f" "gamma" "poisson" \
         "cauchy" "laplace" "duniform" "weibull" "negbin" "hypergeom" \
-        "pareto" "lognormal" "logistic" "gompertz" "gumbel" "degenerate" \
+        "pareto" "lognormal" "logistic" "gompertz" "gumbel" "degenerate" "lattice" "multivariate" "fitting" "conjugate" "online" "montecarlo" "distribution" "import" \
         )
     for dist in ${dists[@]}
     do
@@ -2,6 +2,8 @@ import unittest
 import sys
 import random
 
+import numpy as np
+
 sys.path.append('..')
 
 import rvpy
@@ -49,6 +51,25 @@ class BinomialTests(unittest.TestCase):
         self.assertEqual(self.Y.cdf(0), self.Y.q)
         self.assertEqual(self.Y.cdf(1), 1)
 
+    def test_bin_logpmf(self):
+        X = rvpy.Binomial(10**6, 0.5)
+        self.assertEqual(X.pmf(0), 0)
+        self.assertAlmostEqual(X.logpmf(0), 10**6 * np.log(0.5), places=4)
+        self.assertAlmostEqual(self.X.logpmf(1), np.log(self.X.pmf(1)))
+
+    def test_bin_log_tails(self):
+        # Far tails where cdf and sf underflow, against sums of the pmf in mpmath
+        X = rvpy.Binomial(10**6, 0.5)
+        np.testing.assert_allclose(X.logcdf([400000, 10]),
+                                   [-20141.528094297161, -693024.12990193875], rtol=1e-12)
+        np.testing.assert_allclose(X.logsf([600000, 999990]),
+                                   [-20141.933569404769, -693035.64281940371], rtol=1e-12)
+        self.assertEqual(X.logcdf(-1), -np.inf)
+        self.assertEqual(X.logsf(10**6), -np.inf)
+        self.assertAlmostEqual(self.X.logcdf(0.5), np.log(self.X.cdf(0)))
+        Y = rvpy.Binomial(np.array([10**6, 10]), 0.5)
+        np.testing.assert_allclose(Y.logsf([999990, 3]), [-693035.64281940371, np.log(53/64)])
+
     def test_bin_conversion(self):
         self.assertIsInstance(self.Y.to_binomial(), rvpy.Binomial)
         Z = rvpy.Binomial(1, 0.5)
@@ -75,6 +96,10 @@ class BinomialTests(unittest.TestCase):
 
         self.assertEqual(ber_cum.p, p_ber)
         self.assertEqual(ber_cum.n, n_ber)
+
+        # ... and so is sum_iid, for any n
+        self.assertEqual(rvpy.Bernoulli(p_ber).sum_iid(10**9), rvpy.Binomial(10**9, p_ber))
+        self.assertEqual(X.sum_iid(3), rvpy.Binomial(3*X.n, p))
         
 
     def test_bin_errors(self):
@@ -3,6 +3,8 @@ import sys
 import random
 from math import isnan
 
+import numpy as np
+
 sys.path.append('..')
 
 import rvpy
@@ -29,6 +31,11 @@ class CauchyTests(unittest.TestCase):
         self.assertAlmostEqual(self.X.cdf(0), 0.5)
         self.assertAlmostEqual(self.Y.cdf(self.Y.loc), 0.5)
 
+    def test_cauchy_logpdf(self):
+        self.assertAlmostEqual(self.X.logpdf(1e300), -np.log(np.pi) - 600*np.log(10))
+        self.assertAlmostEqual(self.X.logpdf(-1e300), -np.log(np.pi) - 600*np.log(10))
+        self.assertAlmostEqual(self.Y.logpdf(self.Y.loc + 3), np.log(self.Y.pdf(self.Y.loc + 3)))
+
     def test_cauchy_conversion(self):
         Z1 = rvpy.Cauchy().to_standard()
         self.assertIsInstance(Z1, rvpy.StandardCauchy)
@@ -92,6 +99,12 @@ class CauchyTests(unittest.TestCase):
         self.assertEqual(Zinv.loc, 0)
         self.assertAlmostEqual(Zinv.scale, 1/d)
 
+    def test_cauchy_sum_iid(self):
+        n = random.randint(2, 10**9)
+        self.assertIs(self.Y.mean_iid(n), self.Y)
+        self.assertEqual(self.Y.sum_iid(n), rvpy.Cauchy(n*self.Y.loc, n*self.Y.scale))
+        self.assertEqual(self.X.sum_iid(n), rvpy.Cauchy(0, n))
+
     def test_cauchy_errors(self):
         with self.assertRaises(AssertionError): rvpy.Cauchy(0, -1)
         with self.assertRaises(AssertionError):
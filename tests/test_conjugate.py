@@ -0,0 +1,105 @@
+import unittest
+import sys
+
+import numpy as np
+
+sys.path.append('..')
+
+import rvpy
+
+class ConjugateTests(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_beta_binomial(self):
+        x = self.rng.binomial(10, 0.3, 1000)
+        posterior = rvpy.Beta(2., 3.).given(rvpy.Binomial, x, n=10)
+        self.assertIsInstance(posterior, rvpy.Beta)
+        self.assertAlmostEqual(posterior.alpha, 2 + x.sum())
+        self.assertAlmostEqual(posterior.beta, 3 + 10 * x.size - x.sum())
+
+        y = np.array([1, 0, 1, 1])
+        self.assertEqual(rvpy.Beta(1., 1.).given(rvpy.Bernoulli, y), rvpy.Beta(4., 2.))
+        with self.assertRaises(AssertionError):
+            rvpy.Beta(1., 1.).given(rvpy.Binomial, x)
+        with self.assertRaises(AssertionError):
+            rvpy.Beta(1., 1.).given(rvpy.Binomial, [11], n=10)
+
+    def test_gamma_poisson_exponential(self):
+        x = self.rng.poisson(4., 1000)
+        posterior = rvpy.Gamma(2., 0.5).given(rvpy.Poisson, x)
+        self.assertAlmostEqual(posterior.alpha, 2 + x.sum())
+        self.assertAlmostEqual(posterior.beta, 1 / (2 + x.size))
+
+        y = self.rng.exponential(2., 1000)
+        posterior = rvpy.Gamma(2., 0.5).given(rvpy.Exponential, y)
+        self.assertAlmostEqual(posterior.alpha, 2 + y.size)
+        self.assertAlmostEqual(posterior.beta, 1 / (2 + y.sum()))
+
+    def test_normal_normal(self):
+        x = self.rng.normal(5., 2., 1000)
+        posterior = rvpy.Normal(0., 10.).given(rvpy.Normal, x, sigma=2.)
+        precision = 1 / 100 + x.size / 4
+        self.assertAlmostEqual(posterior.mu, x.sum() / 4 / precision)
+        self.assertAlmostEqual(posterior.sigma, precision**-0.5)
+        with self.assertRaises(AssertionError):
+            rvpy.Normal(0., 10.).given(rvpy.Normal, x)
+
+    def test_gamma_normal_precision(self):
+        x = self.rng.normal(1., 0.5, 1000)
+        posterior = rvpy.Gamma(2., 1.).given(rvpy.Normal, x, mu=1.)
+        self.assertAlmostEqual(posterior.alpha, 2 + x.size / 2)
+        self.assertAlmostEqual(1 / posterior.beta, 1 + np.sum((x - 1)**2) / 2)
+
+    def test_streaming_and_summaries(self):
+        x = self.rng.normal(5., 2., 10**5)
+        prior = rvpy.Normal(0., 10.)
+        expected = prior.given(rvpy.Normal, x, sigma=2.)
+        chunks = (x[i:i + 1000] for i in range(0, x.size, 1000))
+        for data in [chunks, rvpy.Normal.statistics(x)]:
+            posterior = prior.given(rvpy.Normal, data, sigma=2.)
+            self.assertAlmostEqual(posterior.mu, expected.mu)
+            self.assertAlmostEqual(posterior.sigma, expected.sigma)
+        # No observations leave the prior as it is
+        self.assertEqual(prior.given(rvpy.Normal, [], sigma=2.), prior)
+
+    def test_batched_priors(self):
+        prior = rvpy.Gamma(np.full(5, 2.), 1.)
+        x = self.rng.poisson(3., (20, 5))
+        posterior = prior.given(rvpy.Poisson, x)
+        np.testing.assert_allclose(posterior.alpha, 2 + x.sum(axis=0))
+        np.testing.assert_allclose(posterior.beta, 1 / 21)
+
+        # One observation per prior, with per-element known parameters
+        trials = np.array([10, 20, 30, 40, 50])
+        successes = np.array([1, 5, 10, 20, 49])
+        posterior = rvpy.Beta(np.ones(5), np.ones(5)).given(rvpy.Binomial, successes, n=trials)
+        np.testing.assert_allclose(posterior.alpha, 1 + successes)
+        np.testing.assert_allclose(posterior.beta, 1 + trials - successes)
+
+        with self.assertRaises(AssertionError):
+            prior.given(rvpy.Poisson, np.ones((20, 4)))
+
+    def test_grouped_observations(self):
+        arms = 1000
+        prior = rvpy.Beta(np.ones(arms), np.full(arms, 2.))
+        arm = self.rng.integers(0, arms - 1, 10**5)
+        clicks = (self.rng.random(arm.size) < 0.1).astype(float)
+        posterior = prior.given(rvpy.Bernoulli, clicks, groups=arm)
+        successes = np.bincount(arm, clicks, minlength=arms)
+        trials = np.bincount(arm, minlength=arms)
+        np.testing.assert_allclose(posterior.alpha, 1 + successes)
+        np.testing.assert_allclose(posterior.beta, 2 + trials - successes)
+        # The last arm has no observations
+        self.assertEqual((posterior.alpha[-1], posterior.beta[-1]), (1, 2))
+
+        with self.assertRaises(AssertionError):
+            prior.given(rvpy.Bernoulli, clicks, groups=arm + arms)
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            rvpy.Beta(1., 1.).given(rvpy.Poisson, [1])
+        with self.assertRaises(TypeError):
+            rvpy.Normal(0., 1.).given(rvpy.Gamma, [1.])
+        with self.assertRaises(TypeError):
+            rvpy.Weibull(1., 1.).given(rvpy.Poisson, [1])
@@ -28,6 +28,14 @@ class DegenerateTests(unittest.TestCase):
         self.assertEqual(self.X.cdf(self.k - 0.0001), 0)
         self.assertEqual(self.X.cdf(self.k), 1)
 
+    def test_degenerate_log_sf(self):
+        self.assertEqual(self.X.logpdf(self.k), 0)
+        self.assertEqual(self.X.logpdf(self.k + 1), -np.inf)
+        self.assertEqual(self.X.sf(self.k - 0.0001), 1)
+        self.assertEqual(self.X.sf(self.k), 0)
+        self.assertEqual(self.X.logcdf(self.k - 0.0001), -np.inf)
+        self.assertEqual(self.X.logsf(self.k - 0.0001), 0)
+
     def test_degenerate_add_sub(self):
         c = 5*random.random()
         Y = self.X + c
@@ -0,0 +1,573 @@
+import unittest
+import sys
+import random
+import tempfile
+import os
+import warnings
+
+import numpy as np
+from scipy import stats
+
+sys.path.append('..')
+
+import rvpy
+from rvpy import distribution
+
+class DistributionTests(unittest.TestCase):
+    def setUp(self):
+        self.mu = random.random()
+        self.sigma = random.random() + 0.5
+        self.X = rvpy.Normal(self.mu, self.sigma)
+
+    def test_lazy_moments(self):
+        # Nothing is computed at construction
+        for attr in ('mean', 'var', 'std', 'skew', 'kurtosis', 'median', 'entropy'):
+            self.assertNotIn(attr, distribution._cache_of(self.X))
+
+        # Accessing an attribute computes and caches only that attribute
+        self.assertEqual(self.X.mean, self.mu)
+        self.assertIn('mean', distribution._cache_of(self.X))
+        self.assertNotIn('entropy', distribution._cache_of(self.X))
+
+    def test_lazy_backend(self):
+        Y, Z = rvpy.Normal(1, 2), rvpy.Normal(-1, 0.5)
+        S = self.X + Y + Z
+        for V in (self.X, Y, Z, S):
+            self.assertNotIn('sp', distribution._cache_of(V))
+
+        self.assertAlmostEqual(S.sp.mean(), self.mu)
+        self.assertIn('sp', distribution._cache_of(S))
+        self.assertIs(S.sp, S.sp)
+
+    def test_cached_moment_values(self):
+        self.assertAlmostEqual(self.X.var, self.sigma**2)
+        self.assertAlmostEqual(self.X.std, self.sigma)
+        self.assertAlmostEqual(self.X.median, self.mu)
+        self.assertAlmostEqual(self.X.entropy, float(self.X.sp.entropy()))
+        self.assertIs(self.X.entropy, self.X.entropy)
+
+class BatchTests(unittest.TestCase):
+    def setUp(self):
+        self.mu = np.random.randn(5)
+        self.sigma = np.random.rand(5) + 0.5
+        self.X = rvpy.Normal(self.mu, self.sigma)
+
+    def test_batch_shape_and_moments(self):
+        self.assertEqual(self.X.shape, (5,))
+        self.assertEqual(rvpy.Normal().shape, ())
+        np.testing.assert_allclose(self.X.mean, self.mu)
+        np.testing.assert_allclose(self.X.std, self.sigma)
+
+    def test_batch_methods_broadcast(self):
+        np.testing.assert_allclose(self.X.cdf(self.mu), 0.5)
+        np.testing.assert_allclose(self.X.quantile(0.5), self.mu)
+        np.testing.assert_allclose(self.X.mgf(0), 1)
+        self.assertEqual(self.X.pdf(0).shape, (5,))
+        self.assertEqual(self.X.sample(7).shape, (7, 5))
+        self.assertEqual(self.X.sample(2, 3).shape, (2, 3, 5))
+
+    def test_batch_indexing(self):
+        X2 = self.X[2]
+        self.assertIsInstance(X2, rvpy.Normal)
+        self.assertEqual(X2.shape, ())
+        self.assertEqual(X2.mu, self.mu[2])
+        with self.assertRaises(TypeError): rvpy.Normal()[0]
+
+    def test_batch_arithmetic(self):
+        Y = self.X + self.X
+        np.testing.assert_allclose(Y.sigma, 2**0.5 * self.sigma)
+        np.testing.assert_allclose((self.X * 2).sigma, 2*self.sigma)
+        np.testing.assert_allclose((np.arange(5) + self.X).mu, self.mu + np.arange(5))
+
+        G = rvpy.Gamma(np.array([1., 2.]), 3.) + rvpy.Gamma(2., 3.)
+        np.testing.assert_allclose(G.alpha, [3., 4.])
+
+        B = rvpy.Binomial(np.array([3, 4]), 0.25) + rvpy.Bernoulli(0.25)
+        self.assertIsInstance(B, rvpy.Binomial)
+        np.testing.assert_array_equal(B.n, [4, 5])
+
+        P = rvpy.Poisson(np.array([1, 2])) + rvpy.Poisson(3)
+        np.testing.assert_array_equal(P.mu, [4, 5])
+
+    def test_batch_errors(self):
+        with self.assertRaises(AssertionError): rvpy.Normal(0, np.array([1., -1.]))
+        with self.assertRaises(AssertionError): rvpy.Poisson(np.array([1.5, 2.]))
+        with self.assertRaises(ValueError):
+            rvpy.Gamma(1., np.array([1., 2.])) + rvpy.Gamma(1., 1.)
+
+class NativeBackendTests(unittest.TestCase):
+    def setUp(self):
+        self.dists = [
+            rvpy.Normal(1., 2.), rvpy.LogNormal(0.3, 0.7),
+            rvpy.Gamma(0.5, 2.), rvpy.Gamma(4.5, 0.3), rvpy.Exponential(2.),
+            rvpy.ChiSq(3), rvpy.CUniform(-1, 3), rvpy.Laplace(1, 2),
+            rvpy.Cauchy(-1, 0.5), rvpy.Logistic(1, 2), rvpy.LogLogistic(2., 0.5),
+            rvpy.LogLogistic(2., 3.), rvpy.Pareto(1.5, 2.5), rvpy.Weibull(0.7, 2.),
+            rvpy.Weibull(3., 2.), rvpy.Rayleigh(1.5), rvpy.Gumbel(1., 2.),
+            rvpy.Gompertz(0.5, 0.5), rvpy.Normal(np.array([0., 1.]), np.array([1., 3.])),
+        ]
+        self.x = np.concatenate([np.random.normal(0, 2, 100), [-np.inf, np.inf, 0., 1.5]])
+        self.q = np.concatenate([np.random.random(100), [0., 1., -0.1, 1.1]])
+
+    def tearDown(self):
+        rvpy.set_backend('native')
+
+    def test_native_matches_scipy(self):
+        for X in self.dists:
+            x = self.x if X.shape == () else self.x[:, None]
+            q = self.q if X.shape == () else self.q[:, None]
+            for name in ('pdf', 'logpdf', 'cdf', 'logcdf', 'sf', 'logsf'):
+                np.testing.assert_allclose(getattr(X, name)(x), getattr(X.sp, name)(x),
+                        rtol=1e-8, atol=1e-12, err_msg=f"{X}.{name}")
+            np.testing.assert_allclose(X.quantile(q), X.sp.ppf(q), rtol=1e-8)
+            np.testing.assert_allclose(X.isf(q), X.sp.isf(q), rtol=1e-8)
+
+    def test_native_scalars(self):
+        X = rvpy.Normal(1., 2.)
+        self.assertIsInstance(X.pdf(1.), np.float64)
+        self.assertAlmostEqual(X.cdf(1), 0.5)
+        self.assertAlmostEqual(X.quantile(0.5), 1)
+
+    def test_scipy_backend(self):
+        rvpy.set_backend('scipy')
+        X = rvpy.Gumbel(1., 2.)
+        self.assertEqual(X.cdf(2.), X.sp.cdf(2.))
+        with self.assertRaises(AssertionError): rvpy.set_backend('fortran')
+
+class SamplingTests(unittest.TestCase):
+    def tearDown(self):
+        rvpy.set_rng(None)
+        rvpy.set_backend('native')
+
+    def test_sample_reproducible(self):
+        X = rvpy.Gamma(2.5, 1.5)
+        np.testing.assert_array_equal(X.sample(10, rng=7), X.sample(10, rng=7))
+
+        rng1, rng2 = np.random.default_rng(3), np.random.default_rng(3)
+        np.testing.assert_array_equal(X.sample(10, rng=rng1), X.sample(10, rng=rng2))
+
+        rvpy.set_rng(11)
+        x = X.sample(10)
+        rvpy.set_rng(11)
+        np.testing.assert_array_equal(x, X.sample(10))
+
+    def test_sample_shapes(self):
+        self.assertIsInstance(rvpy.Normal().sample(), np.float64)
+        self.assertEqual(rvpy.Poisson(3).sample(4, 5).shape, (4, 5))
+        self.assertEqual(rvpy.Binomial(np.array([3, 4]), 0.5).sample(6).shape, (6, 2))
+
+    def test_native_samplers_match_distribution(self):
+        rng = np.random.default_rng(0)
+        dists = [
+            rvpy.Pareto(1.5, 2.5), rvpy.Weibull(1.7, 2.), rvpy.Gompertz(0.5, 2.),
+            rvpy.LogLogistic(2., 3.), rvpy.Cauchy(-1, 0.5), rvpy.Gumbel(1., 2.),
+        ]
+        for X in dists:
+            x = X.sample(5000, rng=rng)
+            self.assertGreater(stats.kstest(x, X.sp.cdf).pvalue, 1e-4, msg=str(X))
+
+        # numpy's hypergeometric is parameterized by good/bad counts
+        H = rvpy.Hypergeometric(20, 7, 12)
+        h = H.sample(5000, rng=rng)
+        self.assertTrue(np.all((h >= 0) & (h <= 7)))
+        self.assertAlmostEqual(h.mean(), H.mean, delta=0.1)
+
+    def test_scipy_backend_sampling(self):
+        rvpy.set_backend('scipy')
+        X = rvpy.Normal(1., 2.)
+        np.testing.assert_array_equal(X.sample(5, rng=2), X.sp.rvs(size=5, random_state=np.random.default_rng(2)))
+
+class StreamingTests(unittest.TestCase):
+    def setUp(self):
+        self.dists = [
+            rvpy.Normal(1., 2.), rvpy.Gamma(0.5, 2.), rvpy.Beta(0.5, 3.),
+            rvpy.Binomial(1000, 0.3), rvpy.Poisson(400), rvpy.Hypergeometric(20, 7, 12),
+            rvpy.Normal(np.arange(3.), 1.),
+        ]
+
+    def test_sample_iter_matches_sample(self):
+        for X in self.dists:
+            chunks = list(X.sample_iter(1001, chunk_size=300, rng=42))
+            self.assertEqual([len(c) for c in chunks], [300, 300, 300, 101])
+            np.testing.assert_array_equal(np.concatenate(chunks), X.sample(1001, rng=42))
+
+    def test_sample_into(self):
+        X = rvpy.Normal(np.arange(3.), 1.)
+        out = np.empty((1000, 3))
+        self.assertIs(X.sample_into(out, chunk_size=64, rng=5), out)
+        np.testing.assert_array_equal(out, X.sample(1000, rng=5))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            mm = np.memmap(os.path.join(tmp, 'draws'), dtype=float, mode='w+', shape=(500, 2, 3))
+            X.sample_into(mm, chunk_size=100, rng=5)
+            np.testing.assert_array_equal(mm, X.sample(500, 2, rng=5))
+            del mm
+
+        with self.assertRaises(AssertionError): X.sample_into(np.empty((10, 4)))
+
+class ParallelTests(unittest.TestCase):
+    def test_parallel_reproducible(self):
+        X = rvpy.Gamma(2.5, 1.5)
+        a = X.sample(10001, rng=3, workers=3)
+        np.testing.assert_array_equal(a, X.sample(10001, rng=3, workers=3))
+        self.assertEqual(a.shape, (10001,))
+        self.assertAlmostEqual(a.mean(), X.mean, delta=0.2)
+
+        # Different worker counts give different, but valid, streams
+        self.assertFalse(np.array_equal(a, X.sample(10001, rng=3, workers=2)))
+
+    def test_parallel_threads_match_processes(self):
+        B = rvpy.Binomial(np.array([3, 30]), 0.5)
+        np.testing.assert_array_equal(
+            rvpy.parallel_sample(B, 500, 4, rng=1, workers=3),
+            rvpy.parallel_sample(B, 500, 4, rng=1, workers=3, threads=True)
+        )
+
+    def test_parallel_processes_inherit_settings(self):
+        # Spawned workers start from the defaults unless given the parent's
+        import multiprocessing
+        X = rvpy.Poisson(4)
+        rvpy.set_tabulated(True)
+        try:
+            np.testing.assert_array_equal(
+                rvpy.parallel_sample(X, 1000, rng=3, workers=2,
+                                     mp_context=multiprocessing.get_context('spawn')),
+                rvpy.parallel_sample(X, 1000, rng=3, workers=2, threads=True)
+            )
+        finally:
+            rvpy.set_tabulated(False)
+
+class InterningTests(unittest.TestCase):
+    def tearDown(self):
+        rvpy.set_interning(False)
+
+    def test_slots(self):
+        X = rvpy.Exponential(2.0)
+        self.assertFalse(hasattr(X, '__dict__'))
+        with self.assertRaises(AttributeError): X.foo = 1
+
+        # Degenerate still assigns its moments directly
+        D = rvpy.Degenerate(3)
+        self.assertEqual((D.mean, D.var), (3, 0))
+
+    def test_value_equality(self):
+        self.assertEqual(rvpy.Normal(0, 1), rvpy.Normal(0., 1.))
+        self.assertEqual(hash(rvpy.Normal(0, 1)), hash(rvpy.Normal(0., 1.)))
+        self.assertNotEqual(rvpy.Normal(0, 1), rvpy.StandardNormal())
+        self.assertNotEqual(rvpy.Normal(0, 1), rvpy.Normal(0, 2))
+        self.assertNotEqual(rvpy.Normal(0, 1), 0)
+        self.assertEqual(len({rvpy.ChiSq(1), rvpy.ChiSq(1), rvpy.ChiSq(2)}), 2)
+
+        X = rvpy.Normal(np.arange(3.), 1.)
+        self.assertEqual(X, rvpy.Normal(np.arange(3), 1))
+        self.assertEqual(hash(X), hash(rvpy.Normal(np.arange(3), 1)))
+        self.assertNotEqual(X, rvpy.Normal(np.arange(3.)[::-1], 1.))
+
+    def test_interning(self):
+        self.assertIsNot(rvpy.ChiSq(1), rvpy.ChiSq(1))
+
+        rvpy.set_interning(True)
+        self.assertIs(rvpy.StandardNormal(), rvpy.StandardNormal())
+        self.assertIs(rvpy.ChiSq(1), rvpy.ChiSq(1))
+        self.assertIs(rvpy.Exponential(2.0), rvpy.Exponential(scale=2.0))
+        self.assertIsNot(rvpy.Exponential(2.0), rvpy.Exponential(3.0))
+
+        # Batches are never interned
+        self.assertIsNot(rvpy.Poisson(np.ones(2, dtype=int)), rvpy.Poisson(np.ones(2, dtype=int)))
+
+        # Equal parameters of other types are distinct, and validated
+        self.assertIsInstance(rvpy.Normal(0.0, 1.0).mu, float)
+        self.assertIsInstance(rvpy.Normal(0, 1).mu, int)
+        self.assertIsNot(rvpy.Normal(0, 1), rvpy.Normal(0.0, 1.0))
+        self.assertIs(rvpy.Normal(0.0, 1.0), rvpy.Normal(0.0, 1.0))
+        rvpy.Poisson(3)
+        with self.assertRaises(AssertionError):
+            rvpy.Poisson(3.0)
+
+        rvpy.set_interning(False)
+        self.assertIsNot(rvpy.ChiSq(1), rvpy.ChiSq(1))
+
+class LazyTests(unittest.TestCase):
+    def setUp(self):
+        rvpy.set_lazy(True)
+
+    def tearDown(self):
+        rvpy.set_lazy(False)
+
+    def test_lazy_sum_collapses(self):
+        S = sum(rvpy.Normal(i, 1) for i in range(100))
+        self.assertIsInstance(S, rvpy.expression.Expression)
+        self.assertAlmostEqual(S.mean, 4950)
+        self.assertAlmostEqual(S.std, 10)
+        self.assertIsInstance(S.evaluate(), rvpy.Normal)
+        self.assertIs(S.evaluate(), S.evaluate())
+
+        self.assertEqual(sum(rvpy.Poisson(i) for i in range(1, 5)).evaluate(), rvpy.Poisson(10))
+        self.assertEqual(sum(rvpy.Binomial(i, 0.3) for i in range(1, 5)).evaluate(), rvpy.Binomial(10, 0.3))
+        self.assertEqual(sum(rvpy.ChiSq(i) for i in range(1, 5)).evaluate(), rvpy.ChiSq(10))
+        self.assertEqual(sum(rvpy.Gamma(i, 2) for i in range(1, 5)).evaluate(), rvpy.Gamma(10, 2))
+        self.assertEqual((rvpy.ChiSq(2) + rvpy.Exponential(2)).evaluate(), rvpy.Gamma(2, 2))
+
+    def test_lazy_matches_eager(self):
+        X, Y = rvpy.Normal(1, 2), rvpy.Normal(-1, 0.5)
+        lazy = [X - Y, 2*X/4 + 3, 1 - X, rvpy.exp(X), rvpy.Exponential(2) - rvpy.Exponential(2)]
+        rvpy.set_lazy(False)
+        eager = [X - Y, 2*X/4 + 3, 1 - X, rvpy.exp(X), rvpy.Exponential(2) - rvpy.Exponential(2)]
+        for l, e in zip(lazy, eager):
+            self.assertIsInstance(l, rvpy.expression.Expression)
+            self.assertEqual(type(l.evaluate()), type(e))
+            self.assertAlmostEqual(l.mean, e.mean)
+            self.assertAlmostEqual(l.var, e.var)
+
+    def test_lazy_rpow(self):
+        X = rvpy.Normal(0, 1)
+        E = 2 ** (X + 1)
+        self.assertIsInstance(E, rvpy.expression.Expression)
+        self.assertEqual(E.op, '__rpow__')
+        self.assertEqual(repr(E), "Expression(2**(Normal(mu=0, sigma=1) + 1))")
+        with self.assertRaises(TypeError): E.evaluate()
+        self.assertEqual((2 ** X).op, '__rpow__')
+
+    def test_lazy_errors_on_evaluation(self):
+        S = rvpy.Gamma(1, 2) + rvpy.Gamma(1, 3)
+        with self.assertRaises(ValueError): S.evaluate()
+        with self.assertRaises(TypeError): (rvpy.Binomial(3, 0.2) + rvpy.Binomial(3, 0.5)).evaluate()
+
+    def test_lazy_deep_chain(self):
+        E = rvpy.Normal(0, 1)
+        for _ in range(5000):
+            E = E*1 + 1
+        self.assertEqual(E.evaluate(), rvpy.Normal(5000, 1))
+
+class CacheTests(unittest.TestCase):
+    def setUp(self):
+        rvpy.set_cache(4)
+
+    def tearDown(self):
+        rvpy.set_cache(0)
+
+    def test_cache_hits(self):
+        S = rvpy.Gamma(2, 3) + rvpy.Gamma(1, 3)
+        self.assertIs(rvpy.Gamma(2, 3) + rvpy.Gamma(1, 3), S)
+        self.assertEqual(rvpy.cache_info(), rvpy.distribution.CacheInfo(1, 1, 4, 1))
+
+        # Operand types are part of the key
+        self.assertEqual(repr(rvpy.Normal(0, 1) / 2), repr(rvpy.Normal(0, 1) / 2))
+        self.assertEqual((rvpy.Normal(0, 1) + 1).mu, 1)
+        self.assertIsInstance((rvpy.Normal(0, 1) + 1.).mu, float)
+
+    def test_cache_eviction(self):
+        X = rvpy.LogNormal(0, 1)
+        first = X * X
+        for c in range(2, 6):
+            X * c
+        self.assertEqual(rvpy.cache_info().currsize, 4)
+        self.assertIsNot(X * X, first)
+
+        rvpy.set_cache(0)
+        self.assertIsNone(rvpy.cache_info())
+
+    def test_cache_unhashable_and_errors(self):
+        X = rvpy.Normal(np.arange(3.), 1.)
+        self.assertIs(X + 1, X + 1)
+        with self.assertRaises(ValueError): rvpy.Gamma(1, 2) + rvpy.Gamma(1, 3)
+        self.assertEqual(rvpy.cache_info().currsize, 1)
+
+    def test_cache_array_operands(self):
+        E = rvpy.Empirical(np.arange(10.**6))
+        self.assertIs(E + 1, E + 1)
+        # Keyed by a small digest, computed once per object
+        key = distribution._typed(E)
+        self.assertIs(distribution._typed(E), key)
+        self.assertLess(len(repr(key)), 200)
+        self.assertIs(rvpy.Empirical(np.arange(10.)) * 2, rvpy.Empirical(np.arange(10.)) * 2)
+        self.assertIsNot(rvpy.Empirical(np.arange(10.)) * 2, rvpy.Empirical(np.arange(1., 11.)) * 2)
+
+    def test_cache_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        rvpy.set_cache(64)
+        add = lambda i: rvpy.Poisson(i % 8 + 1) + rvpy.Poisson(1)
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(add, range(400)))
+        self.assertEqual([r.mu for r in results], [i % 8 + 2 for i in range(400)])
+        info = rvpy.cache_info()
+        self.assertEqual(info.hits + info.misses, 400)
+        self.assertEqual(info.currsize, 8)
+
+class TabulatedTests(unittest.TestCase):
+    def setUp(self):
+        rvpy.set_tabulated(True)
+
+    def tearDown(self):
+        rvpy.set_tabulated(False)
+
+    def test_alias_samplers_match_distribution(self):
+        for X in (rvpy.Binomial(30, 0.3), rvpy.Poisson(4),
+                  rvpy.NegativeBinomial(3, 0.4), rvpy.Geometric(0.2),
+                  rvpy.Hypergeometric(50, 20, 10)):
+            s = X.sample(100000, rng=1)
+            self.assertEqual(s.dtype.kind, 'i')
+            lo, hi = int(X.quantile(1e-6)), int(X.isf(1e-6))
+            observed = np.bincount(s - lo, minlength=hi - lo + 1)[:hi - lo + 1]
+            expected = X.pmf(np.arange(lo, hi + 1))
+            keep = expected > 1e-4
+            observed, expected = observed[keep], expected[keep]
+            expected = expected * observed.sum() / expected.sum()
+            self.assertGreater(stats.chisquare(observed, expected).pvalue, 1e-4, X)
+
+    def test_alias_table_cached(self):
+        X = rvpy.Poisson(4)
+        X.sample(10)
+        table = distribution._cache_of(X)['_alias', 1e-12, 1e-10]
+        X.sample(10)
+        self.assertIs(distribution._cache_of(X)['_alias', 1e-12, 1e-10], table)
+        np.testing.assert_array_equal(X.sample(1000, rng=3), rvpy.Poisson(4).sample(1000, rng=3))
+
+        # Truncation at the configured tail mass
+        rvpy.set_tabulated(True, tail=0.01)
+        self.assertLessEqual(X.sample(10000, rng=0).max(), int(X.isf(0.01)))
+
+    def test_alias_skips_batches(self):
+        X = rvpy.Poisson(np.array([1, 10]))
+        self.assertEqual(X.sample(5, rng=0).shape, (5, 2))
+        self.assertNotIn('_alias', str(list(distribution._cache_of(X))))
+
+    def test_inverse_table_u_error(self):
+        u = np.random.default_rng(0).random(100000)
+        for X in (rvpy.Beta(2., 5.), rvpy.Beta(0.5, 0.5), rvpy.T(3), rvpy.F(5, 7)):
+            self.assertLessEqual(np.abs(X.cdf(X.quantile(u)) - u).max(), 1e-10, X)
+            # Tails beyond the table use the exact quantile
+            self.assertEqual(X.quantile(1e-14), X._evaluate('ppf', 1e-14))
+
+        rvpy.set_tabulated(True, u_error=1e-6)
+        X = rvpy.T(5)
+        self.assertLessEqual(np.abs(X.cdf(X.quantile(u)) - u).max(), 1e-6)
+        self.assertIn(('_inverse', 1e-12, 1e-6), distribution._cache_of(X))
+
+    def test_inverse_table_hard_cases(self):
+        # Poles of the density (beta < 1) and heavy tails, where the cdf
+        # saturates at 1 and x is too coarse to resolve u near the top
+        u = np.concatenate([np.random.default_rng(0).random(20000), [1e-13, 1 - 1e-13]])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for X in (rvpy.Beta(2., 0.3), rvpy.Beta(50., 0.2), rvpy.F(1, 1)):
+                err = np.abs(X.cdf(X.quantile(u)) - u)
+                rvpy.set_tabulated(False)
+                exact = np.abs(X.cdf(X.quantile(u)) - u)
+                rvpy.set_tabulated(True)
+                # Within u_error where x resolves u, and otherwise within
+                # u_error of the exact quantile
+                resolved = exact <= 1e-14
+                self.assertGreater(resolved.mean(), 0.5, X)
+                self.assertLessEqual(err[resolved].max(), 1e-10, X)
+                self.assertLessEqual(np.max(err - exact), 1e-10, X)
+                self.assertEqual(X.quantile(1.), X._evaluate('ppf', 1.))
+                self.assertEqual(X.sample(1000, rng=0).shape, (1000,))
+            self.assertEqual(rvpy.F(1, 1).quantile(1.), np.inf)
+
+    def test_inverse_samplers_match_distribution(self):
+        for X in (rvpy.Beta(2., 5.), rvpy.T(3), rvpy.F(5, 7)):
+            s = X.sample(50000, rng=2)
+            self.assertGreater(stats.kstest(s, X.cdf).pvalue, 1e-4, X)
+
+    def test_inverse_skips_closed_forms(self):
+        X = rvpy.Gumbel(0., 1.)
+        X.sample(10)
+        X.quantile(0.5)
+        self.assertEqual(list(distribution._cache_of(X)), [])
+
+class SupportTableTests(unittest.TestCase):
+    def setUp(self):
+        rvpy.set_support_tables(True)
+
+    def tearDown(self):
+        rvpy.set_support_tables(False)
+
+    def test_support_tables_match_scipy(self):
+        q = np.linspace(0, 1, 501)
+        for X in (rvpy.Binomial(1000, 0.3), rvpy.Bernoulli(0.3), rvpy.Binomial(50, 0.999),
+                  rvpy.Hypergeometric(500, 200, 100), rvpy.Hypergeometric(50, 40, 30)):
+            lo, hi = X._support()
+            x = np.arange(lo - 2, hi + 3)
+            np.testing.assert_allclose(X.pmf(x), X.sp.pmf(x), rtol=1e-10, atol=1e-15)
+            np.testing.assert_allclose(X.cdf(x), X.sp.cdf(x), rtol=1e-10, atol=1e-15)
+            np.testing.assert_array_equal(X.quantile(q), X.sp.ppf(q))
+            self.assertAlmostEqual(X.prob_interval(lo, hi - 1), X.sp.cdf(hi - 1) - X.sp.cdf(lo))
+            self.assertIsNotNone(distribution._cache_of(X)['_support'])
+
+    def test_support_table_off_support(self):
+        X = rvpy.Binomial(10, 0.4)
+        self.assertEqual(X.pmf(2.5), 0)
+        self.assertAlmostEqual(X.cdf(2.5), X.sp.cdf(2))
+        self.assertTrue(np.isnan(X.pmf(np.nan)))
+        self.assertTrue(np.isnan(X.quantile(1.5)))
+        self.assertEqual(X.quantile(0), -1)
+
+    def test_support_table_quantile_steps(self):
+        X = rvpy.Binomial(100, 0.5)
+        # Far below the old absolute tolerance of 1e-12
+        q = np.array([1e-300, 1e-25, 1e-20, 1e-13])
+        np.testing.assert_array_equal(X.quantile(q), X.sp.ppf(q))
+        # At and just above the steps the cdf resolves
+        k = np.arange(0, 75, 5)
+        cdf = X.cdf(k)
+        np.testing.assert_array_equal(X.quantile(cdf), k)
+        np.testing.assert_array_equal(X.quantile(cdf * (1 + 1e-9)), k + 1)
+
+    def test_support_table_large_n(self):
+        X = rvpy.Binomial(10**7, 0.3)
+        k = np.arange(2995000, 3005000, 7)
+        np.testing.assert_allclose(X.pmf(k), X.sp.pmf(k), rtol=1e-9)
+        np.testing.assert_allclose(X.cdf(k), X.sp.cdf(k), atol=1e-12)
+        self.assertGreaterEqual(rvpy.table_info().nbytes, 16 * (10**7 + 1))
+
+    def test_support_table_limits(self):
+        rvpy.set_support_tables(True, max_size=100)
+        X = rvpy.Binomial(1000, 0.3)
+        self.assertAlmostEqual(X.pmf(300), X.sp.pmf(300))
+        self.assertIsNone(distribution._cache_of(X)['_support'])
+        # Batches are not tabulated
+        Y = rvpy.Binomial(np.array([10, 20]), 0.3)
+        self.assertEqual(Y.pmf(3).shape, (2,))
+        self.assertNotIn('_support', distribution._cache_of(Y))
+
+class BinProbabilityTests(unittest.TestCase):
+    def test_bins_match_prob_interval(self):
+        X = rvpy.Gamma(2., 1.5)
+        edges = np.linspace(0, 5, 11)
+        np.testing.assert_allclose(X.bin_probabilities(edges),
+                                   [X.prob_interval(a, b) for a, b in zip(edges[:-1], edges[1:])])
+
+        # No mean to split at
+        X = rvpy.Cauchy(0., 1.)
+        np.testing.assert_allclose(X.bin_probabilities(edges), np.diff(X.cdf(edges)))
+
+    def test_upper_tail_bins(self):
+        # cdf(b) - cdf(a) cancels to 0 here, but the sf path does not
+        X = rvpy.Normal(0., 1.)
+        p = X.bin_probabilities(np.array([-10., 0., 9., 10.]))
+        self.assertGreater(p[-1], 0)
+        self.assertAlmostEqual(p[-1] / (X.sp.sf(9) - X.sp.sf(10)), 1, places=10)
+        self.assertAlmostEqual(p[0], 0.5)
+
+    def test_discrete_bins_match_histogram(self):
+        for X in (rvpy.Binomial(20, 0.3), rvpy.Poisson(4)):
+            edges = np.array([0, 2, 2.5, 3, 6, 10])
+            s = X.sample(10000, rng=0)
+            counts = np.histogram(s, edges)[0]
+            expected = [np.sum(X.pmf(np.arange(20))[(np.arange(20) >= a) & (np.arange(20) < b)])
+                        for a, b in zip(edges[:-1], edges[1:])]
+            expected[-1] += X.pmf(10)
+            p = X.bin_probabilities(edges)
+            np.testing.assert_allclose(p, expected, atol=1e-12)
+            # No integer in [2.5, 3)
+            self.assertEqual(counts[2], 0)
+            self.assertEqual(p[2], 0)
+
+    def test_batch_bins(self):
+        X = rvpy.Poisson(np.array([3, 10, 50]))
+        edges = np.arange(0, 120, 5)
+        p = X.bin_probabilities(edges)
+        self.assertEqual(p.shape, (edges.size - 1, 3))
+        for i in range(3):
+            np.testing.assert_allclose(p[:, i], X[i].bin_probabilities(edges), atol=1e-15)
@@ -2,6 +2,8 @@ import unittest
 import sys
 import random 
 
+import numpy as np
+
 import rvpy
 
 sys.path.append('..')
@@ -45,6 +47,27 @@ class DUniformTests(unittest.TestCase):
         self.assertEqual(self.Y.cdf(self.a - 1), 0)
         self.assertEqual(self.Y.cdf(self.b + 1), 1)
 
+    def test_dunif_native_matches_scipy(self):
+        for X in (self.X, self.Y, rvpy.DUniform(-3, 7), rvpy.DUniform(np.array([0, 2]), 9)):
+            x = np.arange(-5, 12, 0.5)[:, None] if X.shape else np.arange(-5, 12, 0.5)
+            q = np.linspace(0, 1, 97)[:, None] if X.shape else np.linspace(0, 1, 97)
+            np.testing.assert_allclose(X.pmf(x), X.sp.pmf(x))
+            np.testing.assert_allclose(X.logpmf(x), X.sp.logpmf(x))
+            np.testing.assert_allclose(X.cdf(x), X.sp.cdf(x))
+            np.testing.assert_allclose(X.sf(x), X.sp.sf(x))
+            np.testing.assert_array_equal(X.quantile(q), X.sp.ppf(q))
+            np.testing.assert_array_equal(X.quantile(X.cdf(x)), X.sp.ppf(X.sp.cdf(x)))
+            np.testing.assert_array_equal(X.isf(q), X.sp.isf(q))
+        self.assertTrue(np.isnan(self.Y.pmf(np.nan)))
+        self.assertTrue(np.isnan(self.Y.quantile(1.5)))
+
+    def test_dunif_quantile_steps(self):
+        # Just above a step is the next point; rounding in q * n is not
+        X = rvpy.DUniform(1, 10)
+        self.assertEqual(X.quantile(0.3 + 1e-13), 4)
+        self.assertEqual(X.quantile(0.1 * 3), 3)
+        self.assertEqual(X.quantile(0.3), 3)
+
     def test_dunif_add_sub(self):
         c = random.randint(1, 11)
         Yplus = self.Y + c
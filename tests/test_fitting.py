@@ -0,0 +1,227 @@
+import unittest
+import os
+import pickle
+import sys
+import tempfile
+
+import numpy as np
+from scipy import stats
+
+sys.path.append('..')
+
+import rvpy
+
+class FitTests(unittest.TestCase):
+    def assertFit(self, fitted, expected, rtol=1e-6):
+        self.assertIsInstance(fitted, type(expected))
+        for p in expected._params:
+            self.assertAlmostEqual(getattr(fitted, p) / getattr(expected, p), 1,
+                                   delta=rtol, msg=f"{fitted} != {expected}")
+
+    def test_mle_matches_scipy(self):
+        x = rvpy.Gamma(2.5, 1.5).sample(20000, rng=0)
+        a, _, scale = stats.gamma.fit(x, floc=0)
+        self.assertFit(rvpy.Gamma.fit(x), rvpy.Gamma(a, scale))
+
+        x = rvpy.Beta(2., 5.).sample(20000, rng=0)
+        a, b, _, _ = stats.beta.fit(x, floc=0, fscale=1)
+        self.assertFit(rvpy.Beta.fit(x), rvpy.Beta(a, b))
+
+        x = rvpy.Weibull(1.7, 3.).sample(20000, rng=0)
+        c, _, scale = stats.weibull_min.fit(x, floc=0)
+        self.assertFit(rvpy.Weibull.fit(x), rvpy.Weibull(c, scale), rtol=1e-4)
+
+        x = rvpy.Gumbel(2., 1.5).sample(20000, rng=0)
+        loc, scale = stats.gumbel_r.fit(x)
+        self.assertFit(rvpy.Gumbel.fit(x), rvpy.Gumbel(loc, scale), rtol=1e-4)
+
+        x = rvpy.Pareto(2., 3.5).sample(20000, rng=0)
+        b, _, scale = stats.pareto.fit(x, floc=0)
+        self.assertFit(rvpy.Pareto.fit(x), rvpy.Pareto(scale, b))
+
+        x = rvpy.LogNormal(0.5, 0.3).sample(20000, rng=0)
+        self.assertFit(rvpy.LogNormal.fit(x), rvpy.LogNormal(np.log(x).mean(), np.log(x).std()))
+
+        x = rvpy.Logistic(2., 1.5).sample(20000, rng=0)
+        loc, scale = stats.logistic.fit(x)
+        self.assertFit(rvpy.Logistic.fit(x), rvpy.Logistic(loc, scale))
+
+        x = rvpy.Laplace(2., 1.5).sample(20001, rng=0)
+        self.assertFit(rvpy.Laplace.fit(x), rvpy.Laplace(np.median(x), np.abs(x - np.median(x)).mean()))
+
+    def test_closed_forms(self):
+        x = rvpy.Normal(1., 2.).sample(20000, rng=1)
+        for method in ('mle', 'mom'):
+            self.assertFit(rvpy.Normal.fit(x, method), rvpy.Normal(x.mean(), x.std()))
+        x = rvpy.Exponential(2.).sample(20000, rng=1)
+        self.assertFit(rvpy.Exponential.fit(x), rvpy.Exponential(x.mean()))
+        x = rvpy.Bernoulli(0.3).sample(20000, rng=1)
+        self.assertFit(rvpy.Bernoulli.fit(x), rvpy.Bernoulli(x.mean()))
+
+    def test_discrete_fits(self):
+        x = rvpy.Poisson(7).sample(20000, rng=2)
+        self.assertEqual(rvpy.Poisson.fit(x), rvpy.Poisson(7))
+        self.assertEqual(rvpy.Poisson.fit(x, 'mom'), rvpy.Poisson(7))
+
+        x = rvpy.Binomial(30, 0.2).sample(20000, rng=2)
+        self.assertFit(rvpy.Binomial.fit(x, n=30), rvpy.Binomial(30, x.mean() / 30))
+        self.assertEqual(rvpy.Binomial.fit(x, 'mom').n, 30)
+
+    def test_moment_fits(self):
+        # Moment estimates reproduce the sample mean and variance
+        for cls, X in ((rvpy.Gamma, rvpy.Gamma(2.5, 1.5)), (rvpy.Beta, rvpy.Beta(2., 5.)),
+                       (rvpy.LogNormal, rvpy.LogNormal(0.5, 0.3)), (rvpy.Weibull, rvpy.Weibull(1.7, 3.)),
+                       (rvpy.Gumbel, rvpy.Gumbel(2., 1.5)), (rvpy.Pareto, rvpy.Pareto(2., 4.5))):
+            x = X.sample(20000, rng=3)
+            fitted = cls.fit(x, 'mom')
+            self.assertAlmostEqual(fitted.mean / x.mean(), 1, places=8, msg=cls)
+            self.assertAlmostEqual(fitted.var / x.var(), 1, places=8, msg=cls)
+
+    def test_fit_errors(self):
+        x = rvpy.Gamma(2., 1.).sample(100, rng=0)
+        with self.assertRaises(TypeError):
+            rvpy.ChiSq.fit(x)
+        with self.assertRaises(TypeError):
+            rvpy.Weibull.fit(iter([x]))
+        with self.assertRaises(AssertionError):
+            rvpy.Gamma.fit(x, method='bayes')
+
+class StreamingFitTests(unittest.TestCase):
+    def setUp(self):
+        self.chunks = [rvpy.Gamma(2.5, 1.5).sample(1000 + 17*i, rng=i) for i in range(20)]
+        self.x = np.concatenate(self.chunks)
+
+    def test_chunks_match_array(self):
+        whole = rvpy.Gamma.fit(self.x)
+        streamed = rvpy.Gamma.fit(iter(self.chunks))
+        self.assertAlmostEqual(streamed.alpha, whole.alpha, places=10)
+        self.assertAlmostEqual(streamed.beta, whole.beta, places=10)
+        small = rvpy.Gamma.fit(self.x, chunk_size=333)
+        self.assertAlmostEqual(small.alpha, whole.alpha, places=10)
+
+    def test_list_of_chunks(self):
+        whole = rvpy.Gamma.fit(self.x)
+        for chunks in (self.chunks, tuple(self.chunks), [self.x[:7000], self.x[7000:]]):
+            fitted = rvpy.Gamma.fit(chunks)
+            self.assertAlmostEqual(fitted.alpha, whole.alpha, places=10)
+            self.assertAlmostEqual(fitted.beta, whole.beta, places=10)
+        # Several passes, over the same list
+        whole = rvpy.Weibull.fit(self.x)
+        self.assertAlmostEqual(rvpy.Weibull.fit(self.chunks).gamma, whole.gamma, places=8)
+        self.assertAlmostEqual(rvpy.Gamma.fit(list(self.x[:100])).alpha,
+                               rvpy.Gamma.fit(self.x[:100]).alpha)
+
+    def test_merged_statistics(self):
+        parts = [pickle.loads(pickle.dumps(rvpy.Gamma.statistics(c))) for c in self.chunks]
+        merged = sum(parts)
+        self.assertEqual(merged.n, self.x.size)
+        self.assertEqual(merged.min, self.x.min())
+        self.assertAlmostEqual(merged.mean_of('log'), np.log(self.x).mean())
+        self.assertAlmostEqual(merged.var_of('x'), self.x.var())
+        self.assertAlmostEqual(rvpy.Gamma.fit(merged).alpha, rvpy.Gamma.fit(self.x).alpha)
+        with self.assertRaises(ValueError):
+            rvpy.Beta.fit(merged)
+
+    def test_memmap(self):
+        path = os.path.join(tempfile.mkdtemp(), 'data.npy')
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=float, shape=(200, 50))
+        rvpy.Weibull(1.3, 2.).sample_into(out, rng=0)
+        out.flush()
+        data = np.load(path, mmap_mode='r')
+        fitted = rvpy.Weibull.fit(data, chunk_size=1000)
+        expected = rvpy.Weibull.fit(np.asarray(data).ravel())
+        self.assertAlmostEqual(fitted.gamma, expected.gamma, places=8)
+        self.assertAlmostEqual(fitted.beta, expected.beta, places=8)
+        del data, out
+
+class GroupedFitTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.ids = rng.permutation(np.repeat(np.arange(50), 200))
+
+    def assertMatchesSingleFits(self, cls, x, method='mle'):
+        labels, fitted = cls.fit_groups(x, self.ids, method)
+        np.testing.assert_array_equal(labels, np.arange(50))
+        self.assertEqual(fitted.shape, (50,))
+        for g in (0, 13, 49):
+            single = cls.fit(x[self.ids == g], method)
+            for p in cls._params:
+                self.assertAlmostEqual(getattr(fitted, p)[g] / getattr(single, p), 1,
+                                       places=8, msg=f"{cls.__name__} {method} {p}")
+
+    def test_matches_single_fits(self):
+        size = self.ids.size
+        for X in (rvpy.Gamma(2.5, 1.5), rvpy.Weibull(1.7, 3.), rvpy.Beta(2., 5.),
+                  rvpy.NegativeBinomial(3, 0.3), rvpy.Gumbel(2., 1.5), rvpy.Normal(1., 2.),
+                  rvpy.LogNormal(0.5, 0.3), rvpy.Poisson(7), rvpy.Pareto(2., 3.5)):
+            x = X.sample(size, rng=1)
+            for method in ('mle', 'mom'):
+                self.assertMatchesSingleFits(type(X), x, method)
+
+    def test_negative_binomial(self):
+        x = rvpy.NegativeBinomial(4, 0.2).sample(20000, rng=0)
+        fitted = rvpy.NegativeBinomial.fit(x)
+        loglik = lambda r: stats.nbinom.logpmf(x, r, r / (r + x.mean())).sum()
+        self.assertEqual(fitted.r, max(range(1, 20), key=loglik))
+        # Data that are not overdispersed have r at the bound
+        x = rvpy.Poisson(4).sample(2000, rng=0)
+        self.assertEqual(rvpy.NegativeBinomial.fit(x).r, 10**6)
+
+    def test_labels_and_missing_estimates(self):
+        x = np.array([1., 2., 3., 5., 5., 4.])
+        ids = np.array(['b', 'a', 'a', 'c', 'c', 'b'])
+        with self.assertRaises(ValueError):
+            rvpy.Gamma.fit_groups(x, ids)
+        labels, params = rvpy.Gamma.fit_groups(x, ids, arrays=True)
+        self.assertEqual(list(labels), ['a', 'b', 'c'])
+        self.assertTrue(np.isnan(params['alpha'][2]))
+        self.assertAlmostEqual(params['alpha'][0], rvpy.Gamma.fit(x[1:3]).alpha)
+
+        labels, fitted = rvpy.Poisson.fit_groups([1, 2, 9, 8], [10, 10, 3, 3])
+        np.testing.assert_array_equal(labels, [3, 10])
+        np.testing.assert_array_equal(fitted.mu, [9, 2])
+        _, fitted = rvpy.Binomial.fit_groups([3, 4, 5, 6], [0, 0, 1, 1], n=10)
+        np.testing.assert_allclose(fitted.p, [0.35, 0.55])
+
+        # Sparse integer ids are labels, not indices
+        labels, fitted = rvpy.Poisson.fit_groups([1, 2, 9, 8], [0, 10**12, 0, 10**12])
+        np.testing.assert_array_equal(labels, [0, 10**12])
+        np.testing.assert_array_equal(fitted.mu, [5, 5])
+
+    def test_trigamma(self):
+        from scipy import special
+        x = np.geomspace(1e-4, 1e8, 1000)
+        np.testing.assert_allclose(rvpy.fitting.trigamma(x), special.polygamma(1, x), rtol=1e-11)
+
+class SelectFamilyTests(unittest.TestCase):
+    def test_ranking(self):
+        x = rvpy.Gamma(2.5, 1.5).sample(5000, rng=0)
+        ranking = rvpy.select_family(x, workers=1)
+        self.assertEqual(ranking[0].family, 'Gamma')
+        self.assertAlmostEqual(ranking.best.alpha, rvpy.Gamma.fit(x).alpha)
+        self.assertAlmostEqual(ranking[0].loglik, rvpy.Gamma.fit(x).logpdf(x).sum())
+        aic = [row.aic for row in ranking if row.fitted is not None]
+        self.assertEqual(aic, sorted(aic))
+        # Beta cannot be fitted to data outside (0, 1)
+        self.assertEqual(ranking[-1].family, 'Beta')
+        self.assertIsNone(ranking[-1].fitted)
+        self.assertIn('Gamma', str(ranking))
+
+    def test_ks_and_workers(self):
+        x = rvpy.Logistic(1., 2.).sample(5000, rng=0)
+        candidates = ['Normal', rvpy.Logistic, 'Laplace']
+        ranking = rvpy.select_family(x, candidates, criterion='ks', workers=2)
+        self.assertEqual([row.family for row in ranking][0], 'Logistic')
+        ks = stats.kstest(x, stats.logistic(ranking.best.loc, ranking.best.scale).cdf).statistic
+        self.assertAlmostEqual(ranking[0].ks, ks)
+        threaded = rvpy.select_family(x, candidates, criterion='ks', workers=2, threads=True)
+        self.assertEqual([row.ks for row in threaded], [row.ks for row in ranking])
+
+    def test_discrete_data(self):
+        x = rvpy.NegativeBinomial(3, 0.3).sample(5000, rng=0)
+        ranking = rvpy.select_family(x, criterion='bic', workers=1)
+        self.assertEqual({row.family for row in ranking},
+                         {'Poisson', 'NegativeBinomial', 'Binomial'})
+        self.assertEqual(ranking[0].family, 'NegativeBinomial')
+        with self.assertRaises(TypeError):
+            rvpy.select_family(x, [rvpy.ChiSq])
@@ -2,6 +2,9 @@ import unittest
 import sys
 import random
 
+import numpy as np
+from scipy import special
+
 sys.path.append('..')
 
 import rvpy
@@ -21,6 +24,20 @@ class GammaTests(unittest.TestCase):
         self.assertAlmostEqual(self.X.skew, 2/self.alpha1**0.5)
         self.assertAlmostEqual(self.X.kurtosis, 6/self.alpha1)
 
+    def test_gamma_log_tails(self):
+        X = rvpy.Gamma(2, 1)
+        self.assertEqual(X.pdf(1000), 0)
+        self.assertAlmostEqual(X.logpdf(1000), np.log(1000) - 1000)
+        self.assertAlmostEqual(X.logsf(3), np.log(4) - 3)
+        # Far tails where cdf and sf underflow
+        self.assertAlmostEqual(X.logsf(800), np.log1p(800) - 800)
+        self.assertAlmostEqual(X.logcdf(1e-200), 2*np.log(1e-200) - np.log(2), places=9)
+        np.testing.assert_allclose(rvpy.Gamma(1e6, 2.).logcdf(2e-300),
+                                   1e6*np.log(1e-300) - special.gammaln(1e6 + 1), rtol=1e-12)
+        Y = rvpy.Gamma(np.array([1., 2.]), 1.)
+        np.testing.assert_allclose(Y.logsf(800), [-800, np.log1p(800) - 800])
+        np.testing.assert_allclose(Y.logsf(2), np.log(special.gammaincc([1., 2.], 2)))
+
     def test_gamma_conversion(self):
         lambd = random.expovariate(1/5)
         U = rvpy.Gamma(1, lambd)
@@ -38,6 +55,19 @@ class GammaTests(unittest.TestCase):
         self.assertEqual(Z.alpha, self.alpha1 + self.alpha2)
         self.assertEqual(Z.beta, self.beta)
 
+    def test_gamma_sum_iid(self):
+        n = random.randint(2, 10**9)
+        Z = self.X.sum_iid(n)
+        self.assertIsInstance(Z, rvpy.Gamma)
+        self.assertAlmostEqual(Z.alpha, n*self.alpha1)
+        self.assertAlmostEqual(self.X.mean_iid(n).mean, self.X.mean)
+        self.assertAlmostEqual(self.X.mean_iid(n).var, self.X.var / n)
+
+        self.assertEqual(rvpy.Exponential(2).sum_iid(5), rvpy.Gamma(5, 2))
+        self.assertEqual(rvpy.ChiSq(3).sum_iid(4), rvpy.ChiSq(12))
+        with self.assertRaises(AssertionError): self.X.sum_iid(0)
+        with self.assertRaises(AssertionError): self.X.sum_iid(2.5)
+
     def test_gamma_mul_div(self):
         c = random.expovariate(1/10)
 
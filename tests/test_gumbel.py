@@ -28,6 +28,12 @@ class GumbelTests(unittest.TestCase):
             1/self.beta * np.exp(-(z + np.exp(-z)))
         )
 
+    def test_gumbel_log_tails(self):
+        X = rvpy.Gumbel(0, 1)
+        self.assertAlmostEqual(X.logsf(750), -750)
+        self.assertAlmostEqual(X.logsf(1), np.log(X.sf(1)))
+        self.assertAlmostEqual(X.logcdf(-5), -np.exp(5))
+
     def test_gumbel_add_sub(self):
         m1 = random.random()
         b = random.random()
@@ -0,0 +1,31 @@
+import unittest
+import sys
+import subprocess
+
+sys.path.append('..')
+
+def loaded_after(code):
+    # Run in a fresh interpreter so modules imported by other tests don't leak in
+    check = code + "; import sys; print(' '.join(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, '-c', check], check=True,
+            stdout=subprocess.PIPE, universal_newlines=True)
+    return set(out.stdout.split())
+
+class ImportTests(unittest.TestCase):
+    def test_import_is_lazy(self):
+        modules = loaded_after("import rvpy")
+        self.assertNotIn('scipy', modules)
+        self.assertNotIn('rvpy.normal', modules)
+
+    def test_family_access_is_lazy(self):
+        modules = loaded_after("import rvpy; rvpy.Normal; rvpy.Binomial")
+        self.assertIn('rvpy.normal', modules)
+        self.assertNotIn('rvpy.hypergeom', modules)
+        self.assertNotIn('scipy.stats', modules)
+
+    def test_public_names(self):
+        import rvpy
+        for name in rvpy.__all__:
+            self.assertTrue(hasattr(rvpy, name), name)
+        self.assertIn('Normal', dir(rvpy))
+        with self.assertRaises(AttributeError): rvpy.NotADistribution
@@ -0,0 +1,105 @@
+import unittest
+import sys
+
+import numpy as np
+
+sys.path.append('..')
+
+import rvpy
+
+class LatticeTests(unittest.TestCase):
+    def setUp(self):
+        self.D = rvpy.Lattice(1, 1, np.ones(6) / 6, discrete=True)
+        self.C = rvpy.Lattice(0.5, 1, [1, 2, 1])
+
+    def test_lattice_moments(self):
+        self.assertAlmostEqual(self.D.mean, 3.5)
+        self.assertAlmostEqual(self.D.var, 35/12)
+        self.assertAlmostEqual(self.C.mean, 1.5)
+        self.assertAlmostEqual(self.C.var, 0.5 + 1/12)
+        self.assertAlmostEqual(self.D.var, self.D.sp.var())
+
+    def test_lattice_pmf_cdf(self):
+        self.assertAlmostEqual(self.D.pmf(3), 1/6)
+        self.assertEqual(self.D.pmf(3.5), 0)
+        self.assertAlmostEqual(self.D.cdf(3), 0.5)
+        self.assertAlmostEqual(self.D.cdf(3.5), 0.5)
+        self.assertEqual(self.D.quantile(0.5), 3)
+        self.assertEqual(self.D.quantile(1), 6)
+        # Tolerance for rounding in the cumsum is relative, so small q just
+        # above a step still move to the next point
+        L = rvpy.Lattice(0, 1, [1e-13, 1 - 1e-13], discrete=True)
+        np.testing.assert_array_equal(L.quantile([1e-13, 2e-13]), [0, 1])
+        self.assertEqual(self.D.quantile(0.5 + 1e-9), 4)
+
+        self.assertAlmostEqual(self.C.pdf(1.5), 0.5)
+        self.assertAlmostEqual(self.C.cdf(1), 0.25)
+        self.assertAlmostEqual(self.C.quantile(0.5), 1.5)
+        self.assertEqual(self.C.pmf(1.5), 0)
+
+    def test_lattice_arithmetic(self):
+        Z = -2*self.D + 1
+        self.assertIsInstance(Z, rvpy.Lattice)
+        self.assertAlmostEqual(Z.mean, -6)
+        self.assertAlmostEqual(Z.pmf(-11), 1/6)
+        self.assertAlmostEqual((self.C / 2).var, self.C.var / 4)
+
+    def test_lattice_errors(self):
+        with self.assertRaises(AssertionError): rvpy.Lattice(0, 0, [1])
+        with self.assertRaises(AssertionError): rvpy.Lattice(0, 1, [-1, 2])
+        with self.assertRaises(TypeError): self.C + self.D
+
+    def test_lattice_sample(self):
+        for X in (self.D, self.C, rvpy.Lattice(0, 0.5, [1, 0, 3, 2])):
+            x = X.sample(10**5, rng=3)
+            self.assertAlmostEqual(x.mean(), X.mean, delta=0.02)
+            self.assertAlmostEqual(x.var(), X.var, delta=0.05)
+            # Chunked draws are the same variates
+            chunks = list(X.sample_iter(1001, chunk_size=300, rng=42))
+            np.testing.assert_array_equal(np.concatenate(chunks), X.sample(1001, rng=42))
+        self.assertTrue(np.all(np.isin(self.D.sample(1000), self.D.points)))
+
+class ConvolutionTests(unittest.TestCase):
+    def test_discrete_exact(self):
+        S = rvpy.DUniform(1, 6).sum_iid(2)
+        self.assertTrue(S.discrete)
+        np.testing.assert_allclose(S.pmf([2, 7, 12]), [1/36, 6/36, 1/36])
+
+        H = rvpy.Hypergeometric(20, 7, 12)
+        self.assertAlmostEqual(H.sum_iid(50).var, 50*H.var)
+        self.assertAlmostEqual(H.mean_iid(50).mean, H.mean)
+
+    def test_continuous(self):
+        S = rvpy.CUniform(0, 1).sum_iid(2)
+        np.testing.assert_allclose(S.cdf([0.5, 1, 1.5]), [0.125, 0.5, 0.875], atol=1e-6)
+
+        X = rvpy.Laplace(1, 2)
+        M = X.mean_iid(100)
+        self.assertAlmostEqual(M.mean, X.mean)
+        self.assertAlmostEqual(M.var, X.var / 100, places=4)
+
+    def test_large_n(self):
+        n = 10**9
+        X = rvpy.DUniform(1, 6)
+        S = X.sum_iid(n)
+        self.assertAlmostEqual(S.mean / (n*X.mean), 1)
+        self.assertAlmostEqual(S.var / (n*X.var), 1, places=3)
+
+        # Close to the normal limit
+        Z = (S - n*X.mean) / (n*X.var)**0.5
+        self.assertAlmostEqual(Z.cdf(1), rvpy.StandardNormal().cdf(1), places=3)
+
+    def test_heavy_tails(self):
+        # Pareto and LogNormal sums against known moments and Monte Carlo
+        for X, n in ((rvpy.Pareto(1, 3), 2), (rvpy.Pareto(1, 3), 50),
+                     (rvpy.LogNormal(0, 1.5), 10)):
+            S = X.sum_iid(n)
+            self.assertAlmostEqual(S.mean / (n*X.mean), 1, places=2)
+            self.assertAlmostEqual(X.mean_iid(n).mean / X.mean, 1, places=2)
+
+            x = X.sample(10**5 * n, rng=7).reshape(-1, n).sum(axis=1)
+            q = np.quantile(x, [0.1, 0.5, 0.9])
+            np.testing.assert_allclose(S.cdf(q), [0.1, 0.5, 0.9], atol=0.01)
+
+    def test_unresolvable(self):
+        with self.assertRaises(ValueError): rvpy.LogNormal(0, 4).sum_iid(2)
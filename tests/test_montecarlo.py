@@ -0,0 +1,103 @@
+import unittest
+import sys
+
+import numpy as np
+
+sys.path.append('..')
+
+import rvpy
+
+class MonteCarloTests(unittest.TestCase):
+    def setUp(self):
+        rvpy.set_rng(0)
+        rvpy.set_monte_carlo(samples=2**18, chunk_size=10**4)
+
+    def tearDown(self):
+        rvpy.set_monte_carlo(False)
+        rvpy.set_rng(None)
+
+    def test_disabled_raises(self):
+        rvpy.set_monte_carlo(False)
+        with self.assertRaises(TypeError):
+            rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)
+        with self.assertRaises(TypeError):
+            rvpy.Weibull(1.5, 1.) * rvpy.Beta(2., 3.)
+
+    def test_unsupported_sum(self):
+        Z = rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)
+        self.assertIsInstance(Z, rvpy.Empirical)
+        self.assertEqual(Z.values.size, 2**18)
+        self.assertTrue(np.all(np.diff(Z.values) >= 0))
+        self.assertAlmostEqual(Z.mean, 2., delta=0.02)
+        self.assertAlmostEqual(Z.var, 3., delta=0.05)
+
+    def test_ratio(self):
+        for X in (rvpy.Normal(0., 1.), rvpy.Gamma(2., 1.), rvpy.CUniform(0, 1)):
+            R = X / rvpy.Gamma(3., 1.)
+            self.assertIsInstance(R, rvpy.Empirical)
+            self.assertAlmostEqual(R.mean, X.mean / 2, delta=0.02)
+        # Dividing by a constant zero is still an error
+        with self.assertRaises(ZeroDivisionError):
+            rvpy.Normal(0., 1.) / 0
+
+    def test_closed_forms_unchanged(self):
+        self.assertEqual(rvpy.Normal(0., 1.) + rvpy.Normal(1., 1.), rvpy.Normal(1., 2**0.5))
+        self.assertEqual(rvpy.Gamma(2., 1.) + rvpy.Gamma(3., 1.), rvpy.Gamma(5., 1.))
+
+    def test_other_operations(self):
+        W = rvpy.Weibull(1.5, 1.) * rvpy.Beta(2., 3.)
+        self.assertAlmostEqual(W.mean, rvpy.Weibull(1.5, 1.).mean * 0.4, delta=0.01)
+        self.assertAlmostEqual((2 ** rvpy.CUniform(0, 1)).mean, 1 / np.log(2), delta=0.01)
+        self.assertAlmostEqual(rvpy.exp(rvpy.Beta(2., 3.)).mean,
+                               np.mean(np.exp(rvpy.Beta(2., 3.).sample(10**6))), delta=0.01)
+
+    def test_discrete(self):
+        X = rvpy.Binomial(5, 0.3) + rvpy.Poisson(3)
+        self.assertTrue(X._discrete)
+        self.assertAlmostEqual(X.mean, 4.5, delta=0.02)
+        self.assertAlmostEqual(X.pmf(0), 0.7**5 * np.exp(-3), delta=0.002)
+
+    def test_cdf_quantile(self):
+        Z = rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)
+        q = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+        x = Z.quantile(q)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        np.testing.assert_allclose(Z.cdf(x), q, atol=1 / Z.values.size)
+        self.assertEqual(Z.cdf(Z.values[0] - 1), 0)
+        self.assertEqual(Z.cdf(Z.values[-1]), 1)
+        self.assertTrue(np.isnan(Z.quantile(1.5)))
+        self.assertEqual(Z.median, Z.quantile(0.5))
+
+    def test_sample_bootstrap(self):
+        Z = rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)
+        draws = Z.sample(1000)
+        self.assertEqual(draws.shape, (1000,))
+        self.assertTrue(np.all(np.isin(draws, Z.values)))
+
+    def test_empirical_arithmetic(self):
+        Z = rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)
+        self.assertIsInstance(2*Z + 1, rvpy.Empirical)
+        self.assertAlmostEqual((2*Z + 1).mean, 2*Z.mean + 1)
+        self.assertAlmostEqual((-Z).mean, -Z.mean)
+        self.assertAlmostEqual((Z + Z).var, 2*Z.var, delta=0.1)
+
+    def test_undefined(self):
+        with self.assertRaises(ValueError):
+            rvpy.log(rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.))
+
+    def test_lazy(self):
+        rvpy.set_lazy(True)
+        try:
+            Z = rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)
+            self.assertIsInstance(Z, rvpy.expression.Expression)
+            self.assertIsInstance(Z.evaluate(), rvpy.Empirical)
+        finally:
+            rvpy.set_lazy(False)
+
+    def test_error(self):
+        rvpy.set_monte_carlo(error=0.01)
+        self.assertEqual(rvpy.distribution._mc_samples, 18445)
+        self.assertEqual((rvpy.Normal(0., 1.) + rvpy.Gamma(2., 1.)).values.size, 18445)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+import unittest
+import sys
+
+import numpy as np
+from scipy import stats
+
+sys.path.append('..')
+
+import rvpy
+
+class MultivariateNormalTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.d = 6
+        A = rng.standard_normal((self.d, self.d))
+        self.mu = rng.standard_normal(self.d)
+        self.cov = A @ A.T + self.d * np.eye(self.d)
+        self.X = rvpy.MultivariateNormal(self.mu, self.cov)
+        self.x = rng.standard_normal((3, 4, self.d))
+
+    def test_mvn_logpdf(self):
+        scipy_logpdf = stats.multivariate_normal(self.mu, self.cov).logpdf(self.x)
+        np.testing.assert_allclose(self.X.logpdf(self.x), scipy_logpdf, rtol=1e-12)
+        np.testing.assert_allclose(self.X.pdf(self.x), np.exp(scipy_logpdf), rtol=1e-12)
+        self.assertEqual(np.shape(self.X.logpdf(self.x[0, 0])), ())
+        self.assertAlmostEqual(self.X.entropy,
+                               stats.multivariate_normal(self.mu, self.cov).entropy())
+
+    def test_mvn_sample(self):
+        s = self.X.sample(200000, rng=1)
+        self.assertEqual(s.shape, (200000, self.d))
+        np.testing.assert_allclose(s.mean(axis=0), self.mu, atol=0.05)
+        np.testing.assert_allclose(np.cov(s.T), self.cov, atol=0.3)
+        self.assertEqual(self.X.sample(rng=0).shape, (self.d,))
+        np.testing.assert_array_equal(self.X.sample(5, rng=2), self.X.sample(5, rng=2))
+
+    def test_mvn_sample_scipy_backend(self):
+        rvpy.set_backend('scipy')
+        try:
+            self.assertEqual(self.X.sample(5, 2, rng=0).shape, (5, 2, self.d))
+            self.assertEqual(self.X.sample(rng=0).shape, (self.d,))
+        finally:
+            rvpy.set_backend('native')
+
+    def test_mvn_unsupported_moments(self):
+        np.testing.assert_array_equal(self.X.median, self.mu)
+        for X in (self.X, rvpy.Dirichlet([1., 2.]), rvpy.Multinomial(5, [0.5, 0.5])):
+            with self.assertRaises(TypeError):
+                X.skew
+            with self.assertRaises(TypeError):
+                X.kurtosis
+        with self.assertRaises(TypeError):
+            rvpy.Dirichlet([1., 2.]).median
+
+    def test_mvn_affine(self):
+        A = np.arange(3 * self.d, dtype=float).reshape(3, self.d) / 10
+        b = np.array([1., 2., 3.])
+        Y = A @ self.X + b
+        self.assertIsInstance(Y, rvpy.MultivariateNormal)
+        np.testing.assert_allclose(Y.mu, A @ self.mu + b)
+        np.testing.assert_allclose(Y.cov, A @ self.cov @ A.T)
+
+        a = np.ones(self.d)
+        Z = a @ self.X
+        self.assertIsInstance(Z, rvpy.Normal)
+        self.assertAlmostEqual(Z.mean, self.mu.sum())
+        self.assertAlmostEqual(Z.var, self.cov.sum())
+
+        W = -2 * self.X - 1
+        np.testing.assert_allclose(W.mu, -2 * self.mu - 1)
+        np.testing.assert_allclose(W.cov, 4 * self.cov)
+        with self.assertRaises(TypeError):
+            self.X * self.X
+
+    def test_mvn_cached_factor(self):
+        L = self.X.chol
+        self.assertIs(self.X.chol, L)
+        np.testing.assert_allclose(L @ L.T, self.cov)
+        self.assertAlmostEqual(self.X.logdet, np.linalg.slogdet(self.cov)[1])
+        # Shifts and scalings reuse the factor
+        Y = 3 * self.X + 1
+        np.testing.assert_allclose(Y.chol, np.linalg.cholesky(Y.cov))
+        self.assertAlmostEqual(Y.logdet, np.linalg.slogdet(Y.cov)[1])
+        np.testing.assert_allclose(Y.logpdf(self.x),
+                                   stats.multivariate_normal(Y.mu, Y.cov).logpdf(self.x))
+
+    def test_mvn_marginals(self):
+        X2 = self.X[2]
+        self.assertIsInstance(X2, rvpy.Normal)
+        self.assertAlmostEqual(X2.mean, self.mu[2])
+        self.assertAlmostEqual(X2.var, self.cov[2, 2])
+
+        self.X.chol
+        for idx in [slice(0, 3), [4, 1]]:
+            M = self.X.marginal(idx)
+            np.testing.assert_allclose(M.mu, self.mu[idx])
+            np.testing.assert_allclose(M.cov, self.cov[np.ix_(np.arange(self.d)[idx],
+                                                             np.arange(self.d)[idx])])
+            np.testing.assert_allclose(M.chol, np.linalg.cholesky(M.cov))
+
+    def test_mvn_sums(self):
+        Y = rvpy.MultivariateNormal(np.ones(self.d), np.eye(self.d))
+        S = self.X + Y
+        np.testing.assert_allclose(S.mu, self.mu + 1)
+        np.testing.assert_allclose(S.cov, self.cov + np.eye(self.d))
+        D = self.X - Y
+        np.testing.assert_allclose(D.mu, self.mu - 1)
+        np.testing.assert_allclose(D.cov, self.cov + np.eye(self.d))
+
+        T = self.X.sum_iid(4)
+        np.testing.assert_allclose(T.mu, 4 * self.mu)
+        np.testing.assert_allclose(T.cov, 4 * self.cov)
+        np.testing.assert_allclose(self.X.mean_iid(4).cov, self.cov / 4)
+
+        with self.assertRaises(AssertionError):
+            self.X + rvpy.MultivariateNormal(np.zeros(2), np.eye(2))
+        with self.assertRaises(TypeError):
+            self.X + rvpy.Normal(0, 1)
+
+    def test_mvn_invalid(self):
+        with self.assertRaises(AssertionError):
+            rvpy.MultivariateNormal(np.zeros(2), np.eye(3))
+        with self.assertRaises(AssertionError):
+            rvpy.MultivariateNormal(np.zeros(2), [[1, 0.5], [0, 1]])
+
+class DirichletTests(unittest.TestCase):
+    def setUp(self):
+        self.alpha = np.array([0.5, 1., 2., 3.])
+        self.X = rvpy.Dirichlet(self.alpha)
+
+    def test_dirichlet_logpdf(self):
+        x = np.random.default_rng(0).dirichlet(self.alpha, (3, 5))
+        scipy_logpdf = stats.dirichlet(self.alpha).logpdf(x.reshape(-1, 4).T).reshape(3, 5)
+        np.testing.assert_allclose(self.X.logpdf(x), scipy_logpdf, rtol=1e-12)
+        np.testing.assert_allclose(self.X.pdf(x), np.exp(scipy_logpdf), rtol=1e-12)
+        # Off the simplex
+        self.assertEqual(self.X.logpdf([0.2, 0.2, 0.2, 0.5]), -np.inf)
+        self.assertEqual(self.X.pdf([-0.1, 0.3, 0.3, 0.5]), 0)
+
+    def test_dirichlet_sample(self):
+        s = self.X.sample(10**6, rng=1)
+        self.assertEqual(s.shape, (10**6, 4))
+        np.testing.assert_allclose(s.sum(axis=1), 1)
+        np.testing.assert_allclose(s.mean(axis=0), self.X.mean, atol=1e-3)
+        np.testing.assert_allclose(np.cov(s.T), self.X.cov, atol=1e-3)
+        np.testing.assert_allclose(np.diag(self.X.cov), self.X.var)
+
+    def test_dirichlet_sample_scipy_backend(self):
+        rvpy.set_backend('scipy')
+        try:
+            self.assertEqual(self.X.sample(5, rng=0).shape, (5, 4))
+            self.assertEqual(self.X.sample(rng=0).shape, (4,))
+        finally:
+            rvpy.set_backend('native')
+
+    def test_dirichlet_marginal(self):
+        X0 = self.X[0]
+        self.assertIsInstance(X0, rvpy.Beta)
+        self.assertEqual((X0.alpha, X0.beta), (0.5, 6.))
+        self.assertAlmostEqual(X0.mean, self.X.mean[0])
+        self.assertAlmostEqual(X0.var, self.X.var[0])
+
+    def test_dirichlet_invalid(self):
+        with self.assertRaises(AssertionError):
+            rvpy.Dirichlet([1., 0.])
+        with self.assertRaises(AssertionError):
+            rvpy.Dirichlet([1.])
+
+class MultinomialTests(unittest.TestCase):
+    def setUp(self):
+        self.p = np.array([0.1, 0.2, 0.3, 0.4])
+        self.X = rvpy.Multinomial(20, self.p)
+
+    def tearDown(self):
+        rvpy.set_tabulated(False)
+
+    def test_multinomial_logpmf(self):
+        x = np.random.default_rng(0).multinomial(20, self.p, (3, 5))
+        scipy_logpmf = stats.multinomial(20, self.p).logpmf(x)
+        np.testing.assert_allclose(self.X.logpmf(x), scipy_logpmf, rtol=1e-12)
+        np.testing.assert_allclose(self.X.pmf(x), np.exp(scipy_logpmf), rtol=1e-12)
+        self.assertAlmostEqual(self.X.pmf([20, 0, 0, 0]), 0.1**20)
+        # Counts not summing to n, negative or fractional
+        self.assertEqual(self.X.logpmf([1, 2, 3, 4]), -np.inf)
+        self.assertEqual(self.X.pmf([-1, 2, 9, 10]), 0)
+        self.assertEqual(self.X.pmf([0.5, 1.5, 8, 10]), 0)
+
+    def test_multinomial_sample(self):
+        for tabulated in [False, True]:
+            rvpy.set_tabulated(tabulated)
+            s = self.X.sample(10**6, rng=2)
+            self.assertEqual(s.shape, (10**6, 4))
+            self.assertTrue(np.all(s.sum(axis=1) == 20))
+            np.testing.assert_allclose(s.mean(axis=0), self.X.mean, atol=0.01)
+            np.testing.assert_allclose(np.cov(s.T), self.X.cov, atol=0.02)
+            self.assertEqual(self.X.sample(rng=0).shape, (4,))
+            np.testing.assert_array_equal(self.X.sample(5, rng=3), self.X.sample(5, rng=3))
+
+    def test_multinomial_sample_iter(self):
+        for tabulated in [False, True]:
+            rvpy.set_tabulated(tabulated)
+            chunks = list(self.X.sample_iter(1001, chunk_size=300, rng=42))
+            np.testing.assert_array_equal(np.concatenate(chunks), self.X.sample(1001, rng=42))
+            out = np.empty((1001, 4), dtype=np.int64)
+            self.X.sample_into(out, chunk_size=77, rng=42)
+            np.testing.assert_array_equal(out, self.X.sample(1001, rng=42))
+
+    def test_multinomial_sample_scipy_backend(self):
+        rvpy.set_backend('scipy')
+        try:
+            self.assertEqual(self.X.sample(5, 3, rng=0).shape, (5, 3, 4))
+            self.assertEqual(self.X.sample(rng=0).shape, (4,))
+        finally:
+            rvpy.set_backend('native')
+
+    def test_multinomial_zero_probabilities(self):
+        X = rvpy.Multinomial(5, [0., 0.5, 0.5, 0.])
+        for tabulated in [False, True]:
+            rvpy.set_tabulated(tabulated)
+            s = X.sample(1000, rng=0)
+            self.assertTrue(np.all(s[:, [0, 3]] == 0))
+            self.assertTrue(np.all(s.sum(axis=1) == 5))
+        self.assertIsInstance(X[0], rvpy.Degenerate)
+        self.assertEqual(X[0].k, 0)
+
+    def test_multinomial_relationships(self):
+        X1 = self.X[1]
+        self.assertIsInstance(X1, rvpy.Binomial)
+        self.assertEqual((X1.n, X1.p), (20, 0.2))
+        np.testing.assert_allclose(np.diag(self.X.cov), self.X.var)
+
+        Y = self.X + rvpy.Multinomial(5, self.p)
+        self.assertEqual(Y, rvpy.Multinomial(25, self.p))
+        self.assertEqual(self.X.sum_iid(3), rvpy.Multinomial(60, self.p))
+        with self.assertRaises(TypeError):
+            self.X + rvpy.Multinomial(5, self.p[::-1])
+
+    def test_multinomial_invalid(self):
+        with self.assertRaises(AssertionError):
+            rvpy.Multinomial(10, [0.5, 0.6])
+        with self.assertRaises(AssertionError):
+            rvpy.Multinomial(10.5, [0.5, 0.5])
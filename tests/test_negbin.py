@@ -40,10 +40,22 @@ class NegativeBinomialTests(unittest.TestCase):
         self.assertEqual(Gconv.mean, self.G1.mean)
         self.assertEqual(Gconv.var, self.G1.var)
 
+    def test_negbin_sum_iid(self):
+        self.assertEqual(self.G1.sum_iid(5), rvpy.NegativeBinomial(5, self.p))
+        self.assertEqual(self.NB1.sum_iid(3), rvpy.NegativeBinomial(3*self.NB1.r, self.p))
+
     def test_negbin_pmf(self):
         self.assertEqual(self.NB1.pmf(-1), 0)
         self.assertEqual(self.G1.pmf(-1), 0)
 
+    def test_negbin_log_tails(self):
+        # Far tails where cdf and sf underflow, against sums of the pmf in mpmath
+        self.assertAlmostEqual(rvpy.NegativeBinomial(3, 0.5).logsf(2000),
+                               -1373.8616475460053, places=9)
+        self.assertAlmostEqual(rvpy.NegativeBinomial(2000, 0.1).logcdf(3),
+                               -4584.4721547861780, places=8)
+        self.assertAlmostEqual(self.NB1.logcdf(1), np.log(self.NB1.cdf(1)))
+
     def test_negbin_add_sub(self):
         NB12 = self.NB1 + self.NB2
         self.assertIsInstance(NB12, rvpy.NegativeBinomial)
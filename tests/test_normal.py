@@ -2,6 +2,8 @@ import unittest
 import sys
 import random
 
+import numpy as np
+
 sys.path.append('..')
 
 import rvpy
@@ -111,6 +113,15 @@ class NormalTests(unittest.TestCase):
         self.assertAlmostEqual(Z2.var, c**-2)
         self.assertAlmostEqual(Z2.std, c**-1)
 
+    def test_normal_log_tails(self):
+        # Log-space methods stay finite where pdf/cdf underflow to zero
+        self.assertEqual(self.Z.pdf(-40), 0)
+        self.assertAlmostEqual(self.Z.logpdf(-40), -800 - 0.5*np.log(2*np.pi))
+        self.assertTrue(np.isfinite(self.Z.logcdf(-40)))
+        self.assertAlmostEqual(self.Z.logsf(40), self.Z.logcdf(-40))
+        self.assertAlmostEqual(self.Z.sf(1), 1 - self.Z.cdf(1))
+        self.assertAlmostEqual(self.Z.isf(0.025), -self.Z.quantile(0.025))
+
     def test_normal_errors(self):
         # Broken conversion when not N(0, 1)
         with self.assertRaises(ValueError): self.X.to_standard()
@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+sys.path.append('..')
+
+import rvpy
+
+class ConjugateUpdaterTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.arms = 100
+        self.arm = rng.integers(0, self.arms, 10**4)
+        self.clicks = (rng.random(self.arm.size) < 0.2).astype(float)
+        self.counts = rng.poisson(3., self.arm.size)
+
+    def test_matches_given(self):
+        updater = rvpy.ConjugateUpdater(rvpy.Beta(1., 2.), rvpy.Bernoulli, arms=self.arms)
+        for start in range(0, self.arm.size, 1000):
+            updater.update(self.clicks[start:start + 1000], self.arm[start:start + 1000])
+        self.assertEqual(updater.events, self.arm.size)
+
+        prior = rvpy.Beta(np.ones(self.arms), np.full(self.arms, 2.))
+        expected = prior.given(rvpy.Bernoulli, self.clicks, groups=self.arm)
+        np.testing.assert_allclose(updater.posterior.alpha, expected.alpha)
+        np.testing.assert_allclose(updater.posterior.beta, expected.beta)
+
+        updater = rvpy.ConjugateUpdater(rvpy.Gamma(2., 0.5), rvpy.Poisson, arms=self.arms)
+        updater.consume(zip(np.split(self.counts, 10), np.split(self.arm, 10)))
+        expected = rvpy.Gamma(np.full(self.arms, 2.), 0.5).given(rvpy.Poisson, self.counts,
+                                                                 groups=self.arm)
+        np.testing.assert_allclose(updater.posterior.alpha, expected.alpha)
+        np.testing.assert_allclose(updater.posterior.beta, expected.beta)
+
+    def test_single_arm(self):
+        x = np.array([0.5, 1.5, 2.])
+        updater = rvpy.ConjugateUpdater(rvpy.Gamma(2., 1.), rvpy.Exponential)
+        updater.update(x[:1]).update(x[1:])
+        self.assertEqual(updater.posterior, rvpy.Gamma(2., 1.).given(rvpy.Exponential, x))
+
+        updater = rvpy.ConjugateUpdater(rvpy.Gamma(2., 1.), rvpy.Normal, mu=1.)
+        updater.update(x)
+        posterior = rvpy.Gamma(2., 1.).given(rvpy.Normal, x, mu=1.)
+        self.assertAlmostEqual(updater.posterior.alpha, posterior.alpha)
+        self.assertAlmostEqual(updater.posterior.beta, posterior.beta)
+
+    def test_known_per_arm(self):
+        updater = rvpy.ConjugateUpdater(rvpy.Beta(2., 3.), rvpy.Binomial, arms=2,
+                                        n=np.array([10, 20]))
+        updater.update([3, 15, 1], [0, 1, 0])
+        np.testing.assert_allclose(updater.posterior.alpha, [6., 17.])
+        np.testing.assert_allclose(updater.posterior.beta, [19., 8.])
+        with self.assertRaises(AssertionError):
+            updater.update([21], [1])
+        # Above the n of its own arm, though not of every arm
+        with self.assertRaises(AssertionError):
+            updater.update([15], [0])
+        np.testing.assert_allclose(updater.posterior.beta, [19., 8.])
+        with self.assertRaises(AssertionError):
+            rvpy.ConjugateUpdater(rvpy.Beta(2., 3.), rvpy.Binomial, arms=3, n=np.array([1, 2]))
+
+    def test_arms_out_of_range(self):
+        updater = rvpy.ConjugateUpdater(rvpy.Gamma(2., 1.), rvpy.Poisson, arms=3)
+        for arms in ([-1], [3], [0.5]):
+            with self.assertRaises(AssertionError):
+                updater.update([2.], arms)
+        self.assertEqual(updater.events, 0)
+        np.testing.assert_array_equal(updater.posterior.alpha, [2., 2., 2.])
+
+    def test_posterior_is_cached(self):
+        updater = rvpy.ConjugateUpdater(rvpy.Beta(1., 1.), rvpy.Bernoulli, arms=self.arms)
+        updater.update(self.clicks, self.arm)
+        posterior = updater.posterior
+        self.assertIs(updater.posterior, posterior)
+        alpha = posterior.alpha.copy()
+        updater.update(self.clicks, self.arm)
+        # Earlier posteriors are unaffected by later updates
+        np.testing.assert_array_equal(posterior.alpha, alpha)
+        self.assertIsNot(updater.posterior, posterior)
+
+    def test_checkpoint_restore(self):
+        updater = rvpy.ConjugateUpdater(rvpy.Beta(1., 1.), rvpy.Binomial, arms=self.arms, n=5)
+        half = self.arm.size // 2
+        updater.update(self.clicks[:half], self.arm[:half])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'state.npz')
+            updater.checkpoint(path)
+            self.assertEqual(os.listdir(tmp), ['state.npz'])
+            restored = rvpy.ConjugateUpdater.restore(path)
+        self.assertEqual(restored.events, half)
+        for u in (updater, restored):
+            u.update(self.clicks[half:], self.arm[half:])
+        np.testing.assert_array_equal(restored.posterior.alpha, updater.posterior.alpha)
+        np.testing.assert_array_equal(restored.posterior.beta, updater.posterior.beta)
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            rvpy.ConjugateUpdater(rvpy.Normal(0., 1.), rvpy.Normal, sigma=1.)
+        with self.assertRaises(TypeError):
+            rvpy.ConjugateUpdater(rvpy.Beta(1., 1.), rvpy.Poisson)
+        with self.assertRaises(AssertionError):
+            rvpy.ConjugateUpdater(rvpy.Gamma(1., 1.), rvpy.Normal)
+        with self.assertRaises(AssertionError):
+            rvpy.ConjugateUpdater(rvpy.Beta(1., 1.), rvpy.Bernoulli, arms=2).update([1.])
@@ -25,6 +25,13 @@ class PoissonTests(unittest.TestCase):
         self.assertAlmostEqual(self.X.pmf(0), np.exp(-self.X.mu))
         self.assertAlmostEqual(self.X.pmf(1), self.X.mu*np.exp(-self.X.mu))
 
+    def test_poi_log_tails(self):
+        # Far tails where cdf and sf underflow, against sums of the pmf in mpmath
+        self.assertAlmostEqual(rvpy.Poisson(3).logsf(300), -1092.9206782089318, places=9)
+        self.assertAlmostEqual(rvpy.Poisson(1000).logcdf(10), -946.01681962963279, places=9)
+        self.assertEqual(rvpy.Poisson(1000).logcdf(-1), -np.inf)
+        self.assertAlmostEqual(self.X.logsf(2), np.log(self.X.sf(2)))
+
     def test_poi_add_sub(self):
         Z = self.X + self.Y
         self.assertIsInstance(Z, rvpy.Poisson)
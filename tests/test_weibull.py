@@ -4,6 +4,8 @@ import random
 from scipy.special import gamma as G
 from math import sqrt, pi
 
+import numpy as np
+
 sys.path.append('..')
 
 import rvpy
@@ -22,6 +24,12 @@ class WeibullTests(unittest.TestCase):
         self.assertEqual(self.Y.mean, self.Y.beta * G(1.5))
         self.assertAlmostEqual(self.Y.var, self.Y.beta**2 * (G(2) - G(1.5)**2))
 
+    def test_weibull_log_tails(self):
+        X = rvpy.Weibull(2, 1)
+        self.assertAlmostEqual(X.logcdf(1e-200), -400*np.log(10))
+        self.assertAlmostEqual(X.logcdf(2), np.log(X.cdf(2)))
+        self.assertEqual(X.logcdf(-1), -np.inf)
+
     def test_weibull_conversion(self):
         Xexp = self.X.to_exponential()
         self.assertIsInstance(Xexp, rvpy.Exponential)